@@ -291,8 +291,9 @@ class BackgroundIndexingService:
         current_time = time.time()
         
         # Get all managed projects first
+        # list_projects already checked existence with one scandir per parent
         all_projects = self.storage_manager.list_projects()
-        managed_project_paths = {p["path"] for p in all_projects if Path(p["path"]).exists()}
+        managed_project_paths = {p["path"] for p in all_projects if p.get("exists", True)}
         
         # Check configured projects (only if they're managed)
         for project_path, config in self.config["projects"].items():
@@ -320,7 +321,7 @@ class BackgroundIndexingService:
             project_path = project_info["path"]
             
             # Skip if already configured or doesn't exist
-            if project_path in self.config["projects"] or not Path(project_path).exists():
+            if project_path not in managed_project_paths or project_path in self.config["projects"]:
                 continue
             
             # Use default interval
@@ -417,7 +418,7 @@ class BackgroundIndexingService:
         
         # Get all managed projects
         all_projects = self.storage_manager.list_projects()
-        managed_projects = {p["path"]: p for p in all_projects if Path(p["path"]).exists()}
+        managed_projects = {p["path"]: p for p in all_projects if p.get("exists", True)}
         
         # Get project-specific status (only for managed projects)
         for project_path, config in self.config["projects"].items():
@@ -93,6 +93,14 @@ class CacheManager:
         ON file_cache(file_hash)
         ''')
         
+        # Usage columns for size-aware eviction, added to older cache databases
+        cursor.execute("PRAGMA table_info(file_cache)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if 'hits' not in columns:
+            cursor.execute("ALTER TABLE file_cache ADD COLUMN hits INTEGER NOT NULL DEFAULT 0")
+        if 'last_access' not in columns:
+            cursor.execute("ALTER TABLE file_cache ADD COLUMN last_access REAL")
+        
         conn.commit()
         conn.close()
     
@@ -254,11 +262,11 @@ class CacheManager:
             
             cursor.execute('''
             INSERT OR REPLACE INTO file_cache 
-            (file_path, file_hash, last_modified, file_size, cached_at, cache_data)
-            VALUES (?, ?, ?, ?, ?, ?)
+            (file_path, file_hash, last_modified, file_size, cached_at, cache_data, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (
                 file_path, file_hash, stat.st_mtime, stat.st_size,
-                cache_entry.cached_at, cache_data
+                cache_entry.cached_at, cache_data, cache_entry.cached_at
             ))
             
             conn.commit()
@@ -267,8 +275,32 @@ class CacheManager:
         except (OSError, sqlite3.Error, json.JSONDecodeError, ValueError):
             pass  # Silent fail for caching
     
-    def clear_cache(self, older_than_days: int = 30):
-        """Clear old cache entries"""
+    def record_hits(self, file_paths: List[str]):
+        """Count a cache hit for each file, in one transaction per index run"""
+        if not file_paths:
+            return
+        
+        now = time.time()
+        try:
+            conn = sqlite3.connect(str(self.cache_db))
+            with conn:
+                conn.executemany(
+                    "UPDATE file_cache SET hits = hits + 1, last_access = ? WHERE file_path = ?",
+                    ((now, file_path) for file_path in file_paths)
+                )
+            conn.close()
+        except sqlite3.Error:
+            pass  # Silent fail for caching
+    
+    def clear_cache(self, older_than_days: int = 30, max_size_mb: Optional[float] = None):
+        """Clear old cache entries, then shrink the cache to max_size_mb if given
+        
+        Entries unused for older_than_days are dropped first. If the cached data
+        is still over budget, eviction walks the least recently used entries a
+        tenth at a time and, within each slice, drops those with the fewest hits
+        per byte first - one large, rarely reused entry goes before many small
+        ones that keep getting hit.
+        """
         cutoff_time = time.time() - (older_than_days * 24 * 3600)
         
         try:
@@ -276,11 +308,14 @@ class CacheManager:
             cursor = conn.cursor()
             
             cursor.execute(
-                "DELETE FROM file_cache WHERE cached_at < ?",
+                "DELETE FROM file_cache WHERE COALESCE(last_access, cached_at) < ?",
                 (cutoff_time,)
             )
             
             deleted_count = cursor.rowcount
+            if max_size_mb is not None:
+                deleted_count += self._evict_to_size(cursor, int(max_size_mb * 1024 * 1024))
+            
             conn.commit()
             conn.close()
             
@@ -289,6 +324,33 @@ class CacheManager:
         except sqlite3.Error:
             pass
     
+    @staticmethod
+    def _evict_to_size(cursor, max_bytes: int) -> int:
+        """Delete entries by recency slice and hits per byte until under max_bytes"""
+        cursor.execute(
+            "SELECT file_path, LENGTH(cache_data), hits FROM file_cache "
+            "ORDER BY COALESCE(last_access, cached_at)"
+        )
+        entries = cursor.fetchall()
+        excess = sum(size for _, size, _ in entries) - max_bytes
+        if excess <= 0:
+            return 0
+        
+        evicted = []
+        slice_size = max(1, len(entries) // 10)
+        for start in range(0, len(entries), slice_size):
+            window = entries[start:start + slice_size]
+            for file_path, size, hits in sorted(window, key=lambda e: (e[2] + 1) / max(e[1], 1)):
+                evicted.append((file_path,))
+                excess -= size
+                if excess <= 0:
+                    break
+            if excess <= 0:
+                break
+        
+        cursor.executemany("DELETE FROM file_cache WHERE file_path = ?", evicted)
+        return len(evicted)
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics including memory cache"""
         disk_stats = {}
@@ -421,4 +483,5 @@ class IncrementalIndexer:
                 except:
                     pass  # Skip failed cache loads
         
+        self.cache.record_hits(cached_files)
         return results
\ No newline at end of file
@@ -4,12 +4,14 @@ Command-line interface for Claude Code Indexer
 """
 
 import os
+import re
 import sys
+from functools import lru_cache
+from importlib import import_module
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, Any
 from datetime import datetime
-from rich.panel import Panel
-from rich.table import Table
 
 # Core imports with fallback
 try:
@@ -18,9 +20,36 @@ except ImportError:
     print("Error: click not installed. Run: pip install click")
     sys.exit(1)
 
-# Version info - always available
-__version__ = "1.24.2"
-__app_name__ = "Claude Code Indexer"
+from .cli_common import (
+    __version__, __app_name__, PAGER_THRESHOLD, Style, console, get_code_graph_indexer,
+    print_rows, print_renderables, print_json, json_option, _progress, show_app_header
+)
+
+# Bytes -> megabytes multiplier for size columns
+_MB = 1.0 / (1024 * 1024)
+
+# Invocations that only print static text skip the background update check
+_NO_UPDATE_CHECK_FLAGS = frozenset({'--help', '-h', '--version'})
+_NO_UPDATE_CHECK_COMMANDS = frozenset({'llm-guide'})
+
+# Source checkout root (the directory holding pyproject.toml in development)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Node dict fields shown by `query`, in column order
+_QUERY_ROW_FIELDS = itemgetter('name', 'node_type', 'importance_score', 'relevance_tags', 'path')
+
+# (header, style) column specs for print_rows() listings
+_QUERY_COLUMNS = (("Name", "bold"), ("Type", "cyan"), ("Importance", "green"),
+                  ("Tags", "yellow"), ("Path", "dim"))
+_SEARCH_COLUMNS = (("Name", "bold"), ("Type", "cyan"), ("Importance", "green"), ("Path", "dim"))
+_PROJECT_COLUMNS = (("Name", "cyan"), ("Path", "green"), ("Last Indexed", "yellow"),
+                    ("Size", "blue"), ("Status", "white"))
+
+# Our CLAUDE.md section: its heading line up to the next unrelated "## " heading
+_CLAUDE_MD_SECTION_RE = re.compile(
+    r'^[ \t]*## Code Indexing with Graph Database[ \t\r]*$.*?(?=^## (?![^\n]*Code Indexing)|\Z)',
+    re.DOTALL | re.MULTILINE
+)
 
 # Import state manager for testing
 try:
@@ -28,34 +57,11 @@ try:
 except ImportError:
     CodebaseStateManager = None
 
-# Import storage manager for testing
-try:
-    from .storage_manager import get_storage_manager
-except ImportError:
-    get_storage_manager = None
-
-# Safe import helper
+# Import helper for module paths only known at runtime (lazy commands/renderables)
 def safe_import(module_path: str, attribute: Optional[str] = None, fallback: Any = None) -> Any:
     """Safely import with fallback support"""
     try:
-        if module_path.startswith('.'):
-            # Relative import - handle different execution contexts
-            package = __package__ or 'claude_code_indexer'
-            
-            # If running as script, ensure the package is properly set up
-            if package == '__main__' or not package:
-                # Try to determine package from file location
-                import os
-                current_file = os.path.abspath(__file__)
-                if 'claude_code_indexer' in current_file:
-                    package = 'claude_code_indexer'
-            
-            from importlib import import_module
-            module = import_module(module_path, package=package)
-        else:
-            # Absolute import
-            __import__(module_path)
-            module = sys.modules[module_path]
+        module = import_module(module_path, package=__package__ or 'claude_code_indexer')
         
         if attribute:
             return getattr(module, attribute, fallback)
@@ -65,91 +71,98 @@ def safe_import(module_path: str, attribute: Optional[str] = None, fallback: Any
     except Exception:
         return fallback
 
-# Import with fallbacks
-Console = safe_import('rich.console', 'Console')
-if Console:
-    console = Console()
-else:
-    # Fallback console
-    class SimpleConsole:
-        def print(self, text, **kwargs):
-            # Strip rich markup
-            text = str(text)
-            for tag in ['[red]', '[/red]', '[green]', '[/green]', '[bold]', '[/bold]', 
-                       '[cyan]', '[/cyan]', '[dim]', '[/dim]', '[yellow]', '[/yellow]']:
-                text = text.replace(tag, '')
-            print(text)
-    console = SimpleConsole()
-
-# Lazy imports
-Table = safe_import('rich.table', 'Table')
-Progress = safe_import('rich.progress', 'Progress')
-Text = safe_import('rich.text', 'Text')
-
-# Local imports with error handling - delay indexer import to avoid circular dependency
-CodeGraphIndexer = None  # Will be imported on demand
-Updater = safe_import('.updater', 'Updater')
-check_and_notify_update = safe_import('.updater', 'check_and_notify_update')
-validate_file_path = safe_import('.security', 'validate_file_path')
-SecurityError = safe_import('.security', 'SecurityError', Exception)
-suggest_github_issue = safe_import('.github_reporter', 'suggest_github_issue')
+# Table/Panel/Progress are imported where used; these used to be module
+# attributes and are now resolved on first access
+_LAZY_RICH = {
+    'Table': 'rich.table',
+    'Panel': 'rich.panel',
+    'Text': 'rich.text',
+    'Progress': 'rich.progress',
+}
+
+
+def __getattr__(name):
+    """Import a rich renderable the first time it is read from this module"""
+    if name in _LAZY_RICH:
+        value = safe_import(_LAZY_RICH[name], name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Pre-built styles for messages that embed user data (project names/paths);
+# printing with style= and markup=False skips Rich's markup parser
+ERROR_STYLE = Style(color="red", bold=True) if Style else None
+SUCCESS_STYLE = Style(color="green", bold=True) if Style else None
+
 # god_mode removed during cleanup
 # god_mode_group = safe_import('.commands.god_mode', 'god_mode_group')
 god_mode_group = None
-migrate_command = safe_import('.cli_migrate', 'migrate')
-install_crash_handler = safe_import('.crash_handler', 'install_crash_handler')
-crash_group = safe_import('.commands.crash', 'crash')
 
 
-def get_code_graph_indexer():
-    """Get CodeGraphIndexer with fallback import"""
-    global CodeGraphIndexer
-    if CodeGraphIndexer is None:
-        try:
-            # Try relative import first
-            from .indexer import CodeGraphIndexer as _CodeGraphIndexer
-            CodeGraphIndexer = _CodeGraphIndexer
-        except (ImportError, ModuleNotFoundError) as e1:
-            try:
-                # Try absolute import as fallback
-                from claude_code_indexer.indexer import CodeGraphIndexer as _CodeGraphIndexer
-                CodeGraphIndexer = _CodeGraphIndexer
-            except (ImportError, ModuleNotFoundError, AttributeError) as e2:
-                # Check if we're in a test environment with mocked modules
-                if 'ensmallen' in sys.modules and sys.modules['ensmallen'] is None:
-                    # This is a known issue in some test environments
-                    # Try to work around it by removing the None entry
-                    del sys.modules['ensmallen']
-                    try:
-                        from claude_code_indexer.indexer import CodeGraphIndexer as _CodeGraphIndexer
-                        CodeGraphIndexer = _CodeGraphIndexer
-                    except (ImportError, ModuleNotFoundError) as e3:
-                        console.print(f"❌ [bold red]Failed to import indexer module:[/bold red]")
-                        console.print(f"  Import error: {e3}")
-                        console.print("This might be a test environment issue.")
-                        sys.exit(1)
-                else:
-                    console.print(f"❌ [bold red]Failed to import indexer module:[/bold red]")
-                    console.print(f"  Relative import error: {e1}")
-                    console.print(f"  Absolute import error: {e2}")
-                    console.print("Try reinstalling: pip install -e .")
-                    # Add more detailed error info
-                    import traceback
-                    console.print("\n[dim]Detailed error trace:[/dim]")
-                    traceback.print_exc()
-                    sys.exit(1)
-    return CodeGraphIndexer
-
-
-def show_app_header():
-    """Display application name and version header"""
-    console.print(f"\n[bold cyan]{__app_name__} v{__version__}[/bold cyan]")
-    console.print("[dim]Multi-language code indexing with graph database[/dim]\n")
-
-
-@click.group()
+class LazyGroup(click.Group):
+    """click.Group whose listed subcommands are imported only when looked up
+    
+    lazy_subcommands maps a command name to "module:attribute", where module
+    is resolved with safe_import(); commands that fail to import are hidden.
+    """
+    
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+    
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_path, attribute = self.lazy_subcommands.pop(cmd_name).split(':')
+            command = safe_import(module_path, attribute)
+            if command is not None:
+                self.add_command(command, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+def _require_database(db_path, project_path: Path):
+    """Return db_path, or exit with a hint to run `cci index` if it is missing"""
+    if not os.path.exists(db_path):
+        console.print(f"❌ [bold red]Database not found for {project_path}. Run 'cci index' first.[/bold red]")
+        sys.exit(1)
+    return db_path
+
+
+def _project_db_path(project_path: Path) -> str:
+    """Centralized database path for a project, without creating anything"""
+    from .storage_manager import get_storage_manager
+    return str(get_storage_manager().get_database_path(project_path, create=False))
+
+
+def _resolve_project(project: Optional[str]) -> Path:
+    """Resolve a --project name/path option, defaulting to the current directory"""
+    from .storage_manager import get_storage_manager
+    storage = get_storage_manager()
+    
+    if not project:
+        return storage.get_project_from_cwd()
+    
+    # Registered project names first, then treat the option as a path
+    project_info = storage.find_project_by_name(project)
+    if project_info:
+        return Path(project_info['path'])
+    return Path(project).resolve()
+
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    'migrate': '.cli_migrate:migrate',
+    'crash': '.commands.crash:crash',
+    'enhance': '.commands.enhance:enhance_metadata',
+    'insights': '.commands.enhance:get_insights',
+    'enhanced': '.commands.enhance:query_enhanced',
+    'critical': '.commands.enhance:get_critical_components',
+})
 @click.version_option(version=__version__, prog_name=__app_name__)
-def cli():
+@click.option('--quiet', is_flag=True, envvar='CCI_QUIET',
+              help='Skip the app header banner, e.g. for scripted or LLM use (env: CCI_QUIET)')
+def cli(quiet):
     """Claude Code Indexer (cci) - Index source code as graph database
     
     💡 Pro tip: Use 'cci' instead of 'claude-code-indexer' for all commands!
@@ -163,6 +176,34 @@ def cli():
     pass
 
 
+def project_db_options(purpose: str):
+    """Add the --db/--project pair shared by commands that read a project's index"""
+    def decorator(f):
+        f = click.option('--project', help=f'Project name/path {purpose} (default: current directory)')(f)
+        return click.option('--db', default=None, help='Database file path (default: centralized storage)')(f)
+    return decorator
+
+
+# Opening rules for a CLAUDE.md created by `init`; the template is appended
+_CLAUDE_MD_HEADER = """# Claude Coding Assistant - Setup Rules
+
+## Core Workflow Rules
+
+1. **SEARCH FIRST**: Always search before adding/deleting anything. Use grep, find, or code indexer.
+2. **First think through the problem**, read the codebase for relevant files, and write a plan.
+3. **Make every task and code change as simple as possible**.
+4. **Prioritize simplicity over complexity**.
+
+"""
+
+
+def _read_claude_md_template() -> str:
+    """Read the bundled CLAUDE.md template (works from wheels and zip installs)"""
+    from importlib.resources import files
+    package = __package__ or 'claude_code_indexer'
+    return files(package).joinpath('templates', 'claude_md_template.md').read_text(encoding='utf-8')
+
+
 @cli.command()
 @click.option('--force', is_flag=True, help='Force overwrite existing files')
 def init(force):
@@ -182,50 +223,34 @@ def init(force):
     show_app_header()
     console.print("🚀 [bold blue]Initializing project...[/bold blue]")
     
-    # Check if CLAUDE.md exists
-    if claude_md_path.exists():
+    # Read existing CLAUDE.md, if any
+    try:
+        existing_content = claude_md_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        existing_content = None
+    
+    if existing_content is not None:
         console.print(f"✓ Found existing CLAUDE.md at {claude_md_path}")
         
-        # Read existing content
-        with open(claude_md_path, 'r', encoding='utf-8') as f:
-            existing_content = f.read()
-        
         # Check if our section already exists
         if "## Code Indexing with Graph Database" in existing_content:
             if not force:
-                console.print("⚠️  Code indexing section already exists in CLAUDE.md")
-                console.print("Use --force to overwrite, or manually remove the section")
+                console.print("⚠️  Code indexing section already exists in CLAUDE.md\n"
+                              "Use --force to overwrite, or manually remove the section")
                 return
             else:
                 console.print("🔄 Updating existing section...")
                 # Remove existing section
-                lines = existing_content.split('\n')
-                new_lines = []
-                skip_section = False
-                
-                for line in lines:
-                    if line.strip() == "## Code Indexing with Graph Database":
-                        skip_section = True
-                        continue
-                    elif skip_section and line.startswith("## ") and "Code Indexing" not in line:
-                        skip_section = False
-                        new_lines.append(line)
-                    elif not skip_section:
-                        new_lines.append(line)
-                
-                existing_content = '\n'.join(new_lines)
+                existing_content = _CLAUDE_MD_SECTION_RE.sub('', existing_content)
         
         # Append our template
-        template_path = Path(__file__).parent / "templates" / "claude_md_template.md"
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
+        template_content = _read_claude_md_template()
         
         # Combine content
         updated_content = existing_content.rstrip() + '\n\n' + template_content
         
         # Write back
-        with open(claude_md_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        claude_md_path.write_text(updated_content, encoding='utf-8')
         
         console.print("✓ Updated CLAUDE.md with code indexing instructions")
     
@@ -235,25 +260,9 @@ def init(force):
         
         if create_new:
             # Create new CLAUDE.md with basic structure
-            template_path = Path(__file__).parent / "templates" / "claude_md_template.md"
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
+            full_content = _CLAUDE_MD_HEADER + _read_claude_md_template()
             
-            basic_header = """# Claude Coding Assistant - Setup Rules
-
-## Core Workflow Rules
-
-1. **SEARCH FIRST**: Always search before adding/deleting anything. Use grep, find, or code indexer.
-2. **First think through the problem**, read the codebase for relevant files, and write a plan.
-3. **Make every task and code change as simple as possible**.
-4. **Prioritize simplicity over complexity**.
-
-"""
-            
-            full_content = basic_header + template_content
-            
-            with open(claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+            claude_md_path.write_text(full_content, encoding='utf-8')
             
             console.print(f"✓ Created new CLAUDE.md at {claude_md_path}")
         else:
@@ -273,28 +282,32 @@ def init(force):
     gitignore_path = cwd / ".gitignore"
     gitignore_entry = "code_index.db"
     
-    if gitignore_path.exists():
-        with open(gitignore_path, 'r', encoding='utf-8') as f:
-            gitignore_content = f.read()
-        
-        if gitignore_entry not in gitignore_content:
-            with open(gitignore_path, 'a', encoding='utf-8') as f:
-                f.write(f"\n# Claude Code Indexer\n{gitignore_entry}\n")
-            console.print("✓ Added code_index.db to .gitignore")
-    else:
-        with open(gitignore_path, 'w', encoding='utf-8') as f:
+    # Nothing below can fail or prompt, so collect the closing lines and print once
+    messages = []
+    
+    # 'a+' creates the file if needed and appends, so one open covers both cases
+    with open(gitignore_path, 'a+', encoding='utf-8') as f:
+        if f.tell() == 0:
             f.write(f"# Claude Code Indexer\n{gitignore_entry}\n")
-        console.print("✓ Created .gitignore with code_index.db")
+            messages.append("✓ Created .gitignore with code_index.db")
+        else:
+            f.seek(0)
+            if gitignore_entry not in f.read():
+                f.write(f"\n# Claude Code Indexer\n{gitignore_entry}\n")
+                messages.append("✓ Added code_index.db to .gitignore")
     
-    console.print("\n🎉 [bold green]Initialization complete![/bold green]")
-    console.print("Next steps:")
-    console.print("1. Run [bold]cci index .[/bold] to index current directory")
-    console.print("2. Run [bold]cci query --important[/bold] to see key components")
-    console.print("3. Run [bold]cci stats[/bold] to view indexing statistics")
+    messages.extend([
+        "\n🎉 [bold green]Initialization complete![/bold green]",
+        "Next steps:",
+        "1. Run [bold]cci index .[/bold] to index current directory",
+        "2. Run [bold]cci query --important[/bold] to see key components",
+        "3. Run [bold]cci stats[/bold] to view indexing statistics",
+    ])
+    console.print("\n".join(messages))
 
 
 @cli.command()
-@click.argument('path', type=click.Path(exists=True))
+@click.argument('path', type=click.Path())
 @click.option('--patterns', default=None, 
               help='File patterns to index (comma-separated) [default: auto-detect from supported languages]')
 @click.option('--db', default=None, help='Database file path (default: centralized storage)')
@@ -321,12 +334,17 @@ def index(path, patterns, db, no_cache, force, workers, no_optimize, benchmark,
     
     🐛 Report issues: https://github.com/tuannx/claude-prompts/issues
     """
-    # Validate path for security
+    from .security import validate_file_path, SecurityError
+    
+    # Validate path for security; validate_file_path() already resolves it,
+    # so the existence check below is the only extra stat
     try:
         safe_path = validate_file_path(path)
     except SecurityError as e:
         console.print(f"❌ [red]Security error: {e}[/red]")
         sys.exit(1)
+    if not os.path.exists(safe_path):
+        raise click.BadParameter(f"Path '{path}' does not exist.", param_hint="'PATH'")
     
     show_app_header()
     
@@ -373,13 +391,12 @@ def index(path, patterns, db, no_cache, force, workers, no_optimize, benchmark,
         ignore_handler = IgnoreHandler(path, list(custom_ignore) if custom_ignore else None)
         console.print("\n📝 [bold blue]Active Ignore Patterns:[/bold blue]")
         patterns = ignore_handler.get_patterns()
-        console.print(f"Total patterns: {len(patterns)}")
-        console.print("\nTop patterns:")
-        for pattern in patterns[:20]:
-            console.print(f"  • {pattern}")
+        lines = [f"Total patterns: {len(patterns)}", "\nTop patterns:"]
+        lines.extend(f"  • {pattern}" for pattern in patterns[:20])
         if len(patterns) > 20:
-            console.print(f"  ... and {len(patterns) - 20} more")
-        console.print()
+            lines.append(f"  ... and {len(patterns) - 20} more")
+        # Globs such as *.py[cod] must not be read as Rich markup
+        console.print("\n".join(lines) + "\n", markup=False)
     
     # Run benchmark if requested
     if benchmark:
@@ -388,8 +405,7 @@ def index(path, patterns, db, no_cache, force, workers, no_optimize, benchmark,
         DatabaseBenchmark.benchmark_insert_performance(db + "_benchmark")
     
     # Create indexer with performance options
-    project_path = Path(safe_path).resolve()
-    _CodeGraphIndexer = get_code_graph_indexer()
+    project_path = Path(safe_path)
     indexer = _CodeGraphIndexer(
         db_path=db,  # Can be None to use centralized storage
         use_cache=not no_cache,
@@ -399,7 +415,7 @@ def index(path, patterns, db, no_cache, force, workers, no_optimize, benchmark,
     )
     
     # Index with progress
-    with Progress() as progress:
+    with _progress() as progress:
         task = progress.add_task("Indexing files...", total=None)
         
         try:
@@ -423,6 +439,7 @@ def index(path, patterns, db, no_cache, force, workers, no_optimize, benchmark,
                 import traceback
                 traceback.print_exc()
             # Suggest GitHub issue reporting
+            from .github_reporter import suggest_github_issue
             suggest_github_issue(
                 error_type=type(e).__name__,
                 error_message=str(e),
@@ -438,11 +455,11 @@ def index(path, patterns, db, no_cache, force, workers, no_optimize, benchmark,
 @click.option('--important', is_flag=True, help='Show only important nodes')
 @click.option('--type', help='Filter by node type (file, class, method, function)')
 @click.option('--limit', default=20, help='Maximum number of results')
-@click.option('--db', default=None, help='Database file path (default: centralized storage)')
-@click.option('--project', help='Project name/path to query (default: current directory)')
+@project_db_options('to query')
 @click.option('--with-state', is_flag=True, help='Include state information in query')
 @click.option('--task-id', help='Show code related to specific task')
-def query(important, type, limit, db, project, with_state, task_id):
+@click.option('--plain', is_flag=True, help='Print tab-separated rows instead of a table')
+def query(important, type, limit, db, project, with_state, task_id, plain):
     """Query indexed code entities
     
     🎯 Perfect for LLMs to understand codebase structure!
@@ -470,6 +487,7 @@ def query(important, type, limit, db, project, with_state, task_id):
                 console.print(f"[red]❌ Task {task_id} not found[/red]")
                 sys.exit(1)
             
+            from rich.panel import Panel
             console.print(Panel.fit(
                 f"[cyan]📋 Task: {task['description']}[/cyan]\n"
                 f"Status: {task['status']}\n"
@@ -488,30 +506,14 @@ def query(important, type, limit, db, project, with_state, task_id):
         except Exception as e:
             console.print(f"[yellow]Warning: Could not load task info: {e}[/yellow]")
     
-    # Determine project path
-    from .storage_manager import get_storage_manager
-    storage = get_storage_manager()
-    
-    if project:
-        # Find project by name or path
-        project_info = storage.find_project_by_name(project)
-        if project_info:
-            project_path = Path(project_info['path'])
-        else:
-            project_path = Path(project).resolve()
-    else:
-        project_path = storage.get_project_from_cwd()
+    project_path = _resolve_project(project)
+    # Check before creating the indexer - it would create an empty database
+    _require_database(db or _project_db_path(project_path), project_path)
     
     # Create indexer with project path
     _CodeGraphIndexer = get_code_graph_indexer()
     indexer = _CodeGraphIndexer(db_path=db, project_path=project_path)
     
-    # Check if database exists
-    actual_db_path = db or indexer.db_path
-    if not os.path.exists(actual_db_path):
-        console.print(f"❌ [bold red]Database not found for {project_path}. Run 'cci index' first.[/bold red]")
-        sys.exit(1)
-    
     if important:
         console.print("🔍 [bold blue]Most important code entities:[/bold blue]")
         # First try with high importance threshold
@@ -534,26 +536,15 @@ def query(important, type, limit, db, project, with_state, task_id):
             console.print("❌ No entities found.")
         return
     
-    # Create table
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Name", style="bold")
-    table.add_column("Type", style="cyan")
-    table.add_column("Importance", style="green")
-    table.add_column("Tags", style="yellow")
-    table.add_column("Path", style="dim")
-    
-    for node in nodes:
-        importance = f"{node['importance_score']:.3f}"
-        tags = ", ".join(node['relevance_tags']) if node['relevance_tags'] else "-"
-        table.add_row(
-            node['name'],
-            node['node_type'],
-            importance,
-            tags,
-            node['path']
-        )
-    
-    console.print(table)
+    print_rows(
+        _QUERY_COLUMNS,
+        (
+            (name, node_type, f"{score:.3f}", ", ".join(tags) if tags else "-", path)
+            for name, node_type, score, tags, path in map(_QUERY_ROW_FIELDS, nodes)
+        ),
+        plain=plain,
+        show_header=True, header_style="bold magenta"
+    )
     
     # Show state information if requested
     if with_state:
@@ -579,17 +570,63 @@ def query(important, type, limit, db, project, with_state, task_id):
             console.print(f"[yellow]Warning: Could not load state info: {e}[/yellow]")
 
 
+def _build_fts_search_query(terms, mode, node_type, limit):
+    """Build a code_nodes_fts MATCH query; each term is a quoted prefix"""
+    match_expr = (' AND ' if mode == 'all' else ' OR ').join(
+        '"{}"*'.format(term.replace('"', '""')) for term in terms
+    )
+    query = '''
+    SELECT c.name, c.node_type, c.path, c.importance_score, c.relevance_tags
+    FROM code_nodes_fts f JOIN code_nodes c ON c.id = f.rowid
+    WHERE code_nodes_fts MATCH ? AND (? IS NULL OR c.node_type = ?)
+    ORDER BY c.importance_score DESC
+    LIMIT ?
+    '''
+    return query, [match_expr, node_type, node_type, limit]
+
+
+# One term matched against name/path/summary; repeated per search term
+_LIKE_TERM_CONDITION = "(name LIKE ? OR path LIKE ? OR summary LIKE ?)"
+
+
+@lru_cache(maxsize=None)
+def _like_search_sql(term_count, mode):
+    """LIKE scan SQL for a term count and mode; the type filter is always bound"""
+    where_clause = (" AND " if mode == 'all' else " OR ").join([_LIKE_TERM_CONDITION] * term_count)
+    return f'''
+    SELECT name, node_type, path, importance_score, relevance_tags
+    FROM code_nodes
+    WHERE ({where_clause}) AND (? IS NULL OR node_type = ?)
+    ORDER BY importance_score DESC
+    LIMIT ?
+    '''
+
+
+def _build_like_search_query(terms, mode, node_type, limit):
+    """Build the LIKE scan over name/path/summary used when FTS5 is unavailable"""
+    params = [pattern for term in terms for pattern in (f'%{term}%',) * 3]
+    params.extend((node_type, node_type, limit))
+    return _like_search_sql(len(terms), mode), params
+
+
 @cli.command()
 @click.argument('terms', nargs=-1, required=True)
-@click.option('--db', default=None, help='Database file path (default: centralized storage)')
+@project_db_options('to search')
 @click.option('--mode', type=click.Choice(['any', 'all']), default='any', help='Search mode: any (OR) or all (AND)')
 @click.option('--limit', default=20, help='Maximum number of results')
 @click.option('--type', type=click.Choice(['file', 'class', 'method', 'function', 'import', 'interface']), 
               help='Filter by node type')
-@click.option('--project', help='Project name/path to search (default: current directory)')
-def search(terms, db, mode, limit, type, project):
+@click.option('--plain', is_flag=True, help='Print tab-separated rows instead of a table')
+def search(terms, db, mode, limit, type, project, plain):
     """Search for code entities by name. Supports multiple keywords.
     
+    Terms match words or word prefixes in names, paths and summaries, with
+    English word forms folded together: 'auth' finds 'auth_user' and
+    'authenticate', but 'User' does not find 'getUserName'. Only when no word
+    matches does search fall back to substring matching, which also looks
+    inside identifiers. Databases without the full-text index (added in
+    1.16.0) always use substring matching.
+    
     Examples:
         cci search auth
         cci search auth user login --mode any
@@ -599,70 +636,31 @@ def search(terms, db, mode, limit, type, project):
     """
     show_app_header()
     
-    # Determine project path
-    from .storage_manager import get_storage_manager
-    storage = get_storage_manager()
-    
-    if project:
-        # Find project by name or path
-        project_info = storage.find_project_by_name(project)
-        if project_info:
-            project_path = Path(project_info['path'])
-        else:
-            project_path = Path(project).resolve()
-    else:
-        project_path = storage.get_project_from_cwd()
-    
-    # Create indexer with project path
-    _CodeGraphIndexer = get_code_graph_indexer()
-    indexer = _CodeGraphIndexer(db_path=db, project_path=project_path)
-    
-    # Check if database exists
-    actual_db_path = db or indexer.db_path
-    if not os.path.exists(actual_db_path):
-        console.print(f"❌ [bold red]Database not found for {project_path}. Run 'cci index' first.[/bold red]")
-        sys.exit(1)
+    project_path = _resolve_project(project)
+    actual_db_path = _require_database(db or _project_db_path(project_path), project_path)
     
     import sqlite3
-    conn = sqlite3.connect(actual_db_path)
+    # Read-only: no writer lock, so searching never contends with a running index
+    db_uri = Path(actual_db_path).resolve().as_uri() + '?mode=ro'
+    conn = sqlite3.connect(db_uri, uri=True)
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
     cursor = conn.cursor()
     
-    # Build query based on mode
-    if mode == 'any':
-        # OR logic - match any keyword
-        conditions = []
-        params = []
-        for term in terms:
-            conditions.append("(name LIKE ? OR path LIKE ? OR summary LIKE ?)")
-            params.extend([f'%{term}%', f'%{term}%', f'%{term}%'])
-        where_clause = " OR ".join(conditions)
-    else:
-        # AND logic - must match all keywords
-        conditions = []
-        params = []
-        for term in terms:
-            conditions.append("(name LIKE ? OR path LIKE ? OR summary LIKE ?)")
-            params.extend([f'%{term}%', f'%{term}%', f'%{term}%'])
-        where_clause = " AND ".join(conditions)
-    
-    # Add type filter if specified
-    where_conditions = [f"({where_clause})"]
-    if type:
-        where_conditions.append("node_type = ?")
-        params.append(type)
-    
-    final_where_clause = " AND ".join(where_conditions)
-    
-    query = f'''
-    SELECT name, node_type, path, importance_score, relevance_tags
-    FROM code_nodes
-    WHERE {final_where_clause}
-    ORDER BY importance_score DESC
-    LIMIT {limit}
-    '''
-    
-    cursor.execute(query, params)
-    results = cursor.fetchall()
+    # Prefer the FTS5 index maintained by migration 1.16.0 (word-prefix matches,
+    # porter-stemmed); the LIKE substring scan covers databases without it and
+    # searches where no word matches (e.g. a fragment of a camelCase name)
+    results = None
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='code_nodes_fts'")
+    if cursor.fetchone():
+        try:
+            cursor.execute(*_build_fts_search_query(terms, mode, type, limit))
+            results = cursor.fetchall()
+        except sqlite3.OperationalError:
+            results = None
+    if not results:
+        cursor.execute(*_build_like_search_query(terms, mode, type, limit))
+        results = cursor.fetchall()
     conn.close()
     
     search_desc = ' '.join(terms)
@@ -676,28 +674,19 @@ def search(terms, db, mode, limit, type, project):
     
     console.print(f"🔍 [bold blue]Search results for '{search_desc}' ({filter_desc}):[/bold blue]")
     
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Name", style="bold")
-    table.add_column("Type", style="cyan")
-    table.add_column("Importance", style="green")
-    table.add_column("Path", style="dim")
-    
-    for name, node_type, path, importance, tags in results:
-        table.add_row(
-            name,
-            node_type,
-            f"{importance:.3f}",
-            path
-        )
-    
-    console.print(table)
+    print_rows(
+        _SEARCH_COLUMNS,
+        ((row[0], row[1], f"{row[3]:.3f}", row[2]) for row in results),
+        plain=plain,
+        show_header=True, header_style="bold magenta"
+    )
 
 
 @cli.command()
-@click.option('--db', default=None, help='Database file path (default: centralized storage)')
+@project_db_options('for stats')
 @click.option('--cache', is_flag=True, help='Show cache statistics')
-@click.option('--project', help='Project name/path for stats (default: current directory)')
-def stats(db, cache, project):
+@json_option
+def stats(db, cache, project, as_json):
     """Show indexing statistics
     
     📊 Quick overview for LLMs:
@@ -708,43 +697,36 @@ def stats(db, cache, project):
     
     🐛 Report issues: https://github.com/tuannx/claude-prompts/issues
     """
-    show_app_header()
+    if not as_json:
+        show_app_header()
     
-    # Determine project path
-    from .storage_manager import get_storage_manager
-    storage = get_storage_manager()
-    
-    if project:
-        # Find project by name or path
-        project_info = storage.find_project_by_name(project)
-        if project_info:
-            project_path = Path(project_info['path'])
-        else:
-            project_path = Path(project).resolve()
-    else:
-        project_path = storage.get_project_from_cwd()
+    project_path = _resolve_project(project)
+    # Check before creating the indexer - it would create an empty database
+    _require_database(db or _project_db_path(project_path), project_path)
     
     # Create indexer with project path
     _CodeGraphIndexer = get_code_graph_indexer()
     indexer = _CodeGraphIndexer(db_path=db, project_path=project_path)
     
-    # Check if database exists
-    actual_db_path = db or indexer.db_path
-    if not os.path.exists(actual_db_path):
-        console.print(f"❌ [bold red]Database not found for {project_path}. Run 'cci index' first.[/bold red]")
-        sys.exit(1)
+    if as_json:
+        stats = indexer.get_stats()
+        if cache:
+            stats['cache'] = indexer.cache_manager.get_cache_stats()
+        print_json(stats)
+        return
     
-    # Show cache stats if requested
+    # Show cache stats if requested - reuse the indexer's cache manager
+    # rather than opening the project's cache database a second time
     if cache:
-        from .cache_manager import CacheManager
-        cache_manager = CacheManager(project_path=project_path)
-        cache_manager.print_cache_stats()
-        console.print()  # Add spacing
+        indexer.cache_manager.print_cache_stats()
     stats = indexer.get_stats()
     
-    console.print("📊 [bold blue]Code Indexing Statistics[/bold blue]")
+    # Collect every section and render them in one print call
+    title = "📊 [bold blue]Code Indexing Statistics[/bold blue]"
+    renderables = ["\n" + title if cache else title]  # Add spacing after cache stats
     
     # Basic stats
+    from rich.table import Table
     info_table = Table(show_header=False, box=None)
     info_table.add_column("Metric", style="cyan")
     info_table.add_column("Value", style="bold green")
@@ -753,37 +735,40 @@ def stats(db, cache, project):
     info_table.add_row("Total nodes", stats.get('total_nodes', '0'))
     info_table.add_row("Total edges", stats.get('total_edges', '0'))
     
-    console.print(info_table)
+    renderables.append(info_table)
     
     # Node types
     if 'node_types' in stats:
-        console.print("\n📋 [bold blue]Node Types:[/bold blue]")
-        type_table = Table(show_header=True, header_style="bold magenta")
-        type_table.add_column("Type", style="cyan")
-        type_table.add_column("Count", style="bold green")
-        
-        for node_type, count in stats['node_types'].items():
-            type_table.add_row(node_type, str(count))
-        
-        console.print(type_table)
+        renderables.append("\n📋 [bold blue]Node Types:[/bold blue]")
+        renderables.append(_count_table(stats['node_types']))
     
     # Relationship types
     if 'relationship_types' in stats:
-        console.print("\n🔗 [bold blue]Relationship Types:[/bold blue]")
-        rel_table = Table(show_header=True, header_style="bold magenta")
-        rel_table.add_column("Type", style="cyan")
-        rel_table.add_column("Count", style="bold green")
-        
-        for rel_type, count in stats['relationship_types'].items():
-            rel_table.add_row(rel_type, str(count))
-        
-        console.print(rel_table)
+        renderables.append("\n🔗 [bold blue]Relationship Types:[/bold blue]")
+        renderables.append(_count_table(stats['relationship_types']))
+    
+    print_renderables(renderables)
+
+
+def _count_table(counts):
+    """Build a Type/Count table from a {type: count} mapping"""
+    from rich.table import Table
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Type", style="cyan")
+    table.add_column("Count", style="bold green")
+    
+    for name, count in counts.items():
+        table.add_row(name, str(count))
+    
+    return table
 
 
 @cli.command()
 @click.option('--clear', is_flag=True, help='Clear old cache entries (older than 30 days)')
 @click.option('--days', type=int, default=30, help='Days threshold for clearing cache')
-def cache(clear, days):
+@click.option('--max-size', type=click.FloatRange(min=0), default=None,
+              help='After clearing, evict rarely used entries until the cache fits in this many MB')
+def cache(clear, days, max_size):
     """Manage indexing cache for faster re-indexing"""
     from .cache_manager import CacheManager
     
@@ -791,7 +776,7 @@ def cache(clear, days):
     
     if clear:
         console.print(f"🗑️ [yellow]Clearing cache entries older than {days} days...[/yellow]")
-        cache_manager.clear_cache(older_than_days=days)
+        cache_manager.clear_cache(older_than_days=days, max_size_mb=max_size)
         console.print("✅ [green]Cache cleared successfully![/green]")
     
     console.print("💾 [bold blue]Cache Statistics[/bold blue]")
@@ -812,6 +797,7 @@ def benchmark(records):
     
     console.print(f"\n📊 [bold blue]Benchmark Results:[/bold blue]")
     
+    from rich.table import Table
     benchmark_table = Table(show_header=True, header_style="bold magenta")
     benchmark_table.add_column("Database Type", style="cyan")
     benchmark_table.add_column("Time (seconds)", style="bold green")
@@ -830,6 +816,7 @@ def benchmark(records):
 @click.option('--check-only', is_flag=True, help='Only check for updates without installing')
 def update(check_only):
     """Check for and install updates"""
+    from .updater import Updater
     updater = Updater()
     
     if check_only:
@@ -881,26 +868,38 @@ def restart():
     console.print("✅ [green]Background indexing service restarted[/green]")
 
 
+def _ellipsize(text: str, width: int = 16) -> str:
+    """Cut text to width characters, marking the cut with an ellipsis"""
+    return text if len(text) <= width else f"{text[:width]}…"
+
+
 @background.command()
-def status():
+@json_option
+def status(as_json):
     """Show background indexing service status"""
-    show_app_header()
-    
     from .background_service import get_background_service
     
     service = get_background_service()
     status = service.get_status()
     
-    console.print("\n📊 [bold blue]Background Indexing Service Status[/bold blue]\n")
+    if as_json:
+        print_json(status)
+        return
+    
+    show_app_header()
     
-    # General status
-    console.print(f"Enabled: {'✅ Yes' if status['enabled'] else '❌ No'}")
-    console.print(f"Running: {'✅ Yes' if status['running'] else '❌ No'}")
-    console.print(f"Default interval: {status['default_interval']}s ({status['default_interval'] / 60:.1f} minutes)")
+    # General status; every section is rendered in one print call
+    renderables = [
+        "\n📊 [bold blue]Background Indexing Service Status[/bold blue]\n\n"
+        f"Enabled: {'✅ Yes' if status['enabled'] else '❌ No'}\n"
+        f"Running: {'✅ Yes' if status['running'] else '❌ No'}\n"
+        f"Default interval: {status['default_interval']}s ({status['default_interval'] / 60:.1f} minutes)"
+    ]
     
     if status['projects']:
-        console.print("\n📁 [bold blue]Project Status:[/bold blue]")
+        renderables.append("\n📁 [bold blue]Project Status:[/bold blue]")
         
+        from rich.table import Table
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Project", style="cyan")
         table.add_column("Interval", style="green")
@@ -918,14 +917,16 @@ def status():
             table.add_row(
                 project_display,
                 interval_str,
-                project_status['last_indexed'][:16] + "…" if len(project_status['last_indexed']) > 16 else project_status['last_indexed'],
-                project_status['next_index'][:16] + "…" if len(project_status['next_index']) > 16 else project_status['next_index'],
+                _ellipsize(project_status['last_indexed']),
+                _ellipsize(project_status['next_index']),
                 status_str
             )
         
-        console.print(table)
+        renderables.append(table)
     else:
-        console.print("\n[dim]No projects configured for background indexing[/dim]")
+        renderables.append("\n[dim]No projects configured for background indexing[/dim]")
+    
+    print_renderables(renderables)
 
 
 @background.command()
@@ -945,7 +946,7 @@ def config(enable):
 
 
 @background.command()
-@click.option('--project', help='Project path (default: current directory)')
+@click.option('--project', type=click.Path(path_type=Path), help='Project path (default: current directory)')
 @click.option('--interval', type=int, default=300, help='Interval in seconds (default: 300, -1 to disable)')
 def set_interval(project, interval):
     """Set background indexing interval for a project"""
@@ -956,7 +957,7 @@ def set_interval(project, interval):
     
     if project:
         # Set for specific project
-        project_path = Path(project).resolve()
+        project_path = project.resolve()
         if not project_path.exists():
             console.print(f"❌ [red]Project path does not exist: {project}[/red]")
             return
@@ -974,6 +975,7 @@ def set_interval(project, interval):
 @cli.command()
 def sync():
     """Sync CLAUDE.md with latest template"""
+    from .updater import Updater
     updater = Updater()
     if updater.sync_claude_md(force=True):
         console.print("✅ [bold green]CLAUDE.md synchronized![/bold green]")
@@ -1009,55 +1011,81 @@ def mcp_status():
     show_mcp_status()
 
 
+def _format_last_indexed(last_indexed: Optional[str]) -> Optional[str]:
+    """Format an ISO timestamp as 'YYYY-MM-DD HH:MM' without parsing it"""
+    if not last_indexed or last_indexed == 'Never':
+        return last_indexed
+    if len(last_indexed) >= 16 and last_indexed[10] in 'T ':
+        # ISO timestamps are already 'YYYY-MM-DDTHH:MM:SS...' - just slice
+        return f"{last_indexed[:10]} {last_indexed[11:16]}"
+    return _parse_last_indexed(last_indexed)
+
+
+@lru_cache(maxsize=512)
+def _parse_last_indexed(last_indexed: str) -> str:
+    """Slow path for timestamps that are not in plain ISO layout"""
+    try:
+        return datetime.fromisoformat(last_indexed).strftime('%Y-%m-%d %H:%M')
+    except ValueError:
+        return last_indexed
+
+
 @cli.command()
 @click.option('--all', is_flag=True, help='Show all projects including non-existent')
-def projects(all):
+@json_option
+def projects(all, as_json):
     """List all indexed projects"""
     from .storage_manager import get_storage_manager
     storage = get_storage_manager()
     
-    projects = storage.list_projects()
+    projects = storage.list_projects(with_sizes=not as_json)
+    
+    if as_json:
+        print_json([project for project in projects if all or project.get('exists', True)])
+        return
     
     if not projects:
-        console.print("📭 [yellow]No indexed projects found.[/yellow]")
-        console.print("Run 'cci index <path>' to index a project.")
+        console.print("📭 [yellow]No indexed projects found.[/yellow]\n"
+                      "Run 'cci index <path>' to index a project.")
         return
     
     console.print("📚 [bold blue]Indexed Projects[/bold blue]")
     
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Name", style="cyan")
-    table.add_column("Path", style="green")
-    table.add_column("Last Indexed", style="yellow")
-    table.add_column("Size", style="blue")
-    table.add_column("Status", style="white")
-    
-    for project in projects:
-        if not all and not project.get('exists', True):
-            continue
+    # Accumulate storage totals while rows are generated so get_storage_stats()
+    # doesn't have to walk the registered projects' directories again
+    totals = {'total_size': 0}
+    
+    def project_rows():
+        for project in projects:
+            totals['total_size'] += project.get('total_size', project.get('db_size', 0))
+            if not all and not project.get('exists', True):
+                continue
             
-        name = project['name']
-        path = project['path']
-        last_indexed = project.get('last_indexed', 'Never')
-        if last_indexed and last_indexed != 'Never':
-            # Format date nicely
-            dt = datetime.fromisoformat(last_indexed)
-            last_indexed = dt.strftime('%Y-%m-%d %H:%M')
-        
-        size = project.get('db_size', 0)
-        size_str = f"{size / 1024 / 1024:.1f} MB" if size > 0 else "-"
-        
-        status = "✓" if project.get('exists', True) else "✗ Missing"
-        
-        table.add_row(name, path, last_indexed, size_str, status)
+            name = project['name']
+            path = project['path']
+            last_indexed = _format_last_indexed(project.get('last_indexed', 'Never'))
+            
+            size = project.get('db_size', 0)
+            size_str = f"{size * _MB:.1f} MB" if size > 0 else "-"
+            
+            status = "✓" if project.get('exists', True) else "✗ Missing"
+            
+            yield (name, path, last_indexed, size_str, status)
     
-    console.print(table)
+    print_rows(
+        _PROJECT_COLUMNS,
+        project_rows(),
+        pager=len(projects) > PAGER_THRESHOLD,
+        show_header=True, header_style="bold magenta"
+    )
     
     # Show storage stats
-    stats = storage.get_storage_stats()
-    console.print(f"\n💾 Storage: {stats['app_home']}")
-    console.print(f"   Total projects: {stats['project_count']}")
-    console.print(f"   Total size: {stats['total_size_mb']:.1f} MB")
+    stats = storage.get_storage_stats(precomputed=totals)
+    console.print(
+        f"\n💾 Storage: {stats['app_home']}\n"
+        f"   Total projects: {stats['project_count']}\n"
+        f"   Total size: {stats['total_size_mb']:.1f} MB"
+    )
 
 
 @cli.command()
@@ -1068,33 +1096,26 @@ def remove(project, force):
     from .storage_manager import get_storage_manager
     storage = get_storage_manager()
     
-    # Find project
-    project_info = storage.find_project_by_name(project)
+    # Find project by name or path in one lookup
+    project_info = storage.find_project(project)
     if not project_info:
-        # Try as path
-        project_path = Path(project).resolve()
-        if storage.get_project_id(project_path) in storage.metadata['projects']:
-            project_info = {
-                'path': str(project_path),
-                'name': project_path.name
-            }
-        else:
-            console.print(f"❌ [bold red]Project '{project}' not found.[/bold red]")
-            return
+        console.print(f"❌ Project '{project}' not found.", style=ERROR_STYLE, markup=False)
+        return
     
     # Confirm
     if not force:
         confirm = click.confirm(f"Remove index for '{project_info['name']}' ({project_info['path']})?")
         if not confirm:
-            console.print("❌ Removal cancelled.")
+            click.echo("❌ Removal cancelled.")
             return
     
     # Remove
-    removed = storage.remove_project(Path(project_info['path']))
+    # find_project() already resolved the path; its ID skips re-resolving it
+    removed = storage.remove_project(project_info['path'], project_id=project_info.get('id'))
     if removed:
-        console.print(f"✅ [bold green]Removed index for '{project_info['name']}'[/bold green]")
+        console.print(f"✅ Removed index for '{project_info['name']}'", style=SUCCESS_STYLE, markup=False)
     else:
-        console.print(f"❌ [bold red]Failed to remove project.[/bold red]")
+        console.print("❌ Failed to remove project.", style=ERROR_STYLE, markup=False)
 
 
 @cli.command()
@@ -1115,363 +1136,13 @@ def clean():
         console.print("✨ [green]No orphaned projects found.[/green]")
 
 
-# LLM Metadata Enhancement Commands
-
-@cli.command(name='enhance')
-@click.argument('path', type=click.Path(exists=True), default='.')
-@click.option('--limit', type=int, help='Limit number of nodes to analyze')
-@click.option('--force', is_flag=True, help='Force re-analysis even if cached')
-@click.option('--project', help='Project name/path (default: current directory)')
-def enhance_metadata(path, limit, force, project):
-    """Enhance codebase metadata using LLM analysis
-    
-    🤖 LLM Enhancement - Powerful AI-driven code analysis
-    
-    ⚠️  SECURITY WARNING:
-    - Do NOT use on code containing secrets, API keys, or sensitive data
-    - Recommended for open source or development code only
-    - Start with --limit 5-10 to test before full analysis
-    
-    📊 Features:
-    - Architectural layer detection (service, model, controller, etc.)
-    - Business domain classification
-    - Complexity scoring (0.0-1.0)
-    - Criticality assessment
-    - Role tagging and pattern detection
-    
-    💡 Best Practices:
-    1. Test with: cci enhance . --limit 5
-    2. Review results before scaling up
-    3. Use insights command to query enhanced data
-    
-    🐛 Report issues: https://github.com/tuannx/claude-prompts/issues
-    """
-    show_app_header()
-    
-    try:
-        path = validate_file_path(path)
-    except SecurityError as e:
-        console.print(f"❌ [bold red]Security error: {e}[/bold red]")
-        sys.exit(1)
-    
-    console.print(f"🤖 [bold blue]Starting LLM metadata enhancement for: {path}[/bold blue]")
-    
-    try:
-        _CodeGraphIndexer = get_code_graph_indexer()
-        indexer = _CodeGraphIndexer(project_path=Path(path))
-        
-        with Progress() as progress:
-            task = progress.add_task("Analyzing codebase...", total=None)
-            result = indexer.enhance_metadata(limit=limit, force_refresh=force)
-            progress.update(task, completed=100, total=100)
-        
-        # Display results
-        console.print("\n📊 [bold green]Enhancement Complete![/bold green]")
-        
-        analyzed = result.get('analyzed_count', 0)
-        total = result.get('total_nodes', 0)
-        duration = result.get('analysis_duration', 'N/A')
-        speed = result.get('nodes_per_second', 'N/A')
-        
-        table = Table(title="Analysis Summary")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="green")
-        
-        table.add_row("Analyzed Nodes", str(analyzed))
-        table.add_row("Total Nodes", str(total))
-        table.add_row("Duration", duration)
-        table.add_row("Speed", f"{speed} nodes/sec")
-        
-        console.print(table)
-        
-        # Show architectural layers
-        layers = result.get('architectural_layers', {})
-        if layers:
-            console.print("\n🏗️ [bold]Architectural Layers:[/bold]")
-            for layer, count in sorted(layers.items(), key=lambda x: x[1], reverse=True):
-                console.print(f"  • {layer}: {count} components")
-        
-        # Show criticality distribution
-        criticality = result.get('criticality_distribution', {})
-        if criticality:
-            console.print("\n⚠️ [bold]Criticality Distribution:[/bold]")
-            for level, count in sorted(criticality.items(), key=lambda x: x[1], reverse=True):
-                console.print(f"  • {level}: {count} components")
-        
-        # Show business domains
-        domains = result.get('business_domains', {})
-        if domains:
-            console.print("\n🏢 [bold]Business Domains:[/bold]")
-            for domain, count in sorted(domains.items(), key=lambda x: x[1], reverse=True):
-                console.print(f"  • {domain}: {count} components")
-        
-    except Exception as e:
-        console.print(f"❌ [bold red]Enhancement failed: {e}[/bold red]")
-        # Suggest GitHub issue reporting
-        import traceback
-        suggest_github_issue(
-            error_type=type(e).__name__,
-            error_message=str(e),
-            command=f"enhance {path} --limit {limit}",
-            traceback=traceback.format_exc()
-        )
-        sys.exit(1)
-
-
-@cli.command(name='insights')
-@click.argument('path', type=click.Path(exists=True), default='.')
-@click.option('--project', help='Project name/path (default: current directory)')
-def get_insights(path, project):
-    """Get comprehensive codebase insights and health assessment"""
-    try:
-        path = validate_file_path(path)
-    except SecurityError as e:
-        console.print(f"❌ [bold red]Security error: {e}[/bold red]")
-        sys.exit(1)
-    
-    console.print(f"📊 [bold blue]Getting codebase insights for: {path}[/bold blue]")
-    
-    try:
-        _CodeGraphIndexer = get_code_graph_indexer()
-        indexer = _CodeGraphIndexer(project_path=Path(path))
-        insights = indexer.get_analysis_insights()
-        
-        if not insights:
-            console.print("ℹ️ [yellow]No enhanced metadata found. Run 'cci enhance' first.[/yellow]")
-            return
-        
-        # Codebase health
-        health = insights.get('codebase_health', {})
-        if health:
-            console.print("\n🏥 [bold]Codebase Health:[/bold]")
-            
-            overall_score = health.get('overall_score', 0)
-            color = "green" if overall_score > 0.7 else "yellow" if overall_score > 0.5 else "red"
-            console.print(f"  Overall Score: [{color}]{overall_score:.3f}/1.0[/{color}]")
-            
-            complexity_health = health.get('complexity_health', 'unknown')
-            testability_health = health.get('testability_health', 'unknown')
-            console.print(f"  Complexity: {complexity_health}")
-            console.print(f"  Testability: {testability_health}")
-            
-            recommendations = health.get('recommendations', [])
-            if recommendations:
-                console.print("  [bold]Recommendations:[/bold]")
-                for rec in recommendations:
-                    console.print(f"    - {rec}")
-        
-        # Architectural overview
-        arch = insights.get('architectural_overview', {})
-        if arch:
-            console.print("\n🏗️ [bold]Architecture Overview:[/bold]")
-            
-            layer_dist = arch.get('layer_distribution', {})
-            if layer_dist:
-                console.print("  Layer Distribution:")
-                for layer, count in sorted(layer_dist.items(), key=lambda x: x[1], reverse=True):
-                    console.print(f"    - {layer}: {count} components")
-            
-            layer_balance = arch.get('layer_balance', 'unknown')
-            domain_focus = arch.get('domain_focus', 'unknown')
-            console.print(f"  Layer Balance: {layer_balance}")
-            console.print(f"  Primary Domain: {domain_focus}")
-        
-        # Complexity hotspots
-        hotspots = insights.get('complexity_hotspots', [])
-        if hotspots:
-            console.print("\n🔥 [bold]Complexity Hotspots:[/bold]")
-            for i, hotspot in enumerate(hotspots[:5], 1):  # Top 5
-                console.print(f"  {i}. {hotspot['name']} ({hotspot['layer']})")
-                console.print(f"     📁 {hotspot['path']}")
-                console.print(f"     📊 Complexity: {hotspot['complexity']:.3f}")
-        
-        # Improvement suggestions
-        suggestions = insights.get('improvement_suggestions', [])
-        if suggestions:
-            console.print("\n💡 [bold]Improvement Suggestions:[/bold]")
-            for i, suggestion in enumerate(suggestions, 1):
-                console.print(f"  {i}. {suggestion}")
-    
-    except Exception as e:
-        console.print(f"❌ [bold red]Failed to get insights: {e}[/bold red]")
-        # Suggest GitHub issue reporting
-        import traceback
-        suggest_github_issue(
-            error_type=type(e).__name__,
-            error_message=str(e),
-            command=f"insights {path}",
-            traceback=traceback.format_exc()
-        )
-        sys.exit(1)
-
-
-@cli.command(name='enhanced')
-@click.argument('path', type=click.Path(exists=True), default='.')
-@click.option('--layer', help='Filter by architectural layer (controller, service, model, etc.)')
-@click.option('--domain', help='Filter by business domain (authentication, payment, etc.)')
-@click.option('--criticality', help='Filter by criticality level (critical, important, normal, low)')
-@click.option('--min-complexity', type=float, help='Filter by minimum complexity score (0.0-1.0)')
-@click.option('--limit', type=int, default=20, help='Maximum number of results')
-@click.option('--project', help='Project name/path (default: current directory)')
-def query_enhanced(path, layer, domain, criticality, min_complexity, limit, project):
-    """Query nodes with enhanced metadata and filters"""
-    try:
-        path = validate_file_path(path)
-    except SecurityError as e:
-        console.print(f"❌ [bold red]Security error: {e}[/bold red]")
-        sys.exit(1)
-    
-    console.print(f"🔍 [bold blue]Querying enhanced nodes for: {path}[/bold blue]")
-    
-    try:
-        _CodeGraphIndexer = get_code_graph_indexer()
-        indexer = _CodeGraphIndexer(project_path=Path(path))
-        
-        nodes = indexer.query_enhanced_nodes(
-            architectural_layer=layer,
-            business_domain=domain,
-            criticality_level=criticality,
-            min_complexity=min_complexity,
-            limit=limit
-        )
-        
-        if not nodes:
-            console.print("ℹ️ [yellow]No enhanced nodes found matching criteria. Run 'cci enhance' first.[/yellow]")
-            return
-        
-        # Show filter info
-        filters = []
-        if layer:
-            filters.append(f"Layer: {layer}")
-        if domain:
-            filters.append(f"Domain: {domain}")
-        if criticality:
-            filters.append(f"Criticality: {criticality}")
-        if min_complexity:
-            filters.append(f"Min Complexity: {min_complexity}")
-        
-        if filters:
-            console.print(f"🎯 [cyan]Filters: {', '.join(filters)}[/cyan]")
-        
-        console.print(f"📊 Found {len(nodes)} nodes (limit: {limit})\n")
-        
-        # Create table
-        table = Table(title="Enhanced Nodes")
-        table.add_column("Name", style="cyan")
-        table.add_column("Type", style="yellow")
-        table.add_column("Layer", style="green")
-        table.add_column("Domain", style="blue")
-        table.add_column("Criticality", style="red")
-        table.add_column("Complexity", style="magenta")
-        table.add_column("Importance", style="bright_white")
-        
-        for node in nodes:
-            name = node['name'][:25] + "..." if len(node['name']) > 25 else node['name']
-            node_type = node['node_type']
-            layer = node.get('architectural_layer', 'unknown')
-            domain = node.get('business_domain', 'general')
-            criticality_val = node.get('criticality_level', 'normal')
-            complexity = f"{node.get('complexity_score', 0):.3f}"
-            importance = f"{node.get('importance_score', 0):.3f}"
-            
-            table.add_row(name, node_type, layer, domain, criticality_val, complexity, importance)
-        
-        console.print(table)
-        
-    except Exception as e:
-        console.print(f"❌ [bold red]Query failed: {e}[/bold red]")
-        # Suggest GitHub issue reporting
-        import traceback
-        suggest_github_issue(
-            error_type=type(e).__name__,
-            error_message=str(e),
-            command=f"enhanced {path}",
-            traceback=traceback.format_exc()
-        )
-        sys.exit(1)
-
-
-@cli.command(name='critical')
-@click.argument('path', type=click.Path(exists=True), default='.')
-@click.option('--limit', type=int, default=15, help='Maximum number of components to show')
-@click.option('--project', help='Project name/path (default: current directory)')
-def get_critical_components(path, limit, project):
-    """Get most critical components in the codebase"""
-    try:
-        path = validate_file_path(path)
-    except SecurityError as e:
-        console.print(f"❌ [bold red]Security error: {e}[/bold red]")
-        sys.exit(1)
-    
-    console.print(f"⚠️ [bold blue]Getting critical components for: {path}[/bold blue]")
-    
-    try:
-        _CodeGraphIndexer = get_code_graph_indexer()
-        indexer = _CodeGraphIndexer(project_path=Path(path))
-        critical_components = indexer.get_critical_components(limit=limit)
-        
-        if not critical_components:
-            console.print("ℹ️ [yellow]No critical components found. Run 'cci enhance' first.[/yellow]")
-            return
-        
-        console.print(f"\n⚠️ [bold red]Critical Components (Top {len(critical_components)}):[/bold red]\n")
-        
-        for i, comp in enumerate(critical_components, 1):
-            console.print(f"{i}. [bold]{comp['name']}[/bold] ({comp['node_type']})")
-            console.print(f"   📁 Path: {comp['path']}")
-            console.print(f"   🏗️ Layer: {comp.get('architectural_layer', 'unknown')}")
-            console.print(f"   🏢 Domain: {comp.get('business_domain', 'general')}")
-            console.print(f"   📊 Complexity: {comp.get('complexity_score', 0):.3f}")
-            console.print(f"   🎯 Importance: {comp.get('importance_score', 0):.3f}")
-            console.print(f"   💥 Impact: {comp.get('dependencies_impact', 0):.3f}")
-            
-            # Role tags
-            role_tags = comp.get('role_tags', [])
-            if role_tags:
-                console.print(f"   🏷️ Tags: {', '.join(role_tags)}")
-            
-            # LLM summary
-            summary = comp.get('llm_summary', '')
-            if summary:
-                truncated = summary[:80] + "..." if len(summary) > 80 else summary
-                console.print(f"   📝 Summary: {truncated}")
-            
-            console.print()
-    
-    except Exception as e:
-        console.print(f"❌ [bold red]Failed to get critical components: {e}[/bold red]")
-        # Suggest GitHub issue reporting
-        import traceback
-        suggest_github_issue(
-            error_type=type(e).__name__,
-            error_message=str(e),
-            command=f"critical {path} --limit {limit}",
-            traceback=traceback.format_exc()
-        )
-        sys.exit(1)
-
-
 # Register god-mode command group
 if god_mode_group is not None:
     cli.add_command(god_mode_group)
 
-# Register migrate command
-if migrate_command is not None:
-    cli.add_command(migrate_command)
-
-# Register crash management commands
-if crash_group is not None:
-    cli.add_command(crash_group)
 
-
-@cli.command(name='llm-guide')
-def llm_guide():
-    """🤖 Guide for LLMs using claude-code-indexer (cci)
-    
-    Special command providing comprehensive usage instructions
-    for AI assistants like Claude, ChatGPT, etc.
-    """
-    guide = """🤖 Claude Code Indexer - LLM Usage Guide
+# Printed by `cci llm-guide`; plain text, so Rich markup parsing is skipped
+_LLM_GUIDE = """🤖 Claude Code Indexer - LLM Usage Guide
 
 🌟 QUICK START for understanding any codebase:
 1. cci index .          # Index the codebase (4-5s)
@@ -1518,30 +1189,28 @@ gh issue create --repo tuannx/claude-prompts \\
 
 📝 More info: https://github.com/tuannx/claude-prompts
 """
-    console.print(guide)
 
 
-# Add mcp-daemon command group
-@cli.group(name='mcp-daemon')
+@cli.command(name='llm-guide')
+def llm_guide():
+    """🤖 Guide for LLMs using claude-code-indexer (cci)
+    
+    Special command providing comprehensive usage instructions
+    for AI assistants like Claude, ChatGPT, etc.
+    """
+    console.print(_LLM_GUIDE, markup=False)
+
+
+# Add mcp-daemon command group; its commands (and psutil) load on first use
+@cli.group(name='mcp-daemon', cls=LazyGroup, lazy_subcommands={
+    name: f'.commands.mcp_daemon:{name}'
+    for name in ('start', 'stop', 'restart', 'status', 'logs', 'config')
+})
 def mcp_daemon():
     """Manage MCP persistent daemon for better performance"""
     pass
 
 
-# Import daemon commands and register them
-try:
-    from .commands.mcp_daemon import start, stop, restart, status as daemon_status, logs, config as daemon_config
-    
-    mcp_daemon.add_command(start)
-    mcp_daemon.add_command(stop)
-    mcp_daemon.add_command(restart)
-    mcp_daemon.add_command(daemon_status, name='status')
-    mcp_daemon.add_command(logs)
-    mcp_daemon.add_command(daemon_config, name='config')
-except ImportError:
-    pass  # MCP daemon commands not available
-
-
 @cli.group()
 def state():
     """Manage codebase state (single source of truth)."""
@@ -1559,6 +1228,7 @@ def capture(project):
     manager = CodebaseStateManager(project_path)
     state = manager.capture_state()
     
+    from rich.panel import Panel
     console.print(Panel.fit(
         f"[green]✅ State captured[/green]\n\n"
         f"📁 Project: {state['project_path']}\n"
@@ -1582,6 +1252,7 @@ def begin(task, project):
     manager = CodebaseStateManager(project_path)
     task_id = manager.track_task({"description": task})
     
+    from rich.panel import Panel
     console.print(Panel.fit(
         f"[green]✅ Task started[/green]\n\n"
         f"📋 ID: {task_id}\n"
@@ -1607,6 +1278,7 @@ def complete(task_id, project):
         changes = manager.complete_task(task_id)
         
         # Create summary table
+        from rich.table import Table
         table = Table(title="Task Changes Summary")
         table.add_column("Change Type", style="cyan")
         table.add_column("Count", style="green")
@@ -1638,6 +1310,7 @@ def diff(project, format):
         console.print("[yellow]No previous state to compare with[/yellow]")
         return
     
+    from rich.table import Table
     table = Table(title="State Differences")
     table.add_column("Change Type", style="cyan")
     table.add_column("Files", style="green")
@@ -1668,6 +1341,7 @@ def tasks(project, limit):
         console.print("[yellow]No tasks found[/yellow]")
         return
     
+    from rich.table import Table
     table = Table(title="Recent Tasks")
     table.add_column("ID", style="cyan")
     table.add_column("Description", style="white")
@@ -1752,12 +1426,18 @@ def doctor():
     console.print("[bold]Import Status:[/bold]")
     all_critical_ok = True
     
+    from importlib.util import find_spec
     for module, (ok_icon, fail_icon, desc) in modules.items():
+        is_critical = fail_icon == '❌'
         try:
-            __import__(module)
+            if is_critical:
+                import_module(module)
+            # Optional packages only need to be installed - locating them
+            # avoids running their (slow) initialisation just for a report
+            elif find_spec(module) is None:
+                raise ImportError(f"No module named '{module}'")
             console.print(f"  {ok_icon} {module} - {desc}")
         except ImportError as e:
-            is_critical = fail_icon == '❌'
             console.print(f"  {fail_icon} {module} - {desc}")
             if is_critical:
                 all_critical_ok = False
@@ -1779,6 +1459,42 @@ def doctor():
         console.print("  4. Try: python -m pip install --force-reinstall -e .")
 
 
+def install_crash_handler():
+    """Route uncaught exceptions to CrashHandler, importing it only on a crash
+    
+    Building a CrashHandler probes for the gh CLI with a subprocess and imports
+    rich.prompt and the GitHub reporter - work no successful run needs. Set
+    CCI_CRASH_HANDLER=0 to keep Python's default excepthook.
+    """
+    if os.environ.get('CCI_CRASH_HANDLER', '1') == '0':
+        return
+    
+    original_excepthook = sys.excepthook
+    
+    def lazy_excepthook(exc_type, exc_value, exc_traceback):
+        try:
+            from .crash_handler import CrashHandler
+            # By now sys.excepthook is this hook; hand CrashHandler the real one
+            handler = CrashHandler(original_excepthook=original_excepthook)
+        except Exception:
+            original_excepthook(exc_type, exc_value, exc_traceback)
+            return
+        handler.handle_crash(exc_type, exc_value, exc_traceback)
+    
+    sys.excepthook = lazy_excepthook
+
+
+def _wants_update_check(args):
+    """Whether this invocation runs a real command worth an update notice
+    
+    Bare `cci`, --help/--version and llm-guide only print static text; skipping
+    the check also avoids spawning a cache refresh for them.
+    """
+    if not args or args[0] in _NO_UPDATE_CHECK_COMMANDS:
+        return False
+    return _NO_UPDATE_CHECK_FLAGS.isdisjoint(args)
+
+
 def main():
     """Main CLI entry point with error handling and auto-repair"""
     # Ensure proper package setup for installed scripts
@@ -1796,33 +1512,41 @@ def main():
         print(f"DEBUG: __file__ = {__file__}")
         print(f"DEBUG: sys.path[0] = {sys.path[0]}")
         print(f"DEBUG: cli = {cli}")
+        from .cli_common import CodeGraphIndexer
         print(f"DEBUG: CodeGraphIndexer = {CodeGraphIndexer}")
         print(f"DEBUG: console = {console}")
         sys.argv.remove('--trace')
     
     # First, ensure we're in the right environment
-    try:
-        # Add project root to path if in development
-        file_path = Path(__file__).resolve()
-        project_root = file_path.parent.parent
-        if (project_root / 'pyproject.toml').exists() and str(project_root) not in sys.path:
-            sys.path.insert(0, str(project_root))
-    except:
-        pass
+    # Add project root to path if in development - one stat, and only when
+    # it's not already importable from there
+    if _PROJECT_ROOT not in sys.path and os.path.exists(os.path.join(_PROJECT_ROOT, 'pyproject.toml')):
+        sys.path.insert(0, _PROJECT_ROOT)
     
     try:
-        # Install crash handler if available
-        if install_crash_handler:
-            install_crash_handler()
+        install_crash_handler()
         
-        # Check for updates if available
-        if check_and_notify_update:
-            check_and_notify_update()
+        # Only the cached PyPI lookup is read here; a stale cache is refreshed
+        # by a detached process, so network latency never delays the command
+        if _wants_update_check(sys.argv[1:]):
+            try:
+                from .updater import check_and_notify_update
+            except ImportError:
+                check_and_notify_update = None
+            if check_and_notify_update:
+                check_and_notify_update(refresh_in_background=True)
         
         # Ensure cli is not None
         if cli is None:
             raise ImportError("CLI module failed to initialize properly")
         
+        # Everything imported so far (click, rich, command definitions) lives
+        # for the whole run; freezing it keeps later collections from
+        # re-scanning it while indexing allocates. CCI_GC_FREEZE=0 opts out
+        if os.environ.get('CCI_GC_FREEZE', '1') != '0':
+            import gc
+            gc.freeze()
+        
         cli()
     except ImportError as e:
         # Import error - try to fix
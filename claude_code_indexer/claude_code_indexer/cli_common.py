@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Console and output helpers shared by cli.py and the lazily loaded commands/*
+
+Command modules import these from here rather than from cli, which loads
+them: under `python -m claude_code_indexer.cli` the entry point runs as
+__main__, and importing cli from a command would create a second copy of it.
+"""
+
+import re
+import sys
+from itertools import islice
+
+import click
+
+# Version info - always available
+__version__ = "1.24.2"
+__app_name__ = "Claude Code Indexer"
+
+# Plain-text listings are written this many rows at a time
+ROW_CHUNK_SIZE = 200
+
+# Terminal listings longer than this are shown through the pager
+PAGER_THRESHOLD = 50
+
+# Import with fallbacks
+try:
+    from rich.console import Console, Group
+    from rich.style import Style
+except ImportError:
+    Console = Group = Style = None
+
+if Console:
+    console = Console()
+else:
+    # Rich markup tags (including combined ones like [bold red]) stripped by the fallback
+    _MARKUP_RE = re.compile(
+        r'\[/?(?:(?:bold|dim|red|green|yellow|blue|cyan|magenta|white|bright_white)\s*)+\]'
+    )
+    
+    # Fallback console
+    class SimpleConsole:
+        def print(self, text='', **kwargs):
+            print(_MARKUP_RE.sub('', str(text)))
+    console = SimpleConsole()
+
+
+# Local imports with error handling - delay indexer import to avoid circular dependency
+CodeGraphIndexer = None  # Will be imported on demand
+
+
+def get_code_graph_indexer():
+    """Get CodeGraphIndexer, importing it on first use"""
+    global CodeGraphIndexer
+    if CodeGraphIndexer is not None:
+        return CodeGraphIndexer
+    
+    # Absolute import works both as a package and when run as a script
+    try:
+        from claude_code_indexer.indexer import CodeGraphIndexer as _CodeGraphIndexer
+    except (ImportError, AttributeError) as e1:
+        if sys.modules.get('ensmallen', False) is not None:
+            console.print(f"❌ [bold red]Failed to import indexer module:[/bold red]")
+            console.print(f"  Import error: {e1}")
+            console.print("Try reinstalling: pip install -e .")
+            import traceback
+            console.print("\n[dim]Detailed error trace:[/dim]")
+            traceback.print_exc()
+            sys.exit(1)
+        
+        # Some test environments block ensmallen with a None entry; retry once without it
+        del sys.modules['ensmallen']
+        try:
+            from claude_code_indexer.indexer import CodeGraphIndexer as _CodeGraphIndexer
+        except ImportError as e2:
+            console.print(f"❌ [bold red]Failed to import indexer module:[/bold red]")
+            console.print(f"  Import error: {e2}")
+            console.print("This might be a test environment issue.")
+            sys.exit(1)
+    
+    CodeGraphIndexer = _CodeGraphIndexer
+    return CodeGraphIndexer
+
+
+def print_rows(columns, rows, pager: bool = False, plain: bool = False, **table_options):
+    """Print rows as a Rich table on a terminal, tab-separated text otherwise
+    
+    Args:
+        columns: Sequence of (header, style) pairs, e.g. _QUERY_COLUMNS
+        rows: Iterable of tuples of pre-formatted cell strings (may be a generator)
+        pager: Page the table through the system pager on a terminal
+        plain: Print tab-separated text even on a terminal
+        **table_options: Extra keyword arguments for rich.table.Table
+    """
+    if plain or Console is None or not getattr(console, 'is_terminal', False):
+        # Pipes and files get plain rows - no per-cell markup/style parsing,
+        # no box drawing and no wrapping of long paths. Rows are written in
+        # fixed-size chunks so memory stays flat however many there are.
+        # click.echo keeps the tabs; Rich's console would expand them to spaces
+        click.echo('\t'.join(header for header, _ in columns))
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, ROW_CHUNK_SIZE))
+            if not chunk:
+                break
+            click.echo('\n'.join(
+                '\t'.join('' if cell is None else cell for cell in row) for row in chunk
+            ))
+        return
+    
+    from rich.table import Table
+    table = Table(**table_options)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    
+    if pager:
+        with console.pager(styles=True):
+            console.print(table)
+    else:
+        console.print(table)
+
+
+def print_renderables(renderables):
+    """Print strings and Rich renderables as one Group, one by one without rich"""
+    if Group:
+        console.print(Group(*renderables))
+    else:
+        for renderable in renderables:
+            console.print(renderable)
+
+
+def print_json(data):
+    """Write data to stdout as compact JSON, bypassing rich entirely"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        click.echo(json.dumps(data, default=str, separators=(',', ':')))
+    else:
+        click.echo(orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode())
+
+
+def json_option(f):
+    """Add --json, which prints the command's data instead of rendering tables"""
+    return click.option('--json', 'as_json', is_flag=True,
+                        help='Print the raw data as compact JSON instead of tables')(f)
+
+
+def _progress():
+    """Spinner for long-running commands; disabled when output is not a terminal"""
+    from rich.progress import Progress
+    return Progress(
+        console=console,
+        transient=True,
+        refresh_per_second=2,
+        disable=not getattr(console, 'is_terminal', False)
+    )
+
+
+def show_app_header():
+    """Display application name and version header, unless --quiet/CCI_QUIET is set"""
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and ctx.find_root().params.get('quiet'):
+        return
+    console.print(f"\n[bold cyan]{__app_name__} v{__version__}[/bold cyan]")
+    console.print("[dim]Multi-language code indexing with graph database[/dim]\n")
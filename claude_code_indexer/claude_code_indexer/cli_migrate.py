@@ -9,7 +9,7 @@ from . import __version__
 
 
 @click.command()
-@click.option('--project-path', '-p', type=click.Path(exists=True), 
+@click.option('--project-path', '-p', type=click.Path(exists=True, path_type=Path), 
               help='Path to project (defaults to current directory)')
 @click.option('--target-version', '-t', type=str,
               help='Target schema version (defaults to latest)')
@@ -22,9 +22,7 @@ def migrate(project_path, target_version, dry_run, force):
     
     # Get project path
     storage_manager = get_storage_manager()
-    if project_path:
-        project_path = Path(project_path)
-    else:
+    if not project_path:
         project_path = storage_manager.get_project_from_cwd()
     
     # Get database path
@@ -5,19 +5,54 @@ Crash management commands for Claude Code Indexer
 
 import click
 import json
+import os
+import re
 from pathlib import Path
 from datetime import datetime
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-
-from ..crash_handler import CrashHandler
-from ..github_reporter import GitHubIssueReporter
 
 
 console = Console()
 
+# Timestamp embedded in crash report filenames
+_CRASH_TIMESTAMP_RE = re.compile(r"\d{8}_\d{6}")
+
+
+def _crash_handler():
+    """Create the crash handler, importing it (and its rich/GitHub helpers) on first use"""
+    from ..crash_handler import CrashHandler
+    return CrashHandler()
+
+
+def _scan_crashes(crash_dir):
+    """Crash report entries in crash_dir, newest first, from one directory listing"""
+    with os.scandir(crash_dir) as it:
+        entries = [
+            entry for entry in it
+            if entry.name.startswith("crash_") and entry.name.endswith(".json")
+            and entry.is_file(follow_symlinks=False)
+        ]
+    entries.sort(key=lambda entry: entry.name, reverse=True)
+    return entries
+
+
+def _find_crash(crash_dir, crash_id):
+    """Path of the crash report matching crash_id, or None
+    
+    A full ID (with or without the crash_ prefix) is a single stat; anything
+    else falls back to the newest report whose name contains crash_id.
+    """
+    if os.path.basename(crash_id) == crash_id:
+        for name in (f"{crash_id}.json", f"crash_{crash_id}.json"):
+            candidate = crash_dir / name
+            if candidate.is_file():
+                return candidate
+    
+    for entry in _scan_crashes(crash_dir):
+        if crash_id in entry.name[:-len(".json")]:
+            return Path(entry.path)
+    return None
+
 
 @click.group()
 def crash():
@@ -34,8 +69,9 @@ def list(show_all, last_n):
     Shows crash reports stored locally with options to view details
     or create GitHub issues for unresolved crashes.
     """
-    handler = CrashHandler()
-    crash_files = sorted(handler.crash_dir.glob("crash_*.json"), reverse=True)
+    handler = _crash_handler()
+    crash_files = _scan_crashes(handler.crash_dir)
+    total = len(crash_files)
     
     if not crash_files:
         console.print("[green]✓ No crash reports found![/green]")
@@ -46,6 +82,7 @@ def list(show_all, last_n):
         crash_files = crash_files[:last_n]
         
     # Create table
+    from rich.table import Table
     table = Table(title="Crash Reports", show_header=True, header_style="bold magenta")
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Date/Time", style="dim")
@@ -56,7 +93,7 @@ def list(show_all, last_n):
     crashes = []
     for crash_file in crash_files:
         try:
-            with open(crash_file, 'r') as f:
+            with open(crash_file.path, 'r') as f:
                 crash_data = json.load(f)
                 crashes.append((crash_file, crash_data))
                 
@@ -80,19 +117,19 @@ def list(show_all, last_n):
                     command = "..." + command[-27:]
                     
                 table.add_row(
-                    crash_data.get('crash_id', crash_file.stem)[:20],
+                    crash_data.get('crash_id', crash_file.name[:-len(".json")])[:20],
                     timestamp,
                     crash_data.get('error_type', 'Unknown'),
                     message,
                     command
                 )
         except Exception as e:
-            console.print(f"[red]Error reading {crash_file}: {e}[/red]")
+            console.print(f"[red]Error reading {crash_file.path}: {e}[/red]")
             
     console.print(table)
     
     if crashes:
-        console.print(f"\n[dim]Showing {len(crashes)} of {len(list(handler.crash_dir.glob('crash_*.json')))} total crashes[/dim]")
+        console.print(f"\n[dim]Showing {len(crashes)} of {total} total crashes[/dim]")
         console.print("\nUse 'claude-code-indexer crash show <ID>' to view details")
         console.print("Use 'claude-code-indexer crash report <ID>' to create GitHub issue")
 
@@ -101,14 +138,9 @@ def list(show_all, last_n):
 @click.argument('crash_id')
 def show(crash_id):
     """Show details of a specific crash report"""
-    handler = CrashHandler()
+    handler = _crash_handler()
     
-    # Find crash file
-    crash_file = None
-    for f in handler.crash_dir.glob("crash_*.json"):
-        if crash_id in f.stem:
-            crash_file = f
-            break
+    crash_file = _find_crash(handler.crash_dir, crash_id)
             
     if not crash_file:
         console.print(f"[red]Crash report '{crash_id}' not found[/red]")
@@ -118,6 +150,9 @@ def show(crash_id):
         with open(crash_file, 'r') as f:
             crash_data = json.load(f)
             
+        from rich.panel import Panel
+        from rich.prompt import Confirm
+        
         # Display crash details
         console.print(Panel.fit(
             f"[bold]Crash Report: {crash_data['crash_id']}[/bold]",
@@ -141,7 +176,6 @@ def show(crash_id):
         
         # Options
         if Confirm.ask("\nWould you like to create a GitHub issue for this crash?", default=True):
-            reporter = GitHubIssueReporter()
             handler.create_github_issue(crash_data)
             
     except Exception as e:
@@ -152,14 +186,9 @@ def show(crash_id):
 @click.argument('crash_id')
 def report(crash_id):
     """Create a GitHub issue for a crash report"""
-    handler = CrashHandler()
+    handler = _crash_handler()
     
-    # Find crash file
-    crash_file = None
-    for f in handler.crash_dir.glob("crash_*.json"):
-        if crash_id in f.stem:
-            crash_file = f
-            break
+    crash_file = _find_crash(handler.crash_dir, crash_id)
             
     if not crash_file:
         console.print(f"[red]Crash report '{crash_id}' not found[/red]")
@@ -180,33 +209,35 @@ def report(crash_id):
 @click.option('--older-than', type=int, help='Delete crashes older than N days')
 def clean(all, older_than):
     """Clean up old crash reports"""
-    handler = CrashHandler()
-    crash_files = list(handler.crash_dir.glob("crash_*.json"))
+    handler = _crash_handler()
+    crash_files = _scan_crashes(handler.crash_dir)
     
     if not crash_files:
         console.print("[green]✓ No crash reports to clean[/green]")
         return
         
     if all:
+        from rich.prompt import Confirm
         if Confirm.ask(f"Delete all {len(crash_files)} crash reports?", default=False):
-            for f in crash_files:
-                f.unlink()
+            for entry in crash_files:
+                os.unlink(entry.path)
             console.print(f"[green]✓ Deleted {len(crash_files)} crash reports[/green]")
     elif older_than:
         from datetime import timedelta
-        cutoff = datetime.now() - timedelta(days=older_than)
+        # Fixed-width YYYYMMDD_HHMMSS stamps sort lexicographically, so the
+        # cutoff can be compared as a string without parsing every filename
+        cutoff = (datetime.now() - timedelta(days=older_than)).strftime("%Y%m%d_%H%M%S")
         deleted = 0
         
         for crash_file in crash_files:
+            # Filenames are crash_<YYYYMMDD_HHMMSS>_<id>.json
+            timestamp_str = crash_file.name[6:21]
+            if not _CRASH_TIMESTAMP_RE.fullmatch(timestamp_str) or timestamp_str >= cutoff:
+                continue
             try:
-                # Extract timestamp from filename
-                timestamp_str = crash_file.stem.split('_')[1] + '_' + crash_file.stem.split('_')[2]
-                file_time = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                
-                if file_time < cutoff:
-                    crash_file.unlink()
-                    deleted += 1
-            except:
+                os.unlink(crash_file.path)
+                deleted += 1
+            except OSError:
                 pass
                 
         console.print(f"[green]✓ Deleted {deleted} crash reports older than {older_than} days[/green]")
@@ -221,17 +252,20 @@ def recover():
     Helps recover from recent crashes by checking for incomplete
     operations and suggesting recovery actions.
     """
-    handler = CrashHandler()
-    crash_files = sorted(handler.crash_dir.glob("crash_*.json"), reverse=True)
+    handler = _crash_handler()
+    crash_files = _scan_crashes(handler.crash_dir)
     
     if not crash_files:
         console.print("[green]✓ No recent crashes detected[/green]")
         return
         
     # Check most recent crash
-    with open(crash_files[0], 'r') as f:
+    with open(crash_files[0].path, 'r') as f:
         crash_data = json.load(f)
         
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    
     console.print(Panel.fit(
         f"[bold yellow]Recent Crash Detected[/bold yellow]\n"
         f"Crash ID: {crash_data['crash_id']}",
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+LLM metadata enhancement commands for Claude Code Indexer
+"""
+
+import sys
+import traceback
+from operator import itemgetter
+from pathlib import Path
+
+import click
+
+from ..cli_common import (
+    console, show_app_header, get_code_graph_indexer, print_rows, print_json, json_option, _progress,
+    PAGER_THRESHOLD
+)
+
+# Sort key for (name, count) pairs
+_COUNT = itemgetter(1)
+
+# (header, style) column specs for the `enhanced` listing
+_ENHANCED_COLUMNS = (("Name", "cyan"), ("Type", "yellow"), ("Layer", "green"), ("Domain", "blue"),
+                     ("Criticality", "red"), ("Complexity", "magenta"), ("Importance", "bright_white"))
+
+
+def _enhancement_indexer(path):
+    """Create the indexer used by the LLM metadata commands
+    
+    These commands only go through the metadata enhancer, so the file cache
+    (its SQLite database and in-memory cache) is never opened.
+    """
+    _CodeGraphIndexer = get_code_graph_indexer()
+    return _CodeGraphIndexer(project_path=Path(path), use_cache=False)
+
+
+@click.command(name='enhance')
+@click.argument('path', type=click.Path(exists=True), default='.')
+@click.option('--limit', type=int, help='Limit number of nodes to analyze')
+@click.option('--force', is_flag=True, help='Force re-analysis even if cached')
+@click.option('--workers', type=click.IntRange(min=1),
+              help='Nodes analyzed concurrently (default: 3)')
+@click.option('--project', help='Project name/path (default: current directory)')
+def enhance_metadata(path, limit, force, workers, project):
+    """Enhance codebase metadata using LLM analysis
+    
+    🤖 LLM Enhancement - Powerful AI-driven code analysis
+    
+    ⚠️  SECURITY WARNING:
+    - Do NOT use on code containing secrets, API keys, or sensitive data
+    - Recommended for open source or development code only
+    - Start with --limit 5-10 to test before full analysis
+    
+    📊 Features:
+    - Architectural layer detection (service, model, controller, etc.)
+    - Business domain classification
+    - Complexity scoring (0.0-1.0)
+    - Criticality assessment
+    - Role tagging and pattern detection
+    
+    💡 Best Practices:
+    1. Test with: cci enhance . --limit 5
+    2. Review results before scaling up
+    3. Use insights command to query enhanced data
+    
+    🐛 Report issues: https://github.com/tuannx/claude-prompts/issues
+    """
+    show_app_header()
+    
+    from ..security import validate_file_path, SecurityError
+    
+    try:
+        path = validate_file_path(path)
+    except SecurityError as e:
+        console.print(f"❌ [bold red]Security error: {e}[/bold red]")
+        sys.exit(1)
+    
+    console.print(f"🤖 [bold blue]Starting LLM metadata enhancement for: {path}[/bold blue]")
+    
+    try:
+        indexer = _enhancement_indexer(path)
+        
+        with _progress() as progress:
+            task = progress.add_task("Analyzing codebase...", total=None)
+            result = indexer.enhance_metadata(
+                limit=limit, force_refresh=force, workers=workers,
+                progress_callback=lambda done, total: progress.update(task, completed=done, total=total)
+            )
+        
+        # Display results
+        console.print("\n📊 [bold green]Enhancement Complete![/bold green]")
+        
+        analyzed = result.get('analyzed_count', 0)
+        total = result.get('total_nodes', 0)
+        duration = result.get('analysis_duration', 'N/A')
+        speed = result.get('nodes_per_second', 'N/A')
+        
+        from rich.table import Table
+        table = Table(title="Analysis Summary")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="green")
+        
+        table.add_row("Analyzed Nodes", str(analyzed))
+        table.add_row("Total Nodes", str(total))
+        table.add_row("Duration", duration)
+        table.add_row("Speed", f"{speed} nodes/sec")
+        
+        console.print(table)
+        
+        # Show architectural layers, criticality distribution and business domains
+        lines = []
+        for key, heading in (
+            ('architectural_layers', "\n🏗️ [bold]Architectural Layers:[/bold]"),
+            ('criticality_distribution', "\n⚠️ [bold]Criticality Distribution:[/bold]"),
+            ('business_domains', "\n🏢 [bold]Business Domains:[/bold]"),
+        ):
+            counts = result.get(key, {})
+            if counts:
+                lines.append(heading)
+                lines.extend(
+                    f"  • {name}: {count} components"
+                    for name, count in sorted(counts.items(), key=_COUNT, reverse=True)
+                )
+        
+        if lines:
+            console.print("\n".join(lines))
+        
+    except Exception as e:
+        console.print(f"❌ [bold red]Enhancement failed: {e}[/bold red]")
+        # Suggest GitHub issue reporting
+        from ..github_reporter import suggest_github_issue
+        suggest_github_issue(
+            error_type=type(e).__name__,
+            error_message=str(e),
+            command=f"enhance {path} --limit {limit}",
+            traceback=traceback.format_exc()
+        )
+        sys.exit(1)
+
+
+@click.command(name='insights')
+@click.argument('path', type=click.Path(exists=True), default='.')
+@click.option('--project', help='Project name/path (default: current directory)')
+@json_option
+def get_insights(path, project, as_json):
+    """Get comprehensive codebase insights and health assessment"""
+    from ..security import validate_file_path, SecurityError
+    
+    try:
+        path = validate_file_path(path)
+    except SecurityError as e:
+        console.print(f"❌ [bold red]Security error: {e}[/bold red]")
+        sys.exit(1)
+    
+    if not as_json:
+        console.print(f"📊 [bold blue]Getting codebase insights for: {path}[/bold blue]")
+    
+    try:
+        indexer = _enhancement_indexer(path)
+        insights = indexer.get_analysis_insights()
+        
+        if as_json:
+            print_json(insights or {})
+            return
+        
+        if not insights:
+            console.print("ℹ️ [yellow]No enhanced metadata found. Run 'cci enhance' first.[/yellow]")
+            return
+        
+        # Collect every section and print them in one call
+        lines = []
+        
+        # Codebase health
+        health = insights.get('codebase_health', {})
+        if health:
+            lines.append("\n🏥 [bold]Codebase Health:[/bold]")
+            
+            overall_score = health.get('overall_score', 0)
+            color = "green" if overall_score > 0.7 else "yellow" if overall_score > 0.5 else "red"
+            lines.append(f"  Overall Score: [{color}]{overall_score:.3f}/1.0[/{color}]")
+            
+            complexity_health = health.get('complexity_health', 'unknown')
+            testability_health = health.get('testability_health', 'unknown')
+            lines.append(f"  Complexity: {complexity_health}")
+            lines.append(f"  Testability: {testability_health}")
+            
+            recommendations = health.get('recommendations', [])
+            if recommendations:
+                lines.append("  [bold]Recommendations:[/bold]")
+                for rec in recommendations:
+                    lines.append(f"    - {rec}")
+        
+        # Architectural overview
+        arch = insights.get('architectural_overview', {})
+        if arch:
+            lines.append("\n🏗️ [bold]Architecture Overview:[/bold]")
+            
+            layer_dist = arch.get('layer_distribution', {})
+            if layer_dist:
+                lines.append("  Layer Distribution:")
+                for layer, count in sorted(layer_dist.items(), key=_COUNT, reverse=True):
+                    lines.append(f"    - {layer}: {count} components")
+            
+            layer_balance = arch.get('layer_balance', 'unknown')
+            domain_focus = arch.get('domain_focus', 'unknown')
+            lines.append(f"  Layer Balance: {layer_balance}")
+            lines.append(f"  Primary Domain: {domain_focus}")
+        
+        # Complexity hotspots
+        hotspots = insights.get('complexity_hotspots', [])
+        if hotspots:
+            lines.append("\n🔥 [bold]Complexity Hotspots:[/bold]")
+            for i, hotspot in enumerate(hotspots[:5], 1):  # Top 5
+                lines.append(f"  {i}. {hotspot['name']} ({hotspot['layer']})")
+                lines.append(f"     📁 {hotspot['path']}")
+                lines.append(f"     📊 Complexity: {hotspot['complexity']:.3f}")
+        
+        # Improvement suggestions
+        suggestions = insights.get('improvement_suggestions', [])
+        if suggestions:
+            lines.append("\n💡 [bold]Improvement Suggestions:[/bold]")
+            for i, suggestion in enumerate(suggestions, 1):
+                lines.append(f"  {i}. {suggestion}")
+        
+        if lines:
+            console.print("\n".join(lines))
+    
+    except Exception as e:
+        console.print(f"❌ [bold red]Failed to get insights: {e}[/bold red]")
+        # Suggest GitHub issue reporting
+        from ..github_reporter import suggest_github_issue
+        suggest_github_issue(
+            error_type=type(e).__name__,
+            error_message=str(e),
+            command=f"insights {path}",
+            traceback=traceback.format_exc()
+        )
+        sys.exit(1)
+
+
+@click.command(name='enhanced')
+@click.argument('path', type=click.Path(exists=True), default='.')
+@click.option('--layer', help='Filter by architectural layer (controller, service, model, etc.)')
+@click.option('--domain', help='Filter by business domain (authentication, payment, etc.)')
+@click.option('--criticality', help='Filter by criticality level (critical, important, normal, low)')
+@click.option('--min-complexity', type=float, help='Filter by minimum complexity score (0.0-1.0)')
+@click.option('--limit', type=int, default=20, help='Maximum number of results')
+@click.option('--project', help='Project name/path (default: current directory)')
+def query_enhanced(path, layer, domain, criticality, min_complexity, limit, project):
+    """Query nodes with enhanced metadata and filters"""
+    from ..security import validate_file_path, SecurityError
+    
+    try:
+        path = validate_file_path(path)
+    except SecurityError as e:
+        console.print(f"❌ [bold red]Security error: {e}[/bold red]")
+        sys.exit(1)
+    
+    console.print(f"🔍 [bold blue]Querying enhanced nodes for: {path}[/bold blue]")
+    
+    try:
+        indexer = _enhancement_indexer(path)
+        
+        nodes = indexer.query_enhanced_nodes(
+            architectural_layer=layer,
+            business_domain=domain,
+            criticality_level=criticality,
+            min_complexity=min_complexity,
+            limit=limit
+        )
+        
+        if not nodes:
+            console.print("ℹ️ [yellow]No enhanced nodes found matching criteria. Run 'cci enhance' first.[/yellow]")
+            return
+        
+        # Show filter info
+        filters = []
+        if layer:
+            filters.append(f"Layer: {layer}")
+        if domain:
+            filters.append(f"Domain: {domain}")
+        if criticality:
+            filters.append(f"Criticality: {criticality}")
+        if min_complexity:
+            filters.append(f"Min Complexity: {min_complexity}")
+        
+        if filters:
+            console.print(f"🎯 [cyan]Filters: {', '.join(filters)}[/cyan]")
+        
+        console.print(f"📊 Found {len(nodes)} nodes (limit: {limit})\n")
+        
+        # Rows are generated lazily so print_rows can stream them as plain text
+        # when piped instead of building a Rich table
+        node_rows = (
+            (
+                node['name'] if len(node['name']) <= 25 else node['name'][:25] + "...",
+                node['node_type'],
+                node.get('architectural_layer', 'unknown'),
+                node.get('business_domain', 'general'),
+                node.get('criticality_level', 'normal'),
+                f"{node.get('complexity_score', 0):.3f}",
+                f"{node.get('importance_score', 0):.3f}",
+            )
+            for node in nodes
+        )
+        
+        print_rows(
+            _ENHANCED_COLUMNS,
+            node_rows,
+            pager=len(nodes) > PAGER_THRESHOLD,
+            title="Enhanced Nodes"
+        )
+        
+    except Exception as e:
+        console.print(f"❌ [bold red]Query failed: {e}[/bold red]")
+        # Suggest GitHub issue reporting
+        from ..github_reporter import suggest_github_issue
+        suggest_github_issue(
+            error_type=type(e).__name__,
+            error_message=str(e),
+            command=f"enhanced {path}",
+            traceback=traceback.format_exc()
+        )
+        sys.exit(1)
+
+
+@click.command(name='critical')
+@click.argument('path', type=click.Path(exists=True), default='.')
+@click.option('--limit', type=int, default=15, help='Maximum number of components to show')
+@click.option('--project', help='Project name/path (default: current directory)')
+@json_option
+def get_critical_components(path, limit, project, as_json):
+    """Get most critical components in the codebase"""
+    from ..security import validate_file_path, SecurityError
+    
+    try:
+        path = validate_file_path(path)
+    except SecurityError as e:
+        console.print(f"❌ [bold red]Security error: {e}[/bold red]")
+        sys.exit(1)
+    
+    if not as_json:
+        console.print(f"⚠️ [bold blue]Getting critical components for: {path}[/bold blue]")
+    
+    try:
+        indexer = _enhancement_indexer(path)
+        critical_components = indexer.get_critical_components(limit=limit)
+        
+        if as_json:
+            print_json(critical_components)
+            return
+        
+        if not critical_components:
+            console.print("ℹ️ [yellow]No critical components found. Run 'cci enhance' first.[/yellow]")
+            return
+        
+        # Build every component block first and print them in one call
+        lines = [f"\n⚠️ [bold red]Critical Components (Top {len(critical_components)}):[/bold red]\n"]
+        
+        for i, comp in enumerate(critical_components, 1):
+            lines.append(
+                f"{i}. [bold]{comp['name']}[/bold] ({comp['node_type']})\n"
+                f"   📁 Path: {comp['path']}\n"
+                f"   🏗️ Layer: {comp.get('architectural_layer', 'unknown')}\n"
+                f"   🏢 Domain: {comp.get('business_domain', 'general')}\n"
+                f"   📊 Complexity: {comp.get('complexity_score', 0):.3f}\n"
+                f"   🎯 Importance: {comp.get('importance_score', 0):.3f}\n"
+                f"   💥 Impact: {comp.get('dependencies_impact', 0):.3f}"
+            )
+            
+            # Role tags
+            role_tags = comp.get('role_tags', [])
+            if role_tags:
+                lines.append(f"   🏷️ Tags: {', '.join(role_tags)}")
+            
+            # LLM summary
+            summary = comp.get('llm_summary', '')
+            if summary:
+                truncated = summary[:80] + "..." if len(summary) > 80 else summary
+                lines.append(f"   📝 Summary: {truncated}")
+            
+            lines.append("")
+        
+        console.print("\n".join(lines))
+    
+    except Exception as e:
+        console.print(f"❌ [bold red]Failed to get critical components: {e}[/bold red]")
+        # Suggest GitHub issue reporting
+        from ..github_reporter import suggest_github_issue
+        suggest_github_issue(
+            error_type=type(e).__name__,
+            error_message=str(e),
+            command=f"critical {path} --limit {limit}",
+            traceback=traceback.format_exc()
+        )
+        sys.exit(1)
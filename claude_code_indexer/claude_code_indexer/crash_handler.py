@@ -10,7 +10,7 @@ import tempfile
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
 from rich.panel import Panel
@@ -27,11 +27,17 @@ console = Console()
 class CrashHandler:
     """Handles application crashes and helps users report them"""
     
-    def __init__(self):
+    def __init__(self, original_excepthook: Optional[Callable] = None):
+        """Set up the crash directory and GitHub reporter
+        
+        Args:
+            original_excepthook: Hook to fall back to and restore on uninstall
+                (default: the current sys.excepthook)
+        """
         self.crash_dir = Path.home() / ".claude-code-indexer" / "crashes"
         self.crash_dir.mkdir(parents=True, exist_ok=True)
         self.reporter = GitHubIssueReporter()
-        self._original_excepthook = sys.excepthook
+        self._original_excepthook = original_excepthook or sys.excepthook
         self._crash_id = None
         
     def save_crash_dump(self, exc_type, exc_value, exc_traceback) -> Path:
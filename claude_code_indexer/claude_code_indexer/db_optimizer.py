@@ -94,6 +94,21 @@ class OptimizedDatabase:
                 cursor.execute("ROLLBACK")
                 raise e
     
+    def execute_many(self, statement, rows):
+        """Execute one statement for every row of params in a single transaction"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(statement, rows)
+                cursor.execute("COMMIT")
+                return True
+                
+            except Exception as e:
+                cursor.execute("ROLLBACK")
+                raise e
+    
     def close_all_connections(self):
         """Close all pooled connections"""
         with self._pool_lock:
@@ -113,16 +128,16 @@ class DatabaseBenchmark:
         """Benchmark insert performance"""
         log_info(f"🔥 Benchmarking {num_records} records...")
         
+        # Build the rows up front so both timings measure only the database
+        rows = [(i, f"data_{i}") for i in range(num_records)]
+        insert_sql = "INSERT INTO test VALUES (?, ?)"
+        
         # Test standard sqlite3
         start_time = time.time()
         conn = sqlite3.connect(db_path + "_test_sqlite3")
-        cursor = conn.cursor()
-        cursor.execute("CREATE TABLE test (id INTEGER, data TEXT)")
-        
-        for i in range(num_records):
-            cursor.execute("INSERT INTO test VALUES (?, ?)", (i, f"data_{i}"))
-        
-        conn.commit()
+        conn.execute("CREATE TABLE test (id INTEGER, data TEXT)")
+        with conn:
+            conn.executemany(insert_sql, rows)
         conn.close()
         sqlite3_time = time.time() - start_time
         
@@ -130,18 +145,14 @@ class DatabaseBenchmark:
         start_time = time.time()
         opt_db = OptimizedDatabase(db_path + "_test_optimized")
         
-        statements = []
-        for i in range(num_records):
-            statements.append(
-                ("INSERT INTO test VALUES (?, ?)", (i, f"data_{i}"))
-            )
-        
         with opt_db.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("CREATE TABLE test (id INTEGER, data TEXT)")
             
-        opt_db.execute_batch(statements)
+        opt_db.execute_many(insert_sql, rows)
         optimized_time = time.time() - start_time
+        # Closing checkpoints the WAL so only the main file is left to remove
+        opt_db.close_all_connections()
         
         # Cleanup
         import os
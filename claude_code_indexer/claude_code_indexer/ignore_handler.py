@@ -59,6 +59,10 @@ class IgnoreHandler:
         self.root_dir = Path(root_dir).resolve()
         self.ignore_patterns: Set[str] = set()
         self.regex_patterns: List[re.Pattern] = []
+        # All regex_patterns as one alternation, plus exact-name lookups
+        self._combined_regex: Optional[re.Pattern] = None
+        self._ignored_names: Set[str] = set()
+        self._ignored_dir_names: Set[str] = set()
         
         # Add default patterns
         self.ignore_patterns.update(self.DEFAULT_IGNORE_PATTERNS)
@@ -106,11 +110,22 @@ class IgnoreHandler:
     
     def _compile_patterns(self):
         """Compile patterns into regex for efficient matching"""
+        regexes = []
         for pattern in self.ignore_patterns:
             # Convert glob patterns to regex
             regex = self._glob_to_regex(pattern)
             if regex:
+                regexes.append(regex)
                 self.regex_patterns.append(re.compile(regex))
+            
+            if pattern.endswith('/'):
+                self._ignored_dir_names.add(pattern[:-1])
+            elif '*' not in pattern:
+                self._ignored_names.add(pattern)
+        
+        # One match call per path instead of one per pattern
+        if regexes:
+            self._combined_regex = re.compile('|'.join(f'(?:{regex})' for regex in regexes))
     
     def _glob_to_regex(self, pattern: str) -> Optional[str]:
         """Convert a gitignore pattern to regex"""
@@ -153,26 +168,16 @@ class IgnoreHandler:
         path_str = str(relative_path).replace('\\', '/')
         
         # Check against compiled patterns
-        for regex in self.regex_patterns:
-            if regex.match(path_str):
-                return True
+        if self._combined_regex and self._combined_regex.match(path_str):
+            return True
         
-        # Check simple patterns with fnmatch
-        for pattern in self.ignore_patterns:
-            if not pattern.endswith('/') and not '*' in pattern:
-                # Simple file name match
-                if path.name == pattern:
-                    return True
-            
-            # Check if any parent directory matches a directory pattern
-            for parent in path.parents:
-                try:
-                    parent_relative = parent.relative_to(self.root_dir)
-                    parent_name = parent_relative.name
-                    if pattern.endswith('/') and parent_name == pattern[:-1]:
-                        return True
-                except ValueError:
-                    continue
+        # Simple file name match
+        if path.name in self._ignored_names:
+            return True
+        
+        # Check if any parent directory under root matches a directory pattern
+        if relative_path is not path:
+            return not self._ignored_dir_names.isdisjoint(relative_path.parts[:-1])
         
         return False
     
@@ -9,7 +9,7 @@ import sqlite3
 import json
 import time
 from pathlib import Path
-from typing import Dict, List, Tuple, Set, Optional, Any
+from typing import Callable, Dict, List, Tuple, Set, Optional, Any
 import networkx as nx
 import pandas as pd
 from ensmallen import Graph
@@ -113,6 +113,10 @@ class CodeGraphIndexer:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
+        # WAL persists in the file, so stats/query readers opened later are
+        # not blocked while a (background) index run rewrites the tables
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Run legacy migration for compatibility
         self._migrate_database_schema(cursor)
         
@@ -512,6 +516,8 @@ class CodeGraphIndexer:
         """Save nodes and relationships to SQLite database with error handling"""
         try:
             conn = sqlite3.connect(self.db_path)
+            # Safe under WAL: a crash can only lose the last commit, never corrupt
+            conn.execute("PRAGMA synchronous=NORMAL")
             cursor = conn.cursor()
         except sqlite3.Error as e:
             log_error(f"Error connecting to database: {e}")
@@ -1099,19 +1105,25 @@ class CodeGraphIndexer:
             self._llm_enhancer = LLMMetadataEnhancer(self.db_path)
         return self._llm_enhancer
     
-    def enhance_metadata(self, limit: Optional[int] = None, force_refresh: bool = False) -> Dict[str, Any]:
+    def enhance_metadata(self, limit: Optional[int] = None, force_refresh: bool = False,
+                         workers: Optional[int] = None,
+                         progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
         """
         Enhance metadata using LLM analysis
         
         Args:
             limit: Limit number of nodes to analyze
             force_refresh: Force re-analysis even if cached
+            workers: Number of nodes analyzed concurrently
+            progress_callback: Called with (completed, total) as each node finishes
             
         Returns:
             Analysis summary with statistics
         """
         log_info("🤖 Starting LLM-driven metadata enhancement...")
-        return self.llm_enhancer.analyze_codebase(limit=limit, force_refresh=force_refresh)
+        return self.llm_enhancer.analyze_codebase(limit=limit, force_refresh=force_refresh,
+                                                  max_workers=workers,
+                                                  progress_callback=progress_callback)
     
     def query_enhanced_nodes(self, 
                            architectural_layer: Optional[str] = None,
@@ -1229,7 +1241,9 @@ class CodeGraphIndexer:
             patch = int(parts[2]) if len(parts) > 2 else 0
             
             # Determine schema version based on features
-            if major >= 1 and minor >= 16:
+            if major >= 1 and minor >= 24:
+                return '1.24.0'  # Type-filtered ranking index
+            elif major >= 1 and minor >= 16:
                 return '1.16.0'  # Search optimizations and FTS5
             elif major >= 1 and minor >= 15:
                 return '1.15.0'  # Fixed enhanced_metadata schema
@@ -1243,4 +1257,4 @@ class CodeGraphIndexer:
                 return '1.0.0'   # Basic schema
         except Exception:
             # Default to latest schema version
-            return '1.16.0'
\ No newline at end of file
+            return '1.24.0'
\ No newline at end of file
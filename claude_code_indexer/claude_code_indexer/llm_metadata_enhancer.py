@@ -8,15 +8,25 @@ import asyncio
 import json
 import sqlite3
 import time
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import threading
 
 from .logger import log_info, log_warning, log_error
 
+# Node analysis is currently a local heuristic (CPU-bound under the GIL), so
+# the shared pool stays small; `cci enhance --workers` raises it per run
+DEFAULT_WORKERS = 3
+
+# Give up on the remaining nodes when none finishes within this many seconds
+NODE_ANALYSIS_TIMEOUT = 30
+
+# Analysis results are written in one transaction per this many nodes
+SAVE_BATCH_SIZE = 100
+
 
 @dataclass 
 class EnhancedMetadata:
@@ -67,11 +77,13 @@ class LLMMetadataEnhancer:
     - Proactive metadata updates
     """
     
-    def __init__(self, db_path: str, llm_provider: str = "anthropic"):
+    def __init__(self, db_path: str, llm_provider: str = "anthropic",
+                 max_workers: Optional[int] = None):
         self.db_path = db_path
         self.llm_provider = llm_provider
+        self.max_workers = max_workers or DEFAULT_WORKERS
         self._lock = threading.RLock()
-        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="LLMEnhancer")
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="LLMEnhancer")
         
         # Initialize database schema
         self._init_enhanced_schema()
@@ -157,16 +169,22 @@ class LLMMetadataEnhancer:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_code_evolution_node_id ON code_evolution(node_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_enhanced_metadata_role_tags ON enhanced_metadata(role_tags)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_enhanced_metadata_layer ON enhanced_metadata(architectural_layer)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_enhanced_metadata_criticality ON enhanced_metadata(criticality_level)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_enhanced_metadata_domain ON enhanced_metadata(business_domain)')
             
             conn.commit()
     
-    def analyze_codebase(self, limit: Optional[int] = None, force_refresh: bool = False) -> Dict[str, Any]:
+    def analyze_codebase(self, limit: Optional[int] = None, force_refresh: bool = False,
+                         max_workers: Optional[int] = None,
+                         progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
         """
         Analyze entire codebase with LLM enhancement
         
         Args:
             limit: Limit number of nodes to analyze
             force_refresh: Force re-analysis even if cached
+            max_workers: Concurrent node analyses (default: the enhancer's pool size)
+            progress_callback: Called with (completed, total) as each node finishes
             
         Returns:
             Analysis summary with statistics
@@ -183,8 +201,6 @@ class LLMMetadataEnhancer:
                 FROM code_nodes 
                 ORDER BY importance_score DESC
                 """
-                if limit:
-                    query += f" LIMIT {limit}"
             else:
                 query = """
                 SELECT cn.id, cn.node_type, cn.name, cn.path, cn.summary, cn.importance_score
@@ -193,10 +209,12 @@ class LLMMetadataEnhancer:
                 WHERE em.node_id IS NULL OR em.last_analyzed < datetime('now', '-7 days')
                 ORDER BY cn.importance_score DESC
                 """
-                if limit:
-                    query += f" LIMIT {limit}"
+            params = []
+            if limit:
+                query += " LIMIT ?"
+                params.append(limit)
             
-            cursor.execute(query)
+            cursor.execute(query, params)
             nodes_to_analyze = cursor.fetchall()
         
         if not nodes_to_analyze:
@@ -204,27 +222,58 @@ class LLMMetadataEnhancer:
         
         log_info(f"🔍 Analyzing {len(nodes_to_analyze)} nodes with LLM enhancement...")
         
-        # Process nodes in batches
-        batch_size = 10
+        # A one-off pool only when the caller asks for a different size
+        own_executor = None
+        executor = self._executor
+        if max_workers and max_workers != self.max_workers:
+            own_executor = executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                         thread_name_prefix="LLMEnhancer")
+        
         total_analyzed = 0
+        completed = 0
+        pending_results = []
         
-        for i in range(0, len(nodes_to_analyze), batch_size):
-            batch = nodes_to_analyze[i:i + batch_size]
-            
-            # Process batch in parallel
-            futures = []
-            for node_data in batch:
-                future = self._executor.submit(self._analyze_single_node, node_data)
-                futures.append(future)
+        timed_out = False
+        try:
+            futures = {executor.submit(self._build_enhanced_metadata, node_data): node_data
+                       for node_data in nodes_to_analyze}
+            
+            # Save as results arrive instead of waiting on fixed-size batches
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=NODE_ANALYSIS_TIMEOUT,
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    # Nothing finished for a whole timeout - the running nodes are stuck
+                    timed_out = True
+                    stuck = [futures[future][2] for future in pending if not future.cancel()]
+                    log_warning(f"Node analysis timed out after {NODE_ANALYSIS_TIMEOUT}s: "
+                                f"{', '.join(stuck)} ({len(pending) - len(stuck)} queued nodes skipped)")
+                    break
+                
+                for future in done:
+                    completed += 1
+                    try:
+                        result = future.result()
+                        if result:
+                            pending_results.append(result)
+                            total_analyzed += 1
+                    except Exception as e:
+                        log_warning(f"Node analysis failed: {e}")
+                    
+                    if len(pending_results) >= SAVE_BATCH_SIZE:
+                        self._save_analysis_results(pending_results)
+                        pending_results = []
+                    
+                    if progress_callback:
+                        progress_callback(completed, len(nodes_to_analyze))
             
-            # Wait for batch completion
-            for future in futures:
-                try:
-                    result = future.result(timeout=30)  # 30s timeout per node
-                    if result:
-                        total_analyzed += 1
-                except Exception as e:
-                    log_warning(f"Node analysis failed: {e}")
+            if pending_results:
+                self._save_analysis_results(pending_results)
+        finally:
+            if own_executor:
+                # Stuck threads can't be interrupted; don't wait on them
+                own_executor.shutdown(wait=not timed_out)
         
         duration = time.time() - start_time
         
@@ -241,7 +290,16 @@ class LLMMetadataEnhancer:
         return summary
     
     def _analyze_single_node(self, node_data: Tuple) -> Optional[EnhancedMetadata]:
-        """Analyze a single node with LLM"""
+        """Analyze a single node with LLM and save the result"""
+        result = self._build_enhanced_metadata(node_data)
+        if not result:
+            return None
+        
+        self._save_analysis_results([result])
+        return result[0]
+    
+    def _build_enhanced_metadata(self, node_data: Tuple) -> Optional[Tuple[EnhancedMetadata, List[Dict[str, Any]]]]:
+        """Analyze a single node with LLM, returning its metadata and detected patterns unsaved"""
         node_id, node_type, name, path, summary, importance_score = node_data
         
         try:
@@ -278,15 +336,7 @@ class LLMMetadataEnhancer:
                     last_analyzed=time.strftime("%Y-%m-%d %H:%M:%S")
                 )
                 
-                # Save to database
-                self._save_enhanced_metadata(enhanced_metadata)
-                
-                # Detect patterns
-                patterns = analysis_result.get("patterns", [])
-                for pattern in patterns:
-                    self._save_detected_pattern(node_id, pattern)
-                
-                return enhanced_metadata
+                return enhanced_metadata, analysis_result.get("patterns", [])
                 
         except Exception as e:
             log_error(f"Failed to analyze node {node_id}: {e}")
@@ -500,48 +550,71 @@ class LLMMetadataEnhancer:
             "is_dependency": True
         }
     
+    _METADATA_INSERT = '''
+    INSERT OR REPLACE INTO enhanced_metadata 
+    (node_id, llm_summary, role_tags, complexity_score, quality_metrics,
+     architectural_layer, business_domain, criticality_level, 
+     dependencies_impact, testability_score, last_analyzed, analysis_version)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    _PATTERN_INSERT = '''
+    INSERT INTO detected_patterns 
+    (node_id, pattern_type, confidence_score, implementation_details)
+    VALUES (?, ?, ?, ?)
+    '''
+    
+    @staticmethod
+    def _metadata_row(metadata: EnhancedMetadata) -> Tuple:
+        """Column values for an enhanced_metadata insert"""
+        return (
+            metadata.node_id,
+            metadata.llm_summary,
+            json.dumps(metadata.role_tags),
+            metadata.complexity_score,
+            json.dumps(metadata.quality_metrics),
+            metadata.architectural_layer,
+            metadata.business_domain,
+            metadata.criticality_level,
+            metadata.dependencies_impact,
+            metadata.testability_score,
+            metadata.last_analyzed,
+            metadata.analysis_version
+        )
+    
+    @staticmethod
+    def _pattern_row(node_id: int, pattern: Dict[str, Any]) -> Tuple:
+        """Column values for a detected_patterns insert"""
+        return (
+            node_id,
+            pattern["pattern_type"],
+            pattern.get("confidence", 0.0),
+            json.dumps(pattern)
+        )
+    
     def _save_enhanced_metadata(self, metadata: EnhancedMetadata):
         """Save enhanced metadata to database"""
         with self._lock:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                INSERT OR REPLACE INTO enhanced_metadata 
-                (node_id, llm_summary, role_tags, complexity_score, quality_metrics,
-                 architectural_layer, business_domain, criticality_level, 
-                 dependencies_impact, testability_score, last_analyzed, analysis_version)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    metadata.node_id,
-                    metadata.llm_summary,
-                    json.dumps(metadata.role_tags),
-                    metadata.complexity_score,
-                    json.dumps(metadata.quality_metrics),
-                    metadata.architectural_layer,
-                    metadata.business_domain,
-                    metadata.criticality_level,
-                    metadata.dependencies_impact,
-                    metadata.testability_score,
-                    metadata.last_analyzed,
-                    metadata.analysis_version
-                ))
+                conn.execute(self._METADATA_INSERT, self._metadata_row(metadata))
                 conn.commit()
     
     def _save_detected_pattern(self, node_id: int, pattern: Dict[str, Any]):
         """Save detected pattern to database"""
         with self._lock:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                INSERT INTO detected_patterns 
-                (node_id, pattern_type, confidence_score, implementation_details)
-                VALUES (?, ?, ?, ?)
-                ''', (
-                    node_id,
-                    pattern["pattern_type"],
-                    pattern.get("confidence", 0.0),
-                    json.dumps(pattern)
-                ))
+                conn.execute(self._PATTERN_INSERT, self._pattern_row(node_id, pattern))
+                conn.commit()
+    
+    def _save_analysis_results(self, results: List[Tuple[EnhancedMetadata, List[Dict[str, Any]]]]):
+        """Save analyzed nodes and their patterns in a single transaction"""
+        with self._lock:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(self._METADATA_INSERT,
+                                 [self._metadata_row(metadata) for metadata, _ in results])
+                conn.executemany(self._PATTERN_INSERT,
+                                 [self._pattern_row(metadata.node_id, pattern)
+                                  for metadata, patterns in results for pattern in patterns])
                 conn.commit()
     
     def _generate_analysis_summary(self) -> Dict[str, Any]:
@@ -653,21 +726,18 @@ class LLMMetadataEnhancer:
                 query += " AND em.complexity_score >= ?"
                 params.append(min_complexity)
             
-            query += " ORDER BY cn.importance_score DESC, em.complexity_score DESC"
-            query += f" LIMIT {limit}"
+            query += " ORDER BY cn.importance_score DESC, em.complexity_score DESC LIMIT ?"
+            params.append(limit)
             
             cursor.execute(query, params)
-            results = cursor.fetchall()
             
             # Convert to dictionaries
             columns = [desc[0] for desc in cursor.description]
-            nodes = []
-            for row in results:
-                node_dict = dict(zip(columns, row))
+            nodes = [dict(zip(columns, row)) for row in cursor]
+            for node_dict in nodes:
                 # Parse JSON fields
-                if node_dict.get('role_tags'):
+                if node_dict['role_tags']:
                     node_dict['role_tags'] = json.loads(node_dict['role_tags'])
-                nodes.append(node_dict)
             
             return nodes
     
@@ -0,0 +1,28 @@
+"""Migration to v1.24.0 - Add type-filtered ranking index."""
+
+from ..base_migration import BaseMigration
+
+
+class MigrationV1_24_0(BaseMigration):
+    """Add a composite index for top-N queries filtered by node type."""
+    
+    @property
+    def version(self) -> str:
+        return '1.24.0'
+    
+    @property
+    def description(self) -> str:
+        return 'Add node_type + importance_score index for filtered top-N queries'
+    
+    def up(self, conn) -> None:
+        """Apply migration - add composite ranking index."""
+        # `WHERE node_type = ? ORDER BY importance_score DESC LIMIT ?` (query/search
+        # with --type) walks this index in order instead of sorting every match
+        self.execute_sql(conn, """
+            CREATE INDEX IF NOT EXISTS idx_code_nodes_type_score
+            ON code_nodes(node_type, importance_score DESC)
+        """)
+    
+    def down(self, conn) -> None:
+        """Rollback migration - remove composite ranking index."""
+        self.execute_sql(conn, "DROP INDEX IF EXISTS idx_code_nodes_type_score")
@@ -6,10 +6,19 @@ Manages all project data in ~/.claude-code-indexer/
 
 import os
 import hashlib
+import shutil
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, FrozenSet, Iterable, Set, Union
 import json
 from datetime import datetime
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .logger import log_info, log_warning
 
 
@@ -32,25 +41,57 @@ class StorageManager:
         
         # Global metadata file
         self.metadata_file = self.app_home / 'projects.json'
+        self._batch_depth = 0
+        self._batch_dirty = False
+        # parent dir -> (its mtime_ns, names of existing entries) for grouped checks
+        self._dir_entries_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        # Lower-cased project name -> project ID, built lazily
+        self._name_index: Optional[Dict[str, str]] = None
+        # (projects.json mtime_ns, stats) from the last full directory walk
+        self._stats_cache: Optional[Tuple[int, Dict]] = None
         self._load_metadata()
     
     def _load_metadata(self):
         """Load project metadata from file"""
         if self.metadata_file.exists():
-            with open(self.metadata_file, 'r') as f:
-                self.metadata = json.load(f)
+            if ORJSON_AVAILABLE:
+                self.metadata = orjson.loads(self.metadata_file.read_bytes())
+            else:
+                with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                    self.metadata = json.load(f)
         else:
             self.metadata = {
                 'version': '1.0',
                 'projects': {},
                 'last_updated': None
             }
+        self._name_index = None
     
     def _save_metadata(self):
         """Save project metadata to file"""
+        if self._batch_depth:
+            # Inside batch_update() - persist once when the batch exits
+            self._batch_dirty = True
+            return
+        
         self.metadata['last_updated'] = datetime.now().isoformat()
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=2)
+        if ORJSON_AVAILABLE:
+            self.metadata_file.write_bytes(orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.metadata_file, 'w', encoding='utf-8') as f:
+                json.dump(self.metadata, f, indent=2)
+    
+    @contextmanager
+    def batch_update(self):
+        """Group metadata changes so projects.json is written once on exit"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._save_metadata()
     
     def get_project_id(self, project_path: Path) -> str:
         """Generate unique project ID from path"""
@@ -58,10 +99,12 @@ class StorageManager:
         abs_path = project_path.resolve()
         
         # Create hash from absolute path
-        path_str = str(abs_path)
-        project_id = hashlib.md5(path_str.encode()).hexdigest()[:12]
-        
-        return project_id
+        return self._hash_path(str(abs_path))
+    
+    @staticmethod
+    def _hash_path(path_str: str) -> str:
+        """Hash a normalized absolute path string into a project ID"""
+        return hashlib.md5(path_str.encode()).hexdigest()[:12]
     
     def get_project_dir(self, project_path: Path) -> Path:
         """Get storage directory for a project"""
@@ -80,12 +123,21 @@ class StorageManager:
                 'last_indexed': None,
                 'stats': {}
             }
+            self._name_index = None
             self._save_metadata()
         
         return project_dir
     
-    def get_database_path(self, project_path: Path) -> Path:
-        """Get database file path for a project"""
+    def get_database_path(self, project_path: Path, create: bool = True) -> Path:
+        """Get database file path for a project
+        
+        Args:
+            project_path: Project source path
+            create: Register the project and create its storage directory;
+                pass False to only compute the path (e.g. to check it exists)
+        """
+        if not create:
+            return self.projects_dir / self.get_project_id(project_path) / 'code_index.db'
         project_dir = self.get_project_dir(project_path)
         return project_dir / 'code_index.db'
     
@@ -96,24 +148,31 @@ class StorageManager:
         cache_dir.mkdir(exist_ok=True)
         return cache_dir
     
-    def list_projects(self) -> List[Dict]:
-        """List all indexed projects"""
+    def list_projects(self, with_sizes: bool = False) -> List[Dict]:
+        """List all indexed projects
+        
+        Args:
+            with_sizes: Also report each project's total on-disk size (db +
+                cache) as 'total_size'; this walks every project directory, so
+                only callers that show storage totals should ask for it
+        """
         projects = []
+        existing = self._existing_paths(info['path'] for info in self.metadata['projects'].values())
         
         for project_id, info in self.metadata['projects'].items():
             project_info = info.copy()
             project_info['id'] = project_id
             
             # Check if project still exists
-            project_path = Path(info['path'])
-            project_info['exists'] = project_path.exists()
+            project_info['exists'] = info['path'] in existing
             
             # Get database size
-            db_path = self.projects_dir / project_id / 'code_index.db'
-            if db_path.exists():
-                project_info['db_size'] = db_path.stat().st_size
-            else:
-                project_info['db_size'] = 0
+            project_dir = self.projects_dir / project_id
+            db_path = project_dir / 'code_index.db'
+            project_info['db_size'] = db_path.stat().st_size if db_path.exists() else 0
+            
+            if with_sizes:
+                project_info['total_size'] = _dir_size(project_dir)
             
             projects.append(project_info)
         
@@ -128,33 +187,83 @@ class StorageManager:
             self.metadata['projects'][project_id]['last_indexed'] = datetime.now().isoformat()
             self._save_metadata()
     
-    def remove_project(self, project_path: Path) -> bool:
-        """Remove a project from storage"""
-        project_id = self.get_project_id(project_path)
+    def remove_project(self, project_path: Union[str, Path], project_id: Optional[str] = None) -> bool:
+        """Remove a project from storage
+        
+        Args:
+            project_path: Project source path (str or Path)
+            project_id: Already-known project ID (e.g. from find_project());
+                skips parsing, re-resolving and re-hashing project_path
+        """
+        if project_id is None:
+            project_id = self.get_project_id(Path(project_path))
+        return self._remove_project_by_id(project_id)
+    
+    def _remove_project_by_id(self, project_id: str) -> bool:
+        """Remove a project's storage directory and metadata entry"""
         project_dir = self.projects_dir / project_id
         
         # Remove directory
         if project_dir.exists():
-            import shutil
             shutil.rmtree(project_dir)
             
         # Remove from metadata
         if project_id in self.metadata['projects']:
             del self.metadata['projects'][project_id]
+            self._name_index = None
             self._save_metadata()
             return True
         
         return False
     
     def find_project_by_name(self, name: str) -> Optional[Dict]:
-        """Find project by name (partial match)"""
+        """Find project by name (exact match first, then partial match)"""
+        return self._find_by_exact_name(name) or self._find_by_partial_match(name)
+    
+    def find_project(self, name_or_path: str) -> Optional[Dict]:
+        """Find project by name (partial match) or by its source path
+        
+        The O(1) lookups (exact name, absolute path) run before the linear
+        partial-match scan and symlink resolution, so the common cases and
+        unknown projects return without touching every metadata entry twice.
+        """
+        # Stored paths are already absolute, so hash os.path.abspath before
+        # paying for symlink resolution (an lstat per path component)
+        abs_path = os.path.abspath(name_or_path)
+        return (
+            self._find_by_exact_name(name_or_path)
+            or self._get_project_info(self._hash_path(abs_path))
+            or self._find_by_partial_match(name_or_path)
+            or self._get_project_info(self.get_project_id(Path(abs_path)))
+        )
+    
+    def _get_project_info(self, project_id: str) -> Optional[Dict]:
+        """Copy of a project's metadata with its 'id', or None if unknown"""
+        info = self.metadata['projects'].get(project_id)
+        if info is None:
+            return None
+        
+        project_info = info.copy()
+        project_info['id'] = project_id
+        return project_info
+    
+    def _find_by_exact_name(self, name: str) -> Optional[Dict]:
+        """Look a project up by exact (case-insensitive) name"""
+        if self._name_index is None:
+            self._name_index = {}
+            for project_id, info in self.metadata['projects'].items():
+                self._name_index.setdefault(info['name'].lower(), project_id)
+        
+        project_id = self._name_index.get(name.lower())
+        return self._get_project_info(project_id) if project_id is not None else None
+    
+    def _find_by_partial_match(self, name: str) -> Optional[Dict]:
+        """Find the first project whose name or path contains name"""
         name_lower = name.lower()
         
         for project_id, info in self.metadata['projects'].items():
             if name_lower in info['name'].lower() or name_lower in info['path'].lower():
-                project_info = info.copy()
-                project_info['id'] = project_id
-                return project_info
+                return self._get_project_info(project_id)
         
         return None
     
@@ -165,34 +274,111 @@ class StorageManager:
     def clean_orphaned_projects(self):
         """Remove projects whose source directories no longer exist"""
         removed = []
+        existing = self._existing_paths(info['path'] for info in self.metadata['projects'].values())
         
-        for project_id, info in list(self.metadata['projects'].items()):
-            project_path = Path(info['path'])
-            if not project_path.exists():
-                project_dir = self.projects_dir / project_id
-                if project_dir.exists():
-                    import shutil
-                    shutil.rmtree(project_dir)
-                del self.metadata['projects'][project_id]
-                removed.append(info['path'])
+        with self.batch_update():
+            for project_id, info in list(self.metadata['projects'].items()):
+                if info['path'] not in existing:
+                    self._remove_project_by_id(project_id)
+                    removed.append(info['path'])
         
         if removed:
-            self._save_metadata()
             log_info(f"🗑️  Removed {len(removed)} orphaned projects")
         
         return removed
     
-    def get_storage_stats(self) -> Dict:
-        """Get overall storage statistics"""
-        total_size = 0
-        project_count = len(self.metadata['projects'])
+    def _existing_paths(self, paths: Iterable[str]) -> Set[str]:
+        """Return the subset of project paths that exist
+        
+        Projects usually share a few parent directories (e.g. ~/src), so a
+        parent holding several projects is listed with one scandir instead of
+        a stat per project. Listings are cached on the parent's mtime, so a
+        long-lived caller (the background service) re-lists a parent only after
+        projects are added to or removed from it; single-project parents are
+        checked with a plain exists().
+        """
+        by_parent = defaultdict(list)
+        for path in paths:
+            by_parent[os.path.dirname(path)].append(path)
         
-        for project_dir in self.projects_dir.iterdir():
-            if project_dir.is_dir():
-                for file in project_dir.rglob('*'):
-                    if file.is_file():
-                        total_size += file.stat().st_size
+        existing = set()
+        for parent, children in by_parent.items():
+            if len(children) == 1:
+                if os.path.exists(children[0]):
+                    existing.add(children[0])
+                continue
+            
+            try:
+                parent_mtime = os.stat(parent).st_mtime_ns
+            except OSError:
+                continue
+            
+            cached = self._dir_entries_cache.get(parent)
+            if cached is not None and cached[0] == parent_mtime:
+                names = cached[1]
+            else:
+                try:
+                    with os.scandir(parent) as entries:
+                        # Dangling symlinks are listed but do not exist
+                        names = frozenset(
+                            entry.name for entry in entries
+                            if not entry.is_symlink() or os.path.exists(entry.path)
+                        )
+                except OSError:
+                    continue
+                self._dir_entries_cache[parent] = (parent_mtime, names)
+            
+            # Names are matched exactly, so confirm misses (e.g. a stored path
+            # whose case differs on a case-insensitive filesystem) with exists()
+            existing.update(
+                path for path in children
+                if os.path.basename(path) in names or os.path.exists(path)
+            )
         
+        return existing
+    
+    def get_storage_stats(self, precomputed: Optional[Dict] = None) -> Dict:
+        """Get overall storage statistics
+        
+        Args:
+            precomputed: Optional {'total_size': int} summed by the caller over
+                list_projects(with_sizes=True); only storage directories with no
+                registered project are walked to complete the total
+        """
+        if precomputed is not None:
+            registered = self.metadata['projects']
+            orphan_size = sum(
+                _dir_size(project_dir)
+                for project_dir in self.projects_dir.iterdir()
+                if project_dir.is_dir() and project_dir.name not in registered
+            )
+            return self._build_storage_stats(len(registered), precomputed['total_size'] + orphan_size)
+        
+        # Indexing rewrites projects.json via update_project_stats(), so an
+        # unchanged mtime means the last walk is still current
+        metadata_mtime = self._metadata_mtime()
+        if metadata_mtime is not None and self._stats_cache and self._stats_cache[0] == metadata_mtime:
+            return dict(self._stats_cache[1])
+        
+        total_size = sum(
+            _dir_size(project_dir)
+            for project_dir in self.projects_dir.iterdir()
+            if project_dir.is_dir()
+        )
+        stats = self._build_storage_stats(len(self.metadata['projects']), total_size)
+        if metadata_mtime is not None:
+            self._stats_cache = (metadata_mtime, stats)
+        return dict(stats)
+    
+    def _metadata_mtime(self) -> Optional[int]:
+        """projects.json mtime_ns, or None if it can't be read"""
+        try:
+            return self.metadata_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _build_storage_stats(self, project_count: int, total_size: int) -> Dict:
+        """Assemble the storage stats dict"""
         return {
             'app_home': str(self.app_home),
             'project_count': project_count,
@@ -201,6 +387,23 @@ class StorageManager:
         }
 
 
+def _dir_size(path: Path) -> int:
+    """Sum file sizes under path using a single os.scandir walk"""
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
 # Global instance
 _storage_manager = None
 
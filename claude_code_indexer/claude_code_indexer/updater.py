@@ -3,11 +3,13 @@
 Auto-update functionality for Claude Code Indexer
 """
 
-import requests
 import json
+import os
 import subprocess
 import sys
+import time
 from pathlib import Path
+from typing import Optional
 from packaging import version
 from rich.console import Console
 
@@ -25,19 +27,25 @@ class Updater:
     def __init__(self):
         self.current_version = __version__
         
+    def fetch_latest_version(self) -> str:
+        """Fetch the latest released version from PyPI (raises on failure)"""
+        # requests is slow to import and only needed once the on-disk cache misses
+        import requests
+        response = requests.get(self.PYPI_URL, timeout=5)
+        response.raise_for_status()
+        
+        data = response.json()
+        return data["info"]["version"]
+    
+    def is_newer(self, latest_version: str) -> bool:
+        """Check whether latest_version is newer than the running version"""
+        return version.parse(latest_version) > version.parse(self.current_version)
+    
     def check_for_updates(self) -> tuple[bool, str]:
         """Check if a newer version is available on PyPI"""
         try:
-            response = requests.get(self.PYPI_URL, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            latest_version = data["info"]["version"]
-            
-            if version.parse(latest_version) > version.parse(self.current_version):
-                return True, latest_version
-            
-            return False, latest_version
+            latest_version = self.fetch_latest_version()
+            return self.is_newer(latest_version), latest_version
             
         except Exception as e:
             console.print(f"[yellow]Warning: Could not check for updates: {e}[/yellow]")
@@ -149,15 +157,118 @@ class Updater:
             return False
 
 
-def check_and_notify_update():
-    """Check for updates and notify user (non-blocking)"""
+# Re-check PyPI at most once per day
+UPDATE_CHECK_TTL = 24 * 60 * 60
+
+
+def _update_check_cache_file() -> Path:
+    """Location of the cached PyPI version lookup"""
+    return Path.home() / ".claude-code-indexer" / "update_check.json"
+
+
+def _read_update_cache() -> Optional[dict]:
+    """Return the cached PyPI lookup if it is still fresh, else None
+    
+    A fresh entry whose latest_version is None records a failed (or still
+    running) lookup, so callers know not to retry until the TTL expires.
+    """
+    cache_file = _update_check_cache_file()
+    try:
+        if time.time() - cache_file.stat().st_mtime >= UPDATE_CHECK_TTL:
+            return None
+        with open(cache_file, 'r') as f:
+            entry = json.load(f)
+        return entry if isinstance(entry, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_latest_version(latest_version: Optional[str]):
+    """Atomically store the latest version lookup (tmp file + rename)
+    
+    None records an attempt without a result, which still starts a new TTL.
+    """
+    cache_file = _update_check_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump({"latest_version": latest_version, "checked_at": time.time()}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def refresh_update_cache():
+    """Fetch the latest version from PyPI and store it in the on-disk cache
+    
+    Failures are cached too, so an offline machine waits out the TTL instead
+    of retrying (and timing out) on every command.
+    """
+    try:
+        latest_version = Updater().fetch_latest_version()
+    except Exception:
+        _write_cached_latest_version(None)
+        raise
+    _write_cached_latest_version(latest_version)
+    return latest_version
+
+
+def _spawn_update_refresh():
+    """Run refresh_update_cache() in a detached child process
+    
+    The child outlives the CLI command, so a slow PyPI response neither delays
+    the command nor gets cut off when the command exits.
+    """
+    subprocess.Popen(
+        [sys.executable, "-m", "claude_code_indexer.updater"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def check_and_notify_update(refresh_in_background: bool = False):
+    """Check for updates and notify user (non-blocking)
+    
+    The PyPI lookup is cached on disk for UPDATE_CHECK_TTL seconds, so most
+    invocations only compare version strings.
+    
+    Args:
+        refresh_in_background: On a cache miss, refresh the cache from a
+            detached process and return without a notice instead of querying
+            PyPI in-process
+    """
     try:
         updater = Updater()
-        has_update, latest_version = updater.check_for_updates()
+        cached = _read_update_cache()
+        if cached is None:
+            if refresh_in_background:
+                # Claim the refresh first so commands run while the child is
+                # still waiting on PyPI don't spawn refreshes of their own
+                _write_cached_latest_version(None)
+                _spawn_update_refresh()
+                return
+            latest_version = refresh_update_cache()
+        else:
+            latest_version = cached.get("latest_version")
+            if not latest_version:
+                # Last lookup failed or is still running - wait for the TTL
+                return
+        has_update = updater.is_newer(latest_version)
         
         if has_update:
             console.print(f"\n💡 [yellow]Update available: {latest_version} (current: {updater.current_version})[/yellow]")
             console.print("   Run [bold]claude-code-indexer update[/bold] to upgrade\n")
     except:
         # Silently fail - don't interrupt user's workflow
-        pass
\ No newline at end of file
+        pass
+
+
+if __name__ == "__main__":
+    # Entry point for _spawn_update_refresh()
+    try:
+        refresh_update_cache()
+    except Exception:
+        sys.exit(1)
@@ -276,7 +276,7 @@ def run_command(cli_runner, context, command):
             mock_storage_instance.get_database_path.return_value = Path(default_dir) / "code_index.db"
         
         # Mock other dependencies as needed
-        with patch('claude_code_indexer.cli.CodeGraphIndexer') as mock_indexer, \
+        with patch('claude_code_indexer.cli_common.CodeGraphIndexer') as mock_indexer, \
              patch('claude_code_indexer.cli.os.path.exists') as mock_exists, \
              patch('claude_code_indexer.cache_manager.CacheManager') as mock_cache_manager:
             
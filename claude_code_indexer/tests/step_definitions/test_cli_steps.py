@@ -362,7 +362,7 @@ def run_command(cli_runner, context, command):
         ]
         
         # Mock other dependencies as needed
-        with patch('claude_code_indexer.cli.CodeGraphIndexer') as mock_indexer, \
+        with patch('claude_code_indexer.cli_common.CodeGraphIndexer') as mock_indexer, \
              patch('claude_code_indexer.cli.os.path.exists') as mock_exists, \
              patch('claude_code_indexer.cache_manager.CacheManager') as mock_cache_manager:
             
@@ -258,6 +258,22 @@ class TestBackgroundIndexingServiceSimple:
         assert isinstance(status, dict)
         assert 'running' in status or 'enabled' in status or len(status) >= 1
     
+    def test_get_status_uses_listed_existence(self):
+        """Test status trusts list_projects' exists flag instead of re-statting"""
+        self.mock_storage.list_projects.return_value = [
+            {"path": "/projects/kept", "exists": True},
+            {"path": "/projects/gone", "exists": False},
+        ]
+        
+        with patch.object(Path, 'exists', autospec=True, return_value=False) as mock_exists:
+            status = self.service.get_status()
+            to_index = self.service._get_projects_to_index()
+        
+        checked = [str(call.args[0]) for call in mock_exists.call_args_list]
+        assert not [path for path in checked if path.startswith("/projects")]
+        assert list(status['projects']) == ["/projects/kept"]
+        assert "/projects/gone" not in to_index
+    
     def test_signal_handler_no_exit(self):
         """Test signal handling without sys.exit"""
         original_running = self.service.running
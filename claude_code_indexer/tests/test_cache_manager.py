@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test cases for CacheManager
+"""
+
+import sqlite3
+import time
+import pytest
+
+from claude_code_indexer.cache_manager import CacheManager, IncrementalIndexer
+
+
+class TestCacheManager:
+    """Test disk cache usage tracking and eviction"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a disk-only cache manager in a temp directory"""
+        return CacheManager(cache_dir=str(tmp_path / "cache"), enable_memory_cache=False)
+
+    def _cache_file(self, cache, path, payload_size):
+        """Write a source file and cache a result of roughly payload_size bytes"""
+        path.write_text("x = 1\n")
+        cache.cache_file_result(str(path), {'n': 'x' * payload_size}, [], [], {}, {})
+        return str(path)
+
+    def _cached_paths(self, cache):
+        conn = sqlite3.connect(str(cache.cache_db))
+        paths = {row[0] for row in conn.execute("SELECT file_path FROM file_cache")}
+        conn.close()
+        return paths
+
+    def test_loading_cached_results_records_hits(self, cache, tmp_path):
+        """Test cache loads bump hits and last_access in one pass"""
+        path = self._cache_file(cache, tmp_path / "a.py", 10)
+
+        IncrementalIndexer(cache).load_cached_results([path])
+
+        conn = sqlite3.connect(str(cache.cache_db))
+        hits, last_access, cached_at = conn.execute(
+            "SELECT hits, last_access, cached_at FROM file_cache").fetchone()
+        conn.close()
+        assert hits == 1
+        assert last_access >= cached_at
+
+    def test_clear_cache_keeps_recently_used_entries(self, cache, tmp_path):
+        """Test the age cutoff applies to last use, not to when an entry was cached"""
+        path = self._cache_file(cache, tmp_path / "a.py", 10)
+        conn = sqlite3.connect(str(cache.cache_db))
+        with conn:
+            conn.execute("UPDATE file_cache SET cached_at = ?, last_access = ?",
+                         (time.time() - 90 * 24 * 3600, time.time()))
+        conn.close()
+
+        cache.clear_cache(older_than_days=30)
+
+        assert self._cached_paths(cache) == {path}
+
+    def test_clear_cache_evicts_cold_large_entries_first(self, cache, tmp_path):
+        """Test a size budget drops the large unused entry before small hot ones"""
+        large = self._cache_file(cache, tmp_path / "large.py", 200_000)
+        small = [self._cache_file(cache, tmp_path / f"s{i}.py", 1_000) for i in range(5)]
+        cache.record_hits(small)
+
+        cache.clear_cache(older_than_days=30, max_size_mb=0.1)
+
+        assert self._cached_paths(cache) == set(small)
+
+    def test_clear_cache_without_budget_keeps_everything_fresh(self, cache, tmp_path):
+        """Test no size eviction happens unless max_size_mb is given"""
+        paths = {self._cache_file(cache, tmp_path / f"f{i}.py", 50_000) for i in range(3)}
+
+        cache.clear_cache(older_than_days=30)
+
+        assert self._cached_paths(cache) == paths
+
+    def test_old_cache_database_gains_usage_columns(self, tmp_path):
+        """Test a cache database from before usage tracking is upgraded in place"""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        conn = sqlite3.connect(str(cache_dir / "file_cache.db"))
+        conn.execute("""
+            CREATE TABLE file_cache (
+                file_path TEXT PRIMARY KEY, file_hash TEXT NOT NULL,
+                last_modified REAL NOT NULL, file_size INTEGER NOT NULL,
+                cached_at REAL NOT NULL, cache_data BLOB NOT NULL
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+        cache = CacheManager(cache_dir=str(cache_dir), enable_memory_cache=False)
+
+        conn = sqlite3.connect(str(cache.cache_db))
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(file_cache)")}
+        conn.close()
+        assert {'hits', 'last_access'} <= columns
@@ -10,7 +10,7 @@ import pytest
 import tempfile
 import shutil
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import Mock, patch, MagicMock, PropertyMock, call
 from click.testing import CliRunner
 import json
 
@@ -43,7 +43,7 @@ class TestCLI:
     @pytest.fixture
     def mock_indexer(self):
         """Mock CodeGraphIndexer"""
-        with patch('claude_code_indexer.cli.CodeGraphIndexer') as mock:
+        with patch('claude_code_indexer.cli_common.CodeGraphIndexer') as mock:
             yield mock
     
     def test_cli_version(self, runner):
@@ -71,6 +71,21 @@ class TestCLI:
             assert __app_name__ in str(calls[0])
             assert __version__ in str(calls[0])
     
+    @pytest.mark.parametrize("args,env", [(['--quiet'], {}), ([], {'CCI_QUIET': '1'})])
+    def test_quiet_skips_app_header(self, runner, args, env):
+        """Test --quiet and CCI_QUIET suppress the banner"""
+        mock_module = Mock()
+        mock_module.get_background_service.return_value.get_status.return_value = {
+            'enabled': True, 'running': False, 'projects': {}, 'default_interval': 3600
+        }
+        
+        with patch.dict('sys.modules', {'claude_code_indexer.background_service': mock_module}):
+            result = runner.invoke(cli, args + ['background', 'status'], env=env)
+        
+        assert result.exit_code == 0
+        assert __app_name__ not in result.output
+        assert 'enabled' in result.output.lower()
+    
     def test_init_command_new_project(self, runner, temp_dir):
         """Test init command in new project"""
         with runner.isolated_filesystem(temp_dir=temp_dir):
@@ -141,6 +156,25 @@ class TestCLI:
                 content = f.read()
                 assert "New template" in content
                 assert "Keep this" in content
+                assert "Old" not in content
+                assert content.index("## Other Section") < content.index("New template")
+    
+    def test_init_command_gitignore(self, runner, temp_dir):
+        """Test init appends code_index.db to .gitignore exactly once"""
+        with runner.isolated_filesystem(temp_dir=temp_dir):
+            Path("CLAUDE.md").write_text("# Existing\n")
+            Path(".gitignore").write_text("*.pyc")
+            
+            result = runner.invoke(cli, ['init'])
+            
+            assert result.exit_code == 0
+            assert "Added code_index.db to .gitignore" in result.output
+            assert Path(".gitignore").read_text() == "*.pyc\n# Claude Code Indexer\ncode_index.db\n"
+            
+            result = runner.invoke(cli, ['init', '--force'])
+            
+            assert result.exit_code == 0
+            assert Path(".gitignore").read_text().count("code_index.db") == 1
     
     def test_index_command_basic(self, runner, temp_dir, mock_indexer):
         """Test basic index command"""
@@ -195,6 +229,7 @@ class TestCLI:
                 # Use unique db path for this test
                 db_path = Path(temp_dir) / 'test_query.db'
                 mock_instance.db_path = db_path
+                mock_storage.return_value.get_database_path.return_value = db_path
                 
                 # Mock query_important_nodes method  
                 mock_instance.query_important_nodes.return_value = [
@@ -227,6 +262,7 @@ class TestCLI:
                 # Use unique db path for this test
                 db_path = Path(temp_dir) / 'test_query_important.db'
                 mock_instance.db_path = db_path
+                mock_storage.return_value.get_database_path.return_value = db_path
                 
                 # Mock query_important_nodes method
                 mock_instance.query_important_nodes.return_value = [
@@ -260,6 +296,7 @@ class TestCLI:
                 # Use unique db path for this test
                 db_path = Path(temp_dir) / 'test_search.db'
                 mock_instance.db_path = db_path
+                mock_storage.return_value.get_database_path.return_value = db_path
                 
                 # Create actual database for search functionality
                 import sqlite3
@@ -283,6 +320,112 @@ class TestCLI:
                 assert result.exit_code == 0
                 assert 'search_test' in result.output
     
+    def test_search_command_uses_fts(self, runner, temp_dir, mock_indexer):
+        """Test search goes through code_nodes_fts when the table exists"""
+        with runner.isolated_filesystem(temp_dir=temp_dir):
+            with patch('claude_code_indexer.storage_manager.get_storage_manager') as mock_storage:
+                mock_storage.return_value.get_project_from_cwd.return_value = Path('.')
+                
+                mock_instance = Mock()
+                mock_indexer.return_value = mock_instance
+                db_path = Path(temp_dir) / 'test_search_fts.db'
+                mock_instance.db_path = db_path
+                mock_storage.return_value.get_database_path.return_value = db_path
+                
+                import sqlite3
+                conn = sqlite3.connect(str(db_path))
+                cursor = conn.cursor()
+                cursor.execute('''CREATE TABLE code_nodes (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT,
+                    node_type TEXT,
+                    path TEXT,
+                    summary TEXT,
+                    importance_score REAL,
+                    relevance_tags TEXT
+                )''')
+                cursor.execute("CREATE VIRTUAL TABLE code_nodes_fts USING fts5(name, path, summary, content='code_nodes', content_rowid='id')")
+                cursor.execute("INSERT INTO code_nodes VALUES (1, 'authenticate_user', 'function', 'auth.py', 'Check login', 0.9, '[]')")
+                cursor.execute("INSERT INTO code_nodes VALUES (2, 'AuthService', 'class', 'service.py', 'Service', 0.5, '[]')")
+                # Only row 1 is in the FTS index, so a hit proves the MATCH path ran
+                cursor.execute("INSERT INTO code_nodes_fts(rowid, name, path, summary) VALUES (1, 'authenticate_user', 'auth.py', 'Check login')")
+                conn.commit()
+                conn.close()
+                
+                result = runner.invoke(cli, ['search', 'authen', 'login', '--mode', 'all'])
+                
+                assert result.exit_code == 0
+                assert 'authenticate_user' in result.output
+                assert 'AuthService' not in result.output
+    
+    def test_search_fts_matches_words_not_camelcase_fragments(self, runner, temp_dir, mock_indexer):
+        """Test FTS search matches word prefixes and only falls back to substrings on no hits"""
+        with patch('claude_code_indexer.storage_manager.get_storage_manager') as mock_storage:
+            mock_storage.return_value.get_project_from_cwd.return_value = Path(temp_dir)
+            db_path = Path(temp_dir) / 'test_search_camelcase.db'
+            mock_storage.return_value.get_database_path.return_value = db_path
+            
+            import sqlite3
+            conn = sqlite3.connect(str(db_path))
+            conn.execute('''CREATE TABLE code_nodes (
+                id INTEGER PRIMARY KEY,
+                name TEXT,
+                node_type TEXT,
+                path TEXT,
+                summary TEXT,
+                importance_score REAL,
+                relevance_tags TEXT
+            )''')
+            # Same tokenizer as migration 1.16.0
+            conn.execute("CREATE VIRTUAL TABLE code_nodes_fts USING fts5(name, path, summary, content='code_nodes', content_rowid='id', tokenize='porter unicode61')")
+            conn.execute("INSERT INTO code_nodes VALUES (1, 'load_user', 'function', 'users.py', 'Load one', 0.5, '[]')")
+            conn.execute("INSERT INTO code_nodes VALUES (2, 'getUserName', 'method', 'api.py', 'Name lookup', 0.9, '[]')")
+            conn.execute("INSERT INTO code_nodes_fts(rowid, name, path, summary) SELECT id, name, path, summary FROM code_nodes")
+            conn.commit()
+            conn.close()
+            
+            # 'User' is a word in load_user but only a fragment of getUserName
+            result = runner.invoke(cli, ['search', 'User', '--plain'])
+            assert result.exit_code == 0
+            assert 'load_user' in result.output
+            assert 'getUserName' not in result.output
+            
+            # No word starts with 'UserName', so the substring fallback finds it
+            result = runner.invoke(cli, ['search', 'UserName', '--plain'])
+            assert result.exit_code == 0
+            assert 'getUserName' in result.output
+    
+    def test_query_without_database_skips_indexer(self, runner, temp_dir, mock_indexer):
+        """Test a missing database is reported before any indexer is created"""
+        with patch('claude_code_indexer.storage_manager.get_storage_manager') as mock_storage:
+            mock_storage.return_value.get_project_from_cwd.return_value = Path(temp_dir)
+            mock_storage.return_value.get_database_path.return_value = Path(temp_dir) / 'missing.db'
+            
+            for command in (['query'], ['search', 'auth'], ['stats']):
+                result = runner.invoke(cli, command)
+                
+                assert result.exit_code == 1
+                assert "Database not found" in result.output
+            
+            mock_indexer.assert_not_called()
+            mock_storage.return_value.get_database_path.assert_called_with(Path(temp_dir), create=False)
+    
+    def test_background_set_interval_for_project(self, runner, temp_dir):
+        """Test set-interval resolves the --project path it is given"""
+        mock_service = Mock()
+        background_service = Mock(get_background_service=mock_service)
+        with patch.dict('sys.modules', {'claude_code_indexer.background_service': background_service}):
+            result = runner.invoke(cli, ['background', 'set-interval', '--project', temp_dir, '--interval', '60'])
+            
+            assert result.exit_code == 0
+            mock_service.return_value.set_project_interval.assert_called_once_with(
+                str(Path(temp_dir).resolve()), 60
+            )
+            
+            result = runner.invoke(cli, ['background', 'set-interval', '--project', str(Path(temp_dir) / 'missing')])
+            
+            assert "Project path does not exist" in result.output
+    
     def test_stats_command(self, runner, temp_dir, mock_indexer):
         """Test stats command"""
         with runner.isolated_filesystem(temp_dir=temp_dir):
@@ -295,6 +438,7 @@ class TestCLI:
                 # Use unique db path for this test
                 db_path = Path(temp_dir) / 'test_stats.db'
                 mock_instance.db_path = db_path
+                mock_storage.return_value.get_database_path.return_value = db_path
                 
                 # Mock get_stats to return proper dict with string values
                 mock_instance.get_stats.return_value = {
@@ -337,6 +481,25 @@ class TestCLI:
                 assert result.exit_code == 0
                 # Check that stats were displayed
                 assert 'nodes' in result.output.lower() or 'statistics' in result.output.lower()
+                assert 'Node Types' in result.output
+                assert 'calls' in result.output
+    
+    def test_stats_cache_reuses_indexer_cache(self, runner, temp_dir, mock_indexer):
+        """Test stats --cache reports through the indexer's own cache manager"""
+        with patch('claude_code_indexer.storage_manager.get_storage_manager') as mock_storage:
+            db_path = Path(temp_dir) / 'stats_cache.db'
+            db_path.touch()
+            mock_storage.return_value.get_project_from_cwd.return_value = Path(temp_dir)
+            mock_storage.return_value.get_database_path.return_value = db_path
+            mock_instance = mock_indexer.return_value
+            mock_instance.get_stats.return_value = {}
+            
+            with patch('claude_code_indexer.cache_manager.CacheManager') as mock_cache_manager:
+                result = runner.invoke(cli, ['stats', '--cache'])
+            
+            assert result.exit_code == 0
+            mock_instance.cache_manager.print_cache_stats.assert_called_once()
+            mock_cache_manager.assert_not_called()
     
     def test_enhance_command(self, runner, temp_dir, mock_indexer):
         """Test enhance command"""
@@ -352,6 +515,64 @@ class TestCLI:
                 
                 assert result.exit_code == 0
                 mock_instance.enhance_metadata.assert_called_once()
+                # Metadata commands never touch the file cache
+                assert mock_indexer.call_args.kwargs['use_cache'] is False
+    
+    def test_enhance_command_passes_workers(self, runner, temp_dir, mock_indexer):
+        """Test --workers is forwarded to the enhancer"""
+        mock_indexer.return_value.enhance_metadata.return_value = {}
+        
+        result = runner.invoke(cli, ['enhance', temp_dir, '--workers', '8'])
+        
+        assert result.exit_code == 0
+        assert mock_indexer.return_value.enhance_metadata.call_args.kwargs['workers'] == 8
+        assert runner.invoke(cli, ['enhance', temp_dir, '--workers', '0']).exit_code != 0
+    
+    def test_enhance_command_sorts_distributions(self, runner, temp_dir, mock_indexer):
+        """Test enhance lists each distribution by descending count"""
+        mock_indexer.return_value.enhance_metadata.return_value = {
+            'architectural_layers': {'model': 1, 'service': 5},
+            'business_domains': {'payment': 2},
+        }
+        
+        result = runner.invoke(cli, ['enhance', temp_dir])
+        
+        assert result.exit_code == 0
+        assert result.output.index("service: 5") < result.output.index("model: 1")
+        assert "payment: 2 components" in result.output
+        assert "Criticality Distribution" not in result.output
+    
+    def test_enhanced_command_plain_output(self, runner, temp_dir, mock_indexer):
+        """Test enhanced streams tab-separated rows when output is piped"""
+        mock_indexer.return_value.query_enhanced_nodes.return_value = [
+            {'name': 'a' * 30, 'node_type': 'function', 'architectural_layer': 'service',
+             'complexity_score': 0.5, 'importance_score': 0.25},
+        ]
+        
+        result = runner.invoke(cli, ['enhanced', temp_dir])
+        
+        assert result.exit_code == 0
+        assert "Name\tType\tLayer" in result.output
+        assert "a" * 25 + "...\tfunction\tservice\tgeneral\tnormal\t0.500\t0.250" in result.output
+    
+    def test_critical_command_prints_once(self, runner, temp_dir, mock_indexer):
+        """Test critical renders all component blocks in a single print"""
+        mock_indexer.return_value.get_critical_components.return_value = [
+            {'name': f'comp{i}', 'node_type': 'class', 'path': f'/app/comp{i}.py',
+             'role_tags': ['api'], 'llm_summary': 'x' * 100}
+            for i in range(3)
+        ]
+        
+        with patch.object(console, 'print') as mock_print:
+            result = runner.invoke(cli, ['critical', temp_dir])
+        
+        assert result.exit_code == 0
+        # Header line plus the combined component blocks
+        assert mock_print.call_count == 2
+        output = mock_print.call_args.args[0]
+        assert "3. [bold]comp2[/bold] (class)" in output
+        assert "🏷️ Tags: api" in output
+        assert "x" * 80 + "..." in output
     
     def test_projects_command(self, runner):
         """Test projects command"""
@@ -377,7 +598,136 @@ class TestCLI:
             assert result.exit_code == 0
             assert '/project1' in result.output
             assert '/project2' in result.output
+            mock_instance.list_projects.assert_called_once_with(with_sizes=True)
+    
+    def test_doctor_locates_optional_modules_without_importing(self, runner):
+        """Test doctor only imports critical modules and looks optional ones up"""
+        with patch('importlib.util.find_spec', return_value=None) as mock_find_spec:
+            result = runner.invoke(cli, ['doctor'])
+        
+        assert result.exit_code == 0
+        assert [call.args[0] for call in mock_find_spec.call_args_list] == ['rich', 'networkx', 'ensmallen']
+        assert "⚠️ networkx" in result.output
+    
+    def test_projects_json_output(self, runner):
+        """Test projects --json prints the listed projects as JSON, without tables"""
+        with patch('claude_code_indexer.storage_manager.get_storage_manager') as mock_storage:
+            mock_storage.return_value.list_projects.return_value = [
+                {'name': 'kept', 'path': '/kept', 'db_size': 10, 'exists': True},
+                {'name': 'gone', 'path': '/gone', 'db_size': 20, 'exists': False}
+            ]
+            
+            result = runner.invoke(cli, ['projects', '--json'])
+        
+        assert result.exit_code == 0
+        assert json.loads(result.output) == [{'name': 'kept', 'path': '/kept', 'db_size': 10, 'exists': True}]
+        mock_storage.return_value.get_storage_stats.assert_not_called()
     
+    def test_critical_json_output(self, runner, temp_dir, mock_indexer):
+        """Test critical --json skips the heading and prints only the components"""
+        components = [{'name': 'comp', 'node_type': 'class', 'path': '/app/comp.py', 'complexity_score': 0.5}]
+        mock_indexer.return_value.get_critical_components.return_value = components
+        
+        result = runner.invoke(cli, ['critical', temp_dir, '--json'])
+        
+        assert result.exit_code == 0
+        assert json.loads(result.output) == components
+    
+    def test_format_last_indexed(self):
+        """Test last_indexed formatting for the projects listing"""
+        from claude_code_indexer.cli import _format_last_indexed
+
+        assert _format_last_indexed('2024-01-02T15:30:45.123456') == '2024-01-02 15:30'
+        assert _format_last_indexed('2024-01-01') == '2024-01-01 00:00'
+        assert _format_last_indexed('Never') == 'Never'
+        assert _format_last_indexed(None) is None
+        assert _format_last_indexed('garbage') == 'garbage'
+
+    def test_print_rows_plain_output_handles_none(self, capsys):
+        """Test piped rows are tab-separated and tolerate missing cells"""
+        from claude_code_indexer.cli import print_rows
+
+        print_rows([("Name", "bold"), ("Path", "dim")], iter([("func", None), ("cls", "a.py")]))
+
+        assert capsys.readouterr().out.splitlines() == ["Name\tPath", "func\t", "cls\ta.py"]
+
+    def test_print_rows_plain_on_terminal(self, capsys):
+        """Test plain=True skips the table even when output is a terminal"""
+        from claude_code_indexer.cli import print_rows
+
+        with patch.object(type(console), 'is_terminal', new_callable=PropertyMock, return_value=True), \
+             patch.object(console, 'print') as mock_print:
+            print_rows([("Name", "bold")], [("func",)], plain=True)
+
+        mock_print.assert_not_called()
+        assert capsys.readouterr().out.splitlines() == ["Name", "func"]
+
+    def test_progress_disabled_when_piped(self):
+        """Test the spinner is skipped when output is not a terminal"""
+        from claude_code_indexer.cli import _progress
+
+        with patch.object(type(console), 'is_terminal', new_callable=PropertyMock, return_value=False):
+            assert _progress().disable is True
+        with patch.object(type(console), 'is_terminal', new_callable=PropertyMock, return_value=True):
+            assert _progress().disable is False
+
+    def test_import_defers_optional_modules(self):
+        """Test importing the CLI leaves renderables and helper modules unloaded until used"""
+        import subprocess
+        deferred = ('rich.table', 'rich.panel', 'rich.progress', 'claude_code_indexer.updater',
+                    'claude_code_indexer.security', 'claude_code_indexer.github_reporter',
+                    'claude_code_indexer.commands.enhance')
+        code = ("import sys, claude_code_indexer.cli as cli; "
+                f"print(sorted(m for m in {deferred!r} if m in sys.modules)); "
+                "print(cli.Table.__module__)")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        assert result.stdout.splitlines() == ["[]", "rich.table"]
+
+    def test_command_modules_do_not_import_cli(self):
+        """Test lazily loaded commands share helpers without importing cli (a second copy under -m)"""
+        import subprocess
+        code = ("import sys, claude_code_indexer.commands.enhance; "
+                "print('claude_code_indexer.cli' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        assert result.stdout.splitlines() == ["False"]
+
+    def test_simple_console_strips_markup_without_rich(self):
+        """Test the fallback console removes rich markup tags, combined ones included"""
+        import subprocess
+        code = ("import sys; sys.modules['rich.console'] = None; "
+                "import claude_code_indexer.cli as cli; "
+                "cli.console.print('❌ [bold red]Failed[/bold red] [dim]a[1][/dim]'); cli.console.print()")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        assert result.stdout.splitlines() == ["❌ Failed a[1]", ""]
+
+    def test_indexer_class_resolved_once(self):
+        """Test get_code_graph_indexer returns the resolved class without re-importing"""
+        import claude_code_indexer.cli_common as cli_common
+        
+        resolved = Mock()
+        with patch.object(cli_common, 'CodeGraphIndexer', resolved), \
+             patch.dict('sys.modules', {'claude_code_indexer.indexer': None}):
+            assert cli_common.get_code_graph_indexer() is resolved
+
+    def test_like_search_query_binds_limit(self):
+        """Test the LIKE fallback binds every value, including LIMIT"""
+        from claude_code_indexer.cli import _build_like_search_query
+
+        query, params = _build_like_search_query(('auth', 'user'), 'all', 'function', 5)
+
+        assert 'LIMIT ?' in query
+        assert query.count('name LIKE ?') == 2
+        assert ') AND (' in query
+        assert params == ['%auth%'] * 3 + ['%user%'] * 3 + ['function', 'function', 5]
+        # SQL text depends only on term count and mode, so it is built once per shape
+        assert _build_like_search_query(('a', 'b'), 'all', None, 20)[0] is query
+
     def test_cache_command(self, runner):
         """Test cache command"""
         result = runner.invoke(cli, ['cache'])
@@ -413,7 +763,7 @@ class TestCLI:
         """Test remove command"""
         with patch('claude_code_indexer.storage_manager.get_storage_manager') as mock_storage:
             mock_instance = mock_storage.return_value
-            mock_instance.find_project_by_name.return_value = {
+            mock_instance.find_project.return_value = {
                 'path': '/test/project',
                 'name': 'project'
             }
@@ -422,7 +772,8 @@ class TestCLI:
             result = runner.invoke(cli, ['remove', '/test/project'], input='y\n')
             
             assert result.exit_code == 0
-            # The remove_project will be called with the path from find_project_by_name
+            # The remove_project will be called with the path from find_project
+            mock_instance.find_project.assert_called_once_with('/test/project')
             mock_instance.remove_project.assert_called_once()
     
     def test_background_command(self, runner):
@@ -450,10 +801,13 @@ class TestCLI:
         mock_module.get_background_service.return_value = mock_service
         
         with patch.dict('sys.modules', {'claude_code_indexer.background_service': mock_module}):
-            result = runner.invoke(cli, ['background', 'status'])
+            with patch.object(console, 'print', wraps=console.print) as mock_print:
+                result = runner.invoke(cli, ['background', 'status'])
             
             assert result.exit_code == 0
             assert 'enabled' in result.output.lower()
+            # Two header lines plus one render for the status block and project table
+            assert mock_print.call_count == 3
     
     def test_mcp_command(self, runner):
         """Test mcp command group"""
@@ -495,7 +849,7 @@ class TestCLI:
     
     def test_update_command(self, runner):
         """Test update command"""
-        with patch('claude_code_indexer.cli.Updater') as mock_updater:
+        with patch('claude_code_indexer.updater.Updater') as mock_updater:
             mock_instance = Mock()
             mock_updater.return_value = mock_instance
             mock_instance.auto_update.return_value = True
@@ -525,7 +879,7 @@ class TestCLI:
             assert result.exit_code != 0
             
             # Test security error
-            with patch('claude_code_indexer.cli.validate_file_path') as mock_validate:
+            with patch('claude_code_indexer.security.validate_file_path') as mock_validate:
                 mock_validate.side_effect = SecurityError("Invalid path")
                 
                 result = runner.invoke(cli, ['index', '../../../etc/passwd'])
@@ -646,7 +1000,7 @@ Content""")
             
             assert result.exit_code == 0
             assert "Cache cleared" in result.output
-            mock_instance.clear_cache.assert_called_once_with(older_than_days=7)
+            mock_instance.clear_cache.assert_called_once_with(older_than_days=7, max_size_mb=None)
 
     def test_benchmark_with_custom_records(self, runner):
         """Test benchmark command with custom record count"""
@@ -661,25 +1015,17 @@ Content""")
 
     def test_update_check_only(self, runner):
         """Test update command with check-only flag"""
-        # Mock the Updater that's imported dynamically as a module global
+        # Updater is imported from the updater module when the command runs
         mock_updater_class = Mock()
         mock_instance = Mock()
         mock_updater_class.return_value = mock_instance
         mock_instance.auto_update.return_value = True
         
-        # Replace the Updater global in the cli module
-        import claude_code_indexer.cli as cli_module
-        original_updater = cli_module.Updater
-        cli_module.Updater = mock_updater_class
-        
-        try:
+        with patch('claude_code_indexer.updater.Updater', mock_updater_class):
             result = runner.invoke(cli, ['update', '--check-only'])
             
             assert result.exit_code == 0
             mock_instance.auto_update.assert_called_once_with(check_only=True)
-        finally:
-            # Restore original
-            cli_module.Updater = original_updater
 
     def test_search_command_with_mode_and_type_filters(self, runner, temp_dir):
         """Test search command with different modes and type filters"""
@@ -701,6 +1047,9 @@ Content""")
                     result = runner.invoke(cli, ['search', 'test', 'function', '--mode', 'all', '--type', 'function'])
                     
                     assert result.exit_code == 0
+                    db_uri = mock_conn.call_args[0][0]
+                    assert db_uri.startswith('file:') and db_uri.endswith('?mode=ro')
+                    assert mock_conn.call_args[1] == {'uri': True}
 
     def test_projects_command_list_and_operations(self, runner, temp_dir):
         """Test projects command list and add/remove operations"""
@@ -730,7 +1079,7 @@ Content""")
             with patch('os.path.exists') as mock_exists:
                 mock_exists.return_value = True
                 
-                with patch('claude_code_indexer.cli.CodeGraphIndexer') as mock_indexer_class:
+                with patch('claude_code_indexer.cli_common.CodeGraphIndexer') as mock_indexer_class:
                     mock_indexer = Mock()
                     mock_indexer.query_important_nodes.return_value = []
                     mock_indexer_class.return_value = mock_indexer
@@ -761,5 +1110,107 @@ Content""")
                 assert "*.pyc" in result.output or len(result.output) > 0
 
 
+    def test_index_show_ignored_keeps_brackets(self, runner, temp_dir, mock_indexer):
+        """Test ignore globs are listed verbatim, not parsed as markup"""
+        mock_indexer.return_value.parsing_errors = []
+        
+        with patch('claude_code_indexer.ignore_handler.IgnoreHandler') as mock_ignore:
+            mock_ignore.return_value.get_patterns.return_value = ['*.py[cod]', '[bold]x']
+            result = runner.invoke(cli, ['index', temp_dir, '--show-ignored'])
+        
+        assert result.exit_code == 0
+        assert "  • *.py[cod]\n  • [bold]x" in result.output
+
+    def test_main_refreshes_update_cache_in_background(self):
+        """Test main() never queries PyPI in-process"""
+        import claude_code_indexer.cli as cli_module
+
+        fake_check = Mock()
+
+        with patch.object(sys, 'argv', ['cci', 'stats']), \
+             patch('claude_code_indexer.updater.check_and_notify_update', fake_check), \
+             patch.object(cli_module, 'install_crash_handler'), \
+             patch.object(cli_module, 'cli', Mock()) as mock_cli:
+            cli_module.main()
+
+        mock_cli.assert_called_once()
+        fake_check.assert_called_once_with(refresh_in_background=True)
+
+    def test_crash_handler_built_on_first_crash(self):
+        """Test the crash handler is only constructed when an exception escapes"""
+        import claude_code_indexer.cli as cli_module
+        
+        original_hook = Mock()
+        with patch.object(sys, 'excepthook', original_hook), \
+             patch.dict(os.environ, {'CCI_CRASH_HANDLER': '1'}), \
+             patch('claude_code_indexer.crash_handler.CrashHandler') as mock_handler:
+            cli_module.install_crash_handler()
+            mock_handler.assert_not_called()
+            
+            error = ValueError("boom")
+            sys.excepthook(ValueError, error, None)
+        
+        mock_handler.assert_called_once_with(original_excepthook=original_hook)
+        mock_handler.return_value.handle_crash.assert_called_once_with(ValueError, error, None)
+    
+    def test_crash_handler_disabled_by_env(self):
+        """Test CCI_CRASH_HANDLER=0 leaves the default excepthook in place"""
+        import claude_code_indexer.cli as cli_module
+        
+        original_hook = Mock()
+        with patch.object(sys, 'excepthook', original_hook), \
+             patch.dict(os.environ, {'CCI_CRASH_HANDLER': '0'}):
+            cli_module.install_crash_handler()
+            
+            assert sys.excepthook is original_hook
+    
+    @pytest.mark.parametrize("env_value, frozen", [('1', True), ('0', False)])
+    def test_main_freezes_gc_before_running(self, env_value, frozen):
+        """Test main() freezes startup objects unless CCI_GC_FREEZE=0"""
+        import claude_code_indexer.cli as cli_module
+        
+        with patch.object(sys, 'argv', ['cci', '--version']), \
+             patch.dict(os.environ, {'CCI_GC_FREEZE': env_value}), \
+             patch('gc.freeze') as mock_freeze, \
+             patch.object(cli_module, 'install_crash_handler'), \
+             patch.object(cli_module, 'cli', Mock()):
+            cli_module.main()
+        
+        assert mock_freeze.called is frozen
+    
+    @pytest.mark.parametrize("argv", [[], ['--help'], ['index', '--help'], ['--version'], ['llm-guide']])
+    def test_main_skips_update_check_for_static_output(self, argv):
+        """Test help, version and llm-guide never start the update check"""
+        import claude_code_indexer.cli as cli_module
+        
+        fake_check = Mock()
+        
+        with patch.object(sys, 'argv', ['cci'] + argv), \
+             patch('claude_code_indexer.updater.check_and_notify_update', fake_check), \
+             patch.object(cli_module, 'install_crash_handler'), \
+             patch.object(cli_module, 'cli', Mock()):
+            cli_module.main()
+        
+        fake_check.assert_not_called()
+    
+    @pytest.mark.parametrize("has_pyproject", [True, False])
+    def test_main_adds_checkout_root_to_path(self, tmp_path, has_pyproject):
+        """Test the development checkout root is put on sys.path only if it has a pyproject.toml"""
+        import claude_code_indexer.cli as cli_module
+        
+        if has_pyproject:
+            (tmp_path / 'pyproject.toml').write_text("")
+        
+        with patch.object(sys, 'argv', ['cci', '--version']), \
+             patch.object(sys, 'path', list(sys.path)), \
+             patch.object(cli_module, '_PROJECT_ROOT', str(tmp_path)), \
+             patch.object(cli_module, 'install_crash_handler'), \
+             patch.object(cli_module, 'cli', Mock()):
+            cli_module.main()
+            added = sys.path[0] == str(tmp_path)
+        
+        assert added is has_pyproject
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
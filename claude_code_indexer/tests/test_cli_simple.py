@@ -138,6 +138,20 @@ class TestCommandExistence:
         for cmd_name in advanced_commands:
             assert cmd_name in cli.commands, f"Advanced command '{cmd_name}' missing"
     
+    def test_lazy_commands_resolve_on_lookup(self):
+        """Test lazily registered commands are listed and load when invoked"""
+        from click.testing import CliRunner
+        from claude_code_indexer.cli import cli
+        
+        runner = CliRunner()
+        for args in (['migrate', '--help'], ['crash', '--help'], ['mcp-daemon', 'status', '--help']):
+            result = runner.invoke(cli, args)
+            assert result.exit_code == 0, result.output
+        
+        help_result = runner.invoke(cli, ['--help'])
+        assert 'migrate' in help_result.output
+        assert 'crash' in help_result.output
+    
     def test_cli_command_count(self):
         """Test CLI has reasonable number of commands"""
         from claude_code_indexer.cli import cli
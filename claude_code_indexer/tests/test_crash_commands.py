@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test cases for the crash management commands
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+import subprocess
+import sys
+from pathlib import Path
+from click.testing import CliRunner
+
+from claude_code_indexer.commands.crash import crash
+
+
+class TestCrashCommands:
+    """Test crash list/clean/recover against a temp crash directory"""
+
+    @pytest.fixture
+    def crash_dir(self, tmp_path):
+        """Patch CrashHandler so commands read crash reports from a temp directory"""
+        with patch('claude_code_indexer.crash_handler.CrashHandler') as mock_handler:
+            mock_handler.return_value.crash_dir = tmp_path
+            yield tmp_path
+
+    def _write_crash(self, crash_dir, timestamp, suffix="1"):
+        crash_id = f"crash_{timestamp}_{suffix}"
+        crash_data = {
+            'crash_id': crash_id, 'timestamp': timestamp, 'error_type': 'ValueError',
+            'error_message': 'boom', 'command': 'cci index .', 'traceback': 'Traceback...'
+        }
+        (crash_dir / f"{crash_id}.json").write_text(json.dumps(crash_data))
+        return crash_id
+
+    def test_list_counts_all_and_shows_newest(self, crash_dir):
+        """Test list shows the newest N and reports the full total"""
+        for day in range(1, 4):
+            self._write_crash(crash_dir, f"2024010{day}_120000")
+        (crash_dir / "notes.txt").write_text("not a crash")
+
+        result = CliRunner().invoke(crash, ['list', '--last', '2'])
+
+        assert result.exit_code == 0
+        assert "Showing 2 of 3 total crashes" in result.output
+        assert "2024-01-03" in result.output
+        assert "2024-01-01" not in result.output
+
+    def test_clean_older_than_keeps_recent(self, crash_dir):
+        """Test clean --older-than only removes reports past the cutoff"""
+        old = self._write_crash(crash_dir, "20000101_000000")
+        recent = self._write_crash(crash_dir, "29991231_235959")
+        (crash_dir / "crash_legacy.json").write_text("{}")
+
+        result = CliRunner().invoke(crash, ['clean', '--older-than', '30'])
+
+        assert result.exit_code == 0
+        assert "Deleted 1 crash reports" in result.output
+        assert not (crash_dir / f"{old}.json").exists()
+        assert (crash_dir / f"{recent}.json").exists()
+        assert (crash_dir / "crash_legacy.json").exists()
+
+    def test_recover_uses_most_recent_crash(self, crash_dir):
+        """Test recover reports the newest crash"""
+        self._write_crash(crash_dir, "20240101_120000")
+        newest = self._write_crash(crash_dir, "20240102_120000")
+
+        result = CliRunner().invoke(crash, ['recover'], input="n\n")
+
+        assert result.exit_code == 0
+        assert newest in result.output
+
+    def test_find_crash_by_full_id_partial_id_and_suffix(self, crash_dir):
+        """Test full IDs resolve directly and partial IDs match the newest report"""
+        from claude_code_indexer.commands.crash import _find_crash
+        older = self._write_crash(crash_dir, "20240101_120000", suffix="42")
+        newer = self._write_crash(crash_dir, "20240102_120000", suffix="42")
+
+        assert _find_crash(crash_dir, older) == crash_dir / f"{older}.json"
+        assert _find_crash(crash_dir, older[len("crash_"):]) == crash_dir / f"{older}.json"
+        assert _find_crash(crash_dir, "_42") == crash_dir / f"{newer}.json"
+        assert _find_crash(crash_dir, "../missing") is None
+
+    def test_report_looks_up_crash(self, crash_dir):
+        """Test report passes the matching crash data to the handler"""
+        crash_id = self._write_crash(crash_dir, "20240101_120000")
+
+        with patch('claude_code_indexer.crash_handler.CrashHandler') as mock_handler:
+            mock_handler.return_value.crash_dir = crash_dir
+            result = CliRunner().invoke(crash, ['report', crash_id])
+
+        assert result.exit_code == 0
+        crash_data = mock_handler.return_value.create_github_issue.call_args.args[0]
+        assert crash_data['crash_id'] == crash_id
+
+    def test_import_defers_crash_handler_and_renderables(self):
+        """Test loading the crash group leaves prompts, panels and the reporter unimported"""
+        deferred = ('rich.table', 'rich.panel', 'rich.prompt', 'claude_code_indexer.crash_handler',
+                    'claude_code_indexer.github_reporter')
+        code = ("import sys, claude_code_indexer.commands.crash; "
+                f"print(sorted(m for m in {deferred!r} if m in sys.modules))")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent.parent)
+
+        assert result.stdout.splitlines() == ["[]"]
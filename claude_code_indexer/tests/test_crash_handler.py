@@ -43,6 +43,14 @@ class TestCrashHandler:
                 assert handler._original_excepthook == sys.excepthook
                 assert handler._crash_id is None
     
+    def test_init_with_original_excepthook(self, temp_crash_dir):
+        """Test a caller-supplied hook is used instead of the current sys.excepthook"""
+        original_hook = Mock()
+        with patch('pathlib.Path.home', return_value=temp_crash_dir):
+            handler = CrashHandler(original_excepthook=original_hook)
+        
+        assert handler._original_excepthook is original_hook
+    
     def test_init_creates_crash_directory(self, temp_crash_dir):
         """Test that initialization creates crash directory"""
         with patch('pathlib.Path.home', return_value=temp_crash_dir):
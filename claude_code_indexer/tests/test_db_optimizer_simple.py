@@ -95,6 +95,19 @@ class TestOptimizedDatabaseSimple:
             count = cursor.fetchone()[0]
             assert count >= 0  # Should have some data
     
+    def test_execute_many_inserts_all_rows(self):
+        """Test execute_many inserts every row in one transaction"""
+        rows = [(f"test{i}", i) for i in range(50)]
+        
+        assert self.optimizer.execute_many(
+            "INSERT INTO test_table (name, value) VALUES (?, ?)", rows
+        ) is True
+        
+        with self.optimizer.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*), SUM(value) FROM test_table")
+            assert tuple(cursor.fetchone()) == (50, sum(range(50)))
+    
     def test_close_all_connections(self):
         """Test closing all connections"""
         # Create some connections first
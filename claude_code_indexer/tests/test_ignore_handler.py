@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test cases for IgnoreHandler
+"""
+
+import pytest
+
+from claude_code_indexer.ignore_handler import IgnoreHandler
+
+
+class TestIgnoreHandler:
+    """Test ignore pattern matching"""
+
+    @pytest.fixture
+    def handler(self, tmp_path):
+        """Create a handler with a .gitignore and custom patterns"""
+        (tmp_path / ".gitignore").write_text("# comment\nsecret.txt\n/rootonly\ndocs/*.md\n")
+        return IgnoreHandler(str(tmp_path), custom_patterns=["custom_dir/"])
+
+    def test_patterns_are_combined(self, handler):
+        """Test every pattern is folded into a single compiled regex"""
+        assert handler._combined_regex is not None
+        assert len(handler.regex_patterns) == len(handler.ignore_patterns)
+
+    @pytest.mark.parametrize("relative_path", [
+        "node_modules/pkg/index.js",
+        "src/__pycache__/mod.pyc",
+        "secret.txt",
+        "src/secret.txt",
+        "rootonly",
+        "docs/readme.md",
+        "src/custom_dir/file.py",
+    ])
+    def test_ignored_paths(self, handler, tmp_path, relative_path):
+        """Test defaults, .gitignore and custom patterns are applied"""
+        assert handler.should_ignore(str(tmp_path / relative_path))
+
+    @pytest.mark.parametrize("relative_path", [
+        "src/main.py",
+        "src/rootonly/main.py",
+        "docs/guide/intro.txt",
+    ])
+    def test_kept_paths(self, handler, tmp_path, relative_path):
+        """Test regular source files are not ignored"""
+        assert not handler.should_ignore(str(tmp_path / relative_path))
+
+    def test_filter_files(self, handler, tmp_path):
+        """Test filter_files drops only ignored paths"""
+        files = [str(tmp_path / "app.py"), str(tmp_path / "build" / "app.py")]
+
+        assert handler.filter_files(files) == [files[0]]
@@ -147,6 +147,18 @@ module.exports = { greet, Math };
             
             conn.close()
     
+    def test_database_uses_wal_journal(self, temp_dir):
+        """Test the index database is switched to WAL so readers don't block"""
+        db_path = str(Path(temp_dir) / "test.db")
+        
+        with patch('claude_code_indexer.indexer.get_storage_manager') as mock_storage:
+            mock_storage.return_value.get_project_from_cwd.return_value = Path(temp_dir)
+            CodeGraphIndexer(db_path=db_path)
+        
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+    
     def test_create_node(self, temp_dir):
         """Test creating nodes in the graph"""
         with patch('claude_code_indexer.indexer.get_storage_manager') as mock_storage:
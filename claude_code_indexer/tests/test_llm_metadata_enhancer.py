@@ -291,6 +291,31 @@ class TestLLMMetadataEnhancer:
         nodes = self.enhancer.get_enhanced_nodes(min_complexity=0.6)
         assert len(nodes) == 1
         assert nodes[0]['complexity_score'] >= 0.6
+        
+        # Limit is bound as a parameter
+        nodes = self.enhancer.get_enhanced_nodes(limit=1)
+        assert len(nodes) == 1
+        assert nodes[0]['role_tags'] == ['api_endpoint']
+    
+    def test_criticality_filter_uses_index(self):
+        """Test the critical-components filter is served by an index"""
+        with sqlite3.connect(self.db_path) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT node_id FROM enhanced_metadata WHERE criticality_level = ?",
+                ('critical',)
+            ).fetchall()
+        
+        assert any('idx_enhanced_metadata_criticality' in row[-1] for row in plan)
+    
+    def test_domain_filter_uses_index(self):
+        """Test query-enhanced --domain is served by an index"""
+        with sqlite3.connect(self.db_path) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT node_id FROM enhanced_metadata WHERE business_domain = ?",
+                ('payment',)
+            ).fetchall()
+        
+        assert any('idx_enhanced_metadata_domain' in row[-1] for row in plan)
     
     def test_update_node_metadata(self):
         """Test updating node metadata"""
@@ -387,6 +412,43 @@ class TestLLMMetadataEnhancer:
         assert result.architectural_layer in ['controller', 'service', 'model', 'utility', 'infrastructure', 'test']
         assert result.criticality_level in ['critical', 'important', 'normal', 'low']
     
+    def test_analyze_codebase_saves_in_one_transaction(self):
+        """Test concurrent analysis reports progress and writes results together"""
+        progress = []
+        
+        with patch.object(self.enhancer, '_save_analysis_results',
+                          wraps=self.enhancer._save_analysis_results) as mock_save:
+            summary = self.enhancer.analyze_codebase(
+                max_workers=2, progress_callback=lambda done, total: progress.append((done, total))
+            )
+        
+        assert summary['analyzed_count'] == 5
+        assert progress == [(i, 5) for i in range(1, 6)]
+        mock_save.assert_called_once()
+        assert len(self.enhancer.get_enhanced_nodes()) == 5
+    
+    def test_analyze_codebase_gives_up_on_stuck_nodes(self):
+        """Test a node that never finishes is logged and skipped instead of hanging"""
+        import threading
+        release = threading.Event()
+        build = self.enhancer._build_enhanced_metadata
+        
+        def build_or_hang(node_data):
+            if node_data[2] == 'PaymentProcessor':
+                release.wait()
+            return build(node_data)
+        
+        try:
+            with patch.object(self.enhancer, '_build_enhanced_metadata', side_effect=build_or_hang), \
+                 patch('claude_code_indexer.llm_metadata_enhancer.NODE_ANALYSIS_TIMEOUT', 0.5), \
+                 patch('claude_code_indexer.llm_metadata_enhancer.log_warning') as mock_warning:
+                summary = self.enhancer.analyze_codebase(max_workers=2)
+        finally:
+            release.set()
+        
+        assert summary['analyzed_count'] == 4
+        assert 'PaymentProcessor' in mock_warning.call_args.args[0]
+    
     def test_get_analysis_insights(self):
         """Test comprehensive analysis insights"""
         # Add enhanced metadata for insights
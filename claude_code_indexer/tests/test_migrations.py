@@ -14,6 +14,7 @@ from claude_code_indexer.migrations.versions.migration_003_v1_6_0 import Migrati
 from claude_code_indexer.migrations.versions.migration_004_v1_14_0 import MigrationV1_14_0
 from claude_code_indexer.migrations.versions.migration_005_v1_15_0 import MigrationV1_15_0
 from claude_code_indexer.migrations.versions.migration_006_v1_16_0 import MigrationV1_16_0
+from claude_code_indexer.migrations.versions.migration_007_v1_24_0 import MigrationV1_24_0
 
 
 class TestMigrationManager:
@@ -427,4 +428,37 @@ class TestMigrationManager:
         results = cursor.fetchall()
         assert len(results) > 0
         
-        conn.close()
\ No newline at end of file
+        conn.close()
+
+    def test_migrate_to_v1_24_0(self, migration_manager, temp_db):
+        """Test migration to v1.24.0 adds the type-filtered ranking index."""
+        self.create_legacy_v1_0_0_db(temp_db)
+        
+        success, message = migration_manager.migrate('1.24.0')
+        assert success
+        
+        conn = sqlite3.connect(temp_db)
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA index_list(code_nodes)")
+        indexes = {row[1] for row in cursor.fetchall()}
+        assert 'idx_code_nodes_type_score' in indexes
+        
+        # Filtered top-N is served in index order, without a temp sort
+        cursor.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT name FROM code_nodes WHERE node_type = ?
+            ORDER BY importance_score DESC LIMIT 10
+        """, ('function',))
+        plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+        assert 'idx_code_nodes_type_score' in plan
+        assert 'TEMP B-TREE' not in plan
+        
+        conn.close()
+        
+        # Rollback removes it again
+        conn = sqlite3.connect(temp_db)
+        MigrationV1_24_0().down(conn)
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA index_list(code_nodes)")
+        assert 'idx_code_nodes_type_score' not in {row[1] for row in cursor.fetchall()}
+        conn.close()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Test cases for StorageManager
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from claude_code_indexer.storage_manager import StorageManager
+
+
+class TestStorageManager:
+    """Test centralized project storage"""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        """Create a storage manager rooted in a temp directory"""
+        return StorageManager(app_home=tmp_path / "app_home")
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create a project directory to register"""
+        project_path = tmp_path / "my_project"
+        project_path.mkdir()
+        return project_path
+
+    def test_list_projects_reports_total_size(self, storage, project):
+        """Test list_projects includes db and cache sizes"""
+        storage.get_database_path(project).write_bytes(b"x" * 100)
+        (storage.get_cache_dir(project) / "cache.db").write_bytes(b"x" * 50)
+
+        projects = storage.list_projects(with_sizes=True)
+
+        assert len(projects) == 1
+        assert projects[0]['db_size'] == 100
+        assert projects[0]['total_size'] == 150
+
+    def test_storage_stats_precomputed_matches_walk(self, storage, project):
+        """Test precomputed totals give the same stats as a full walk"""
+        storage.get_database_path(project).write_bytes(b"x" * 2048)
+        # Storage left behind without a registered project still counts
+        orphan = storage.projects_dir / "orphan"
+        orphan.mkdir()
+        (orphan / "code_index.db").write_bytes(b"x" * 512)
+
+        projects = storage.list_projects(with_sizes=True)
+        precomputed = {'total_size': sum(p['total_size'] for p in projects)}
+
+        assert storage.get_storage_stats(precomputed=precomputed) == storage.get_storage_stats()
+
+    def test_find_project_by_name_or_path(self, storage, project):
+        """Test find_project resolves both names and paths"""
+        storage.get_project_dir(project)
+
+        by_name = storage.find_project("my_project")
+        by_path = storage.find_project(str(project))
+
+        assert by_name['id'] == by_path['id'] == storage.get_project_id(project)
+        assert by_path['path'] == str(project.resolve())
+        assert storage.find_project(str(project.parent / "missing")) is None
+
+    def test_batch_update_saves_metadata_once(self, storage, tmp_path):
+        """Test batch_update defers metadata writes until the block exits"""
+        for name in ("gone_a", "gone_b"):
+            path = tmp_path / name
+            path.mkdir()
+            storage.get_project_dir(path)
+            path.rmdir()
+
+        with patch('claude_code_indexer.storage_manager.ORJSON_AVAILABLE', False), \
+             patch('claude_code_indexer.storage_manager.json.dump', wraps=json.dump) as mock_dump:
+            removed = storage.clean_orphaned_projects()
+
+        assert len(removed) == 2
+        assert mock_dump.call_count == 1
+        assert storage.metadata['projects'] == {}
+
+    def test_find_project_skips_resolve_for_absolute_paths(self, storage, project):
+        """Test path lookups only resolve symlinks when abspath misses"""
+        storage.get_project_dir(project)
+        path = str(project.resolve())
+
+        # Trailing '/.' defeats the name/substring match so the path branch runs
+        with patch('claude_code_indexer.storage_manager.Path.resolve') as mock_resolve:
+            project_info = storage.find_project(path + "/.")
+
+        assert project_info['path'] == path
+        mock_resolve.assert_not_called()
+
+    def test_find_project_by_name_prefers_exact_match(self, storage, tmp_path):
+        """Test exact names win over earlier partial matches"""
+        for name in ("myapp", "app"):
+            path = tmp_path / name
+            path.mkdir()
+            storage.get_project_dir(path)
+
+        assert storage.find_project_by_name("APP")['name'] == "app"
+        assert storage.find_project_by_name("my")['name'] == "myapp"
+
+        storage.remove_project(tmp_path / "app")
+        assert storage.find_project_by_name("app")['name'] == "myapp"
+
+    def test_find_project_prefers_exact_path(self, storage, tmp_path):
+        """Test an exact path beats an earlier project whose path contains it"""
+        for name in ("proj2", "proj"):
+            path = tmp_path / name
+            path.mkdir()
+            storage.get_project_dir(path)
+
+        project_info = storage.find_project(str(tmp_path / "proj"))
+
+        assert project_info['name'] == "proj"
+
+    def test_remove_project_with_known_id(self, storage, project):
+        """Test remove_project uses a supplied project ID without resolving"""
+        storage.get_project_dir(project)
+        project_info = storage.find_project("my_project")
+
+        with patch('claude_code_indexer.storage_manager.Path.resolve') as mock_resolve:
+            assert storage.remove_project(project_info['path'], project_id=project_info['id'])
+
+        mock_resolve.assert_not_called()
+        assert storage.find_project("my_project") is None
+
+    def test_storage_stats_cached_until_metadata_changes(self, storage, project):
+        """Test the directory walk is skipped while projects.json is unchanged"""
+        storage.get_database_path(project).write_bytes(b"x" * 100)
+        first = storage.get_storage_stats()
+
+        with patch('claude_code_indexer.storage_manager._dir_size') as mock_size:
+            assert storage.get_storage_stats() == first
+            mock_size.assert_not_called()
+
+        storage.get_database_path(project).write_bytes(b"x" * 300)
+        storage.update_project_stats(project, {})
+        os.utime(storage.metadata_file, ns=(0, 0))
+
+        assert storage.get_storage_stats()['total_size'] == 300
+
+    def test_database_path_without_create(self, storage, project):
+        """Test create=False computes the path without registering the project"""
+        db_path = storage.get_database_path(project, create=False)
+
+        assert not db_path.parent.exists()
+        assert storage.metadata['projects'] == {}
+        assert storage.get_database_path(project) == db_path
+    
+    def test_list_projects_skips_size_walk_by_default(self, storage, project):
+        """Test only callers asking for sizes pay for the directory walk"""
+        storage.get_database_path(project).write_bytes(b"x" * 100)
+        
+        with patch('claude_code_indexer.storage_manager._dir_size') as mock_size:
+            projects = storage.list_projects()
+            mock_size.assert_not_called()
+        
+        assert projects[0]['db_size'] == 100
+        assert 'total_size' not in projects[0]
+    
+    def test_existing_paths_lists_shared_parent_once(self, storage, tmp_path):
+        """Test sibling projects are checked with one directory listing"""
+        for name in ("one", "two", "three"):
+            path = tmp_path / name
+            path.mkdir()
+            storage.get_project_dir(path)
+        (tmp_path / "two").rmdir()
+        (tmp_path / "three").rmdir()
+        (tmp_path / "three").symlink_to(tmp_path / "missing")
+        
+        with patch('claude_code_indexer.storage_manager.os.scandir', wraps=os.scandir) as mock_scandir:
+            removed = storage.clean_orphaned_projects()
+        
+        assert sorted(removed) == [str(tmp_path.resolve() / name) for name in ("three", "two")]
+        # Other scandir calls come from rmtree removing the orphans' storage
+        listed = [call.args[0] for call in mock_scandir.call_args_list]
+        assert listed.count(str(tmp_path.resolve())) == 1
+        assert [p['name'] for p in storage.list_projects()] == ["one"]
+    
+    def test_existing_paths_confirms_listing_misses(self, storage, tmp_path):
+        """Test a stored path whose case differs from the listing isn't treated as orphaned"""
+        for name in ("One", "two"):
+            path = tmp_path / name
+            path.mkdir()
+            storage.get_project_dir(path)
+        project_id = storage.get_project_id(tmp_path / "One")
+        stored_path = str(tmp_path.resolve() / "one")
+        storage.metadata['projects'][project_id]['path'] = stored_path
+        
+        # Simulate a case-insensitive filesystem for the mis-cased path
+        real_exists = os.path.exists
+        with patch('claude_code_indexer.storage_manager.os.path.exists',
+                   side_effect=lambda path: path == stored_path or real_exists(path)):
+            assert storage.clean_orphaned_projects() == []
+            assert all(project['exists'] for project in storage.list_projects())
+    
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_metadata_round_trip(self, tmp_path, use_orjson):
+        """Test projects.json survives a save/load cycle with either JSON backend"""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        project = tmp_path / "prøject"
+        project.mkdir()
+        
+        with patch('claude_code_indexer.storage_manager.ORJSON_AVAILABLE', use_orjson):
+            storage = StorageManager(app_home=tmp_path / "app_home")
+            storage.get_project_dir(project)
+            reloaded = StorageManager(app_home=tmp_path / "app_home")
+        
+        assert reloaded.metadata == storage.metadata
+        assert reloaded.find_project_by_name("prøject")['path'] == str(project.resolve())
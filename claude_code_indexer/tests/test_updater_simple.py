@@ -119,8 +119,10 @@ class TestUpdaterSimple:
             # Should return boolean or handle gracefully
             assert isinstance(result, bool)
     
-    def test_sync_claude_md_with_force(self):
+    def test_sync_claude_md_with_force(self, tmp_path, monkeypatch):
         """Test CLAUDE.md sync with force parameter"""
+        # force=True writes CLAUDE.md into the cwd; keep it out of the checkout
+        monkeypatch.chdir(tmp_path)
         result = self.updater.sync_claude_md(force=True)
         
         # Should return boolean
@@ -235,7 +237,80 @@ class TestUpdaterSimple:
             
             # Verify timeout parameter was used
             mock_get.assert_called_with(self.updater.PYPI_URL, timeout=5)
+    
+    @pytest.fixture
+    def update_cache_file(self, tmp_path):
+        """Point the update-check cache at a temp file instead of the real home"""
+        cache_file = tmp_path / "update_check.json"
+        with patch('claude_code_indexer.updater._update_check_cache_file', return_value=cache_file):
+            yield cache_file
+    
+    @patch('requests.get')
+    def test_check_and_notify_update_uses_cached_version(self, mock_get, update_cache_file):
+        """Test check_and_notify_update only hits PyPI when the cache is stale"""
+        from claude_code_indexer.updater import check_and_notify_update
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"info": {"version": "0.0.1"}}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        check_and_notify_update()
+        check_and_notify_update()
+        
+        mock_get.assert_called_once()
+        assert update_cache_file.exists()
+
+    
+    @patch('claude_code_indexer.updater.subprocess.Popen')
+    @patch('requests.get')
+    def test_check_and_notify_update_refreshes_in_background(self, mock_get, mock_popen, update_cache_file):
+        """Test a stale cache is refreshed once by a detached child process"""
+        from claude_code_indexer.updater import check_and_notify_update
+        
+        check_and_notify_update(refresh_in_background=True)
+        # The child hasn't written a result yet; this must not spawn another
+        check_and_notify_update(refresh_in_background=True)
+        
+        mock_get.assert_not_called()
+        mock_popen.assert_called_once()
+        args, kwargs = mock_popen.call_args
+        assert args[0][1:] == ["-m", "claude_code_indexer.updater"]
+        assert kwargs['start_new_session'] is True
+    
+    @patch('claude_code_indexer.updater.subprocess.Popen')
+    @patch('requests.get')
+    def test_failed_refresh_is_not_retried_until_ttl(self, mock_get, mock_popen, update_cache_file):
+        """Test an offline lookup is cached so later commands neither retry nor respawn"""
+        from claude_code_indexer.updater import check_and_notify_update, refresh_update_cache
+        
+        mock_get.side_effect = Exception("Network error")
+        
+        # What the detached child runs
+        with pytest.raises(Exception):
+            refresh_update_cache()
+        
+        check_and_notify_update(refresh_in_background=True)
+        check_and_notify_update()
+        
+        assert mock_get.call_count == 1
+        mock_popen.assert_not_called()
+    
+    @patch('requests.get')
+    def test_failed_refresh_retried_after_ttl(self, mock_get, update_cache_file):
+        """Test a cached failure expires like any other lookup"""
+        import os
+        from claude_code_indexer.updater import check_and_notify_update, UPDATE_CHECK_TTL
+        
+        mock_get.side_effect = Exception("Network error")
+        check_and_notify_update()
+        
+        expired = update_cache_file.stat().st_mtime - UPDATE_CHECK_TTL - 1
+        os.utime(update_cache_file, (expired, expired))
+        check_and_notify_update()
+        
+        assert mock_get.call_count == 2
 
 
 if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
\ No newline at end of file
+    pytest.main([__file__, '-v'])